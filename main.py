@@ -115,7 +115,6 @@ class SportsTicker:
         try:
             from src.utils.config import ConfigManager
             self.config = ConfigManager()
-            self.config.load()
             print(f"Config loaded: {len(self.config.get('teams', []))} teams configured")
             return True
         except Exception as e:
@@ -342,6 +341,8 @@ class SportsTicker:
                     self.web_server.handle_request()
 
                 # Periodic maintenance
+                if self.config:
+                    self.config.flush_if_needed()
                 self.check_wifi()
                 self.mark_boot_successful()
 
@@ -365,6 +366,14 @@ class SportsTicker:
         if self.web_server:
             self.web_server.stop()
 
+        # Write out any settings still waiting on the save debounce
+        if self.config:
+            self.config.save()
+
+        # Write out log lines still held in the file buffer
+        from src.utils.logger import flush_logs
+        flush_logs()
+
         if self.display:
             self.display.clear()
             # Stop background refresh thread
@@ -15,6 +15,18 @@ Usage:
 import time
 import gc
 
+# Insertion-ordered store for LRU eviction; plain MicroPython dicts
+# don't keep order
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ucollections import OrderedDict
+
+try:
+    import heapq
+except ImportError:
+    import uheapq as heapq
+
 
 class Cache:
     """Simple in-memory cache with TTL support."""
@@ -29,7 +41,8 @@ class Cache:
         """
         self.ttl = ttl
         self.max_items = max_items
-        self._cache = {}
+        # Least recently used first; hits and writes move a key to the end
+        self._cache = OrderedDict()
 
     def get(self, key):
         """
@@ -41,17 +54,17 @@ class Cache:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
+        cache = self._cache
+        item = cache.pop(key, None)
+        if item is None:
             return None
 
-        item = self._cache[key]
-        expires = item.get('expires', 0)
-
-        # Check if expired
-        if time.time() > expires:
-            del self._cache[key]
+        # Check if expired; it stays removed if so
+        if time.time() > item.get('expires', 0):
             return None
 
+        # Re-insert as most recently used
+        cache[key] = item
         return item.get('value')
 
     def set(self, key, value, ttl=None):
@@ -63,16 +76,19 @@ class Cache:
             value: Value to store
             ttl: Optional TTL override
         """
-        # Enforce max items
-        if len(self._cache) >= self.max_items and key not in self._cache:
+        cache = self._cache
+        if key in cache:
+            # Re-inserted below as most recently used
+            del cache[key]
+        elif len(cache) >= self.max_items:
+            # Enforce max items
             self._evict_oldest()
 
         item_ttl = ttl if ttl is not None else self.ttl
 
-        self._cache[key] = {
+        cache[key] = {
             'value': value,
             'expires': time.time() + item_ttl,
-            'created': time.time()
         }
 
     def delete(self, key):
@@ -90,21 +106,9 @@ class Cache:
         return self.get(key) is not None
 
     def _evict_oldest(self):
-        """Remove oldest item from cache."""
-        if not self._cache:
-            return
-
-        oldest_key = None
-        oldest_time = float('inf')
-
-        for key, item in self._cache.items():
-            created = item.get('created', 0)
-            if created < oldest_time:
-                oldest_time = created
-                oldest_key = key
-
-        if oldest_key:
-            del self._cache[oldest_key]
+        """Remove least recently used item from cache."""
+        if self._cache:
+            del self._cache[next(iter(self._cache))]
 
     def cleanup(self):
         """Remove all expired items."""
@@ -152,9 +156,49 @@ class Cache:
 class ScorecardCache(Cache):
     """Specialized cache for sports scoreboards."""
 
-    def __init__(self):
-        """Initialize with sport-specific settings."""
-        super().__init__(ttl=60, max_items=10)
+    def __init__(self, ttl=60):
+        """
+        Initialize with sport-specific settings.
+
+        Args:
+            ttl: Seconds before a sport cached with cache_games() is stale
+        """
+        super().__init__(ttl=ttl, max_items=10)
+        self._expiry = {}        # sport -> current expiry time
+        self._expiry_heap = []   # (expiry, sport), soonest first
+
+    def cache_games(self, sport, games):
+        """Cache a sport's games and schedule when they go stale."""
+        self.set(f"scoreboard_{sport}", games)
+        expiry = time.time() + self.ttl
+        self._expiry[sport] = expiry
+        heapq.heappush(self._expiry_heap, (expiry, sport))
+
+    def get_games(self, sport):
+        """Get a sport's games stored by cache_games(), or None if stale."""
+        return self.get(f"scoreboard_{sport}")
+
+    def get_stale_sports(self):
+        """
+        Get sports whose cached games went stale since the last call.
+
+        Only entries that have expired are popped off the heap, so a
+        call when nothing is due is O(1).
+
+        Returns:
+            List of sport names
+        """
+        now = time.time()
+        heap = self._expiry_heap
+        expiry = self._expiry
+        stale = []
+        while heap and heap[0][0] <= now:
+            due, sport = heapq.heappop(heap)
+            # Skip entries superseded by a later cache_games()
+            if expiry.get(sport) == due:
+                del expiry[sport]
+                stale.append(sport)
+        return stale
 
     def get_scoreboard(self, sport):
         """Get cached scoreboard for sport."""
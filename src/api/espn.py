@@ -30,6 +30,9 @@ except ImportError:
 import json
 import gc
 
+from .cache import ScorecardCache
+from .parser import ScoreParser
+
 # ESPN API endpoints
 ESPN_BASE = "https://site.api.espn.com/apis/site/v2/sports"
 
@@ -40,6 +43,11 @@ SPORT_PATHS = {
     'nhl': '/hockey/nhl/scoreboard',
 }
 
+# A scoreboard fetched this recently is handed to later callers for the
+# same sport instead of being fetched again; short enough that it never
+# masks a real poll
+SHARE_WINDOW_S = 5
+
 # Team ID mappings (ESPN uses numeric IDs internally)
 # This maps common abbreviations to ESPN team IDs
 NFL_TEAMS = {
@@ -98,6 +106,9 @@ TEAM_MAPS = {
     'nhl': NHL_TEAMS,
 }
 
+# Shared status mapper; parse_game_status() keeps no per-instance state
+_status_parser = ScoreParser()
+
 
 class ESPNClient:
     """Client for fetching sports data from ESPN API."""
@@ -116,6 +127,10 @@ class ESPNClient:
         self.tz_offset = tz_offset
         self.cache = {}
         self.cache_ttl = 60  # Cache for 60 seconds
+        # Scoreboards shared between back-to-back callers; separate from
+        # cache_ttl so the share window never masks a real poll
+        self.share_window = SHARE_WINDOW_S
+        self.scoreboards = ScorecardCache(ttl=self.share_window)
 
     def get_scoreboard(self, sport):
         """
@@ -125,12 +140,20 @@ class ESPNClient:
             sport: 'nfl', 'nba', 'mlb', or 'nhl'
 
         Returns:
-            List of game dictionaries
+            List of game dictionaries. The list is the caller's own, but
+            the game dicts in it are shared with other callers inside the
+            share window and must not be modified.
         """
         if sport not in SPORT_PATHS:
             print(f"Unknown sport: {sport}")
             return []
 
+        # Callers asking for the same sport back to back (get_game() per
+        # team) share one fetch
+        games = self.scoreboards.get_games(sport)
+        if games is not None:
+            return list(games)
+
         url = ESPN_BASE + SPORT_PATHS[sport]
 
         try:
@@ -144,7 +167,8 @@ class ESPNClient:
             data = response.json()
             games = self._parse_scoreboard(data, sport)
 
-            return games
+            self.scoreboards.cache_games(sport, games)
+            return list(games)
 
         except Exception as e:
             print(f"Scoreboard fetch error: {e}")
@@ -183,6 +207,15 @@ class ESPNClient:
         Returns:
             List of game dicts for all teams
         """
+        # Drop scoreboards that have gone stale so a full ESPN response
+        # isn't held in RAM until its key is next read
+        cache = self.scoreboards
+        stale = cache.get_stale_sports()
+        for sport in stale:
+            cache.delete(f"scoreboard_{sport}")
+        if stale:
+            gc.collect()
+
         games = []
         sports_checked = set()
 
@@ -361,14 +394,8 @@ class ESPNClient:
             # Get status
             status_info = competition.get('status', {})
             status_type = status_info.get('type', {})
-            status_state = status_type.get('state', 'pre')
-
-            # Map status
-            if status_state == 'in':
-                status = 'live'
-            elif status_state == 'post':
-                status = 'final'
-            else:
+            status = _status_parser.parse_game_status(competition)
+            if status == 'unknown':
                 status = 'pre'
 
             # Get period/quarter and time
@@ -10,13 +10,50 @@ Usage:
     display_data = parser.format_for_display(game)
 """
 
+# ESPN status.type.state -> internal status, as used by is_live_game(),
+# is_final() and the proxy ('pre' for not yet started). The state is
+# authoritative: a delay before the start is still 'pre'.
+_STATE_MAP = {
+    'pre': 'pre',
+    'in': 'live',
+    'post': 'final',
+}
+
+# Fallback on status.type.name for data without a state. Delays are left
+# out; the name alone doesn't say whether the game has started.
+_STATUS_MAP = {
+    'STATUS_SCHEDULED': 'pre',
+    'STATUS_IN_PROGRESS': 'live',
+    'STATUS_HALFTIME': 'live',
+    'STATUS_END_PERIOD': 'live',
+    'STATUS_FIRST_HALF': 'live',
+    'STATUS_SECOND_HALF': 'live',
+    'STATUS_OVERTIME': 'live',
+    'STATUS_SHOOTOUT': 'live',
+    'STATUS_FINAL': 'final',
+    'STATUS_FULL_TIME': 'final',
+}
+
 
 class ScoreParser:
     """Parses and formats game data for display."""
 
     def __init__(self):
         """Initialize parser."""
-        pass
+        # sport -> set of favorite team abbreviations, for O(1) lookups
+        self._favorites = {}
+
+    def add_favorite_team(self, sport, team_id):
+        """Mark a team as a favorite for a sport."""
+        self._favorites.setdefault(sport, set()).add(team_id.upper())
+
+    def is_favorite(self, sport, team_id):
+        """Check if a team is a favorite for a sport."""
+        return team_id.upper() in self._favorites.get(sport, ())
+
+    def get_favorite_teams(self, sport):
+        """Get favorite team abbreviations for a sport."""
+        return tuple(self._favorites.get(sport, ()))
 
     def format_for_display(self, game):
         """
@@ -182,6 +219,22 @@ class ScoreParser:
 
         return str(period_num)
 
+    def parse_game_status(self, game_data):
+        """
+        Map an ESPN event status to an internal status.
+
+        Args:
+            game_data: ESPN event or competition dict with a 'status'
+
+        Returns:
+            'pre', 'live', 'final', or 'unknown'
+        """
+        status_type = game_data.get('status', {}).get('type', {})
+        status = _STATE_MAP.get(status_type.get('state'))
+        if status is None:
+            status = _STATUS_MAP.get(status_type.get('name'), 'unknown')
+        return status
+
     def is_live_game(self, game):
         """Check if game is currently live."""
         status = game.get('status', 'pre')
@@ -192,6 +245,28 @@ class ScoreParser:
         status = game.get('status', 'pre')
         return status in ['final', 'post', 'complete']
 
+    def get_game_priority(self, game, favorites=None):
+        """
+        Get display priority for a game; higher sorts first.
+
+        Args:
+            game: Game dict
+            favorites: Set of upper-case team abbreviations; defaults
+                to the favorites added for the game's sport
+
+        Returns:
+            3 for live with a favorite team, 2 for live, 1 for a
+            favorite team, 0 otherwise
+        """
+        if favorites is None:
+            favorites = self._favorites.get(game.get('sport'), ())
+        has_favorite = (game.get('home_team', '').upper() in favorites or
+                        game.get('away_team', '').upper() in favorites)
+
+        if self.is_live_game(game):
+            return 3 if has_favorite else 2
+        return 1 if has_favorite else 0
+
     def sort_by_priority(self, games, favorite_teams=None):
         """
         Sort games by display priority.
@@ -204,31 +279,18 @@ class ScoreParser:
 
         Args:
             games: List of game dicts
-            favorite_teams: List of team abbreviations
+            favorite_teams: List of team abbreviations; defaults to the
+                favorites added for each game's sport
 
         Returns:
             Sorted list of games
         """
-        if not favorite_teams:
-            favorite_teams = []
-
-        favorite_teams = [t.upper() for t in favorite_teams]
-
-        def priority_key(game):
-            is_live = self.is_live_game(game)
-            has_favorite = (game.get('home_team', '').upper() in favorite_teams or
-                           game.get('away_team', '').upper() in favorite_teams)
-
-            if is_live and has_favorite:
-                return 0
-            elif is_live:
-                return 1
-            elif has_favorite:
-                return 2
-            else:
-                return 3
-
-        return sorted(games, key=priority_key)
+        # The key is computed once per game; no decorated copies
+        if favorite_teams:
+            favorites = {t.upper() for t in favorite_teams}
+            return sorted(games, key=lambda g: self.get_game_priority(g, favorites),
+                          reverse=True)
+        return sorted(games, key=self.get_game_priority, reverse=True)
 
 
 # Test when run directly
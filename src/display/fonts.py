@@ -186,6 +186,38 @@ def get_char_bitmap(char, font=FONT_5X7):
     return chars.get(char, chars.get(' '))  # Default to space
 
 
+def get_char_mask(char, font=FONT_5X7):
+    """
+    Get lit-pixel offsets for a character.
+
+    Masks are derived from the row bitmap on first use and cached on the
+    font dict, so drawing a glyph again skips the per-bit tests.
+
+    Args:
+        char: Character to look up
+        font: Font dictionary to use
+
+    Returns:
+        Tuple of (dx, dy) offsets for every lit pixel in the glyph
+    """
+    masks = font.get('masks')
+    if masks is None:
+        masks = font['masks'] = {}
+
+    mask = masks.get(char)
+    if mask is None:
+        bitmap = get_char_bitmap(char, font) or ()
+        char_width = font.get('width', 5)
+        mask = tuple(
+            (col_idx, row_idx)
+            for row_idx, row_data in enumerate(bitmap)
+            for col_idx in range(char_width)
+            if row_data & (1 << (char_width - 1 - col_idx))  # MSB first
+        )
+        masks[char] = mask
+    return mask
+
+
 def get_text_width(text, font=FONT_5X7, spacing=1):
     """
     Calculate pixel width of text string.
@@ -201,6 +233,7 @@ def get_text_width(text, font=FONT_5X7, spacing=1):
     if not text:
         return 0
 
+    # Fonts are monospaced, so the width is closed-form; no per-char lookup
     char_width = font.get('width', 5)
     return len(text) * char_width + (len(text) - 1) * spacing
 
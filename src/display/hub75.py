@@ -85,6 +85,22 @@ class HUB75Display:
         color = rgb_to_565(r, g, b)
         self._display.pixel(x, y, color)
 
+    def blit_mask(self, x, y, mask, r, g, b):
+        """Set every (dx, dy) offset in a glyph mask to one color."""
+        r = (r * self.brightness) >> 8
+        g = (g * self.brightness) >> 8
+        b = (b * self.brightness) >> 8
+        color = rgb_to_565(r, g, b)
+
+        width = self.width
+        height = self.height
+        pixel = self._display.pixel
+        for dx, dy in mask:
+            px = x + dx
+            py = y + dy
+            if 0 <= px < width and 0 <= py < height:
+                pixel(px, py, color)
+
     def get_pixel(self, x, y):
         """Get pixel color (returns RGB565)."""
         if not (0 <= x < self.width and 0 <= y < self.height):
@@ -15,7 +15,7 @@ Usage:
     display.show()
 """
 
-from .fonts import FONT_5X7, FONT_6X8, get_char_bitmap, get_text_width, get_font_height
+from .fonts import FONT_5X7, FONT_6X8, get_char_mask, get_text_width, get_font_height
 
 # Team colors (primary color for each team)
 # Note: For teams that share abbreviations across sports (like DET),
@@ -91,20 +91,29 @@ TEAM_COLORS = {
     'WSH': (200, 16, 46),    # Red (Capitals)
 }
 
+# Pack colors as bytes((r, g, b)) once so displays with set_pixel_bytes()
+# can store them directly. Packed colors still index/unpack like tuples.
+TEAM_COLORS = {team: bytes(rgb) for team, rgb in TEAM_COLORS.items()}
+
 # Default colors
-DEFAULT_TEAM_COLOR = (128, 128, 128)  # Gray
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-BLUE = (0, 0, 255)
-YELLOW = (255, 255, 0)
-DIM_WHITE = (100, 100, 100)
+DEFAULT_TEAM_COLOR = bytes((128, 128, 128))  # Gray
+WHITE = bytes((255, 255, 255))
+BLACK = bytes((0, 0, 0))
+RED = bytes((255, 0, 0))
+GREEN = bytes((0, 255, 0))
+BLUE = bytes((0, 0, 255))
+YELLOW = bytes((255, 255, 0))
+DIM_WHITE = bytes((100, 100, 100))
+
+# Max cached game layouts (one framebuffer snapshot each)
+GAME_TEMPLATE_CACHE_SIZE = 4
 
 
 class Renderer:
     """High-level rendering for LED matrix display."""
 
+    __slots__ = ('display', 'width', 'height', '_game_templates')
+
     def __init__(self, display):
         """
         Initialize renderer.
@@ -115,6 +124,7 @@ class Renderer:
         self.display = display
         self.width = display.width
         self.height = display.height
+        self._game_templates = {}
 
     def draw_pixel(self, x, y, color):
         """
@@ -122,10 +132,26 @@ class Renderer:
 
         Args:
             x, y: Coordinates
-            color: (r, g, b) tuple
+            color: (r, g, b) tuple or bytes
         """
         self.display.set_pixel(x, y, color[0], color[1], color[2])
 
+    def _pixel_writer(self, color):
+        """
+        Get an (x, y) pixel writer bound to one color.
+
+        The color is unpacked (or packed) once here instead of per pixel.
+        Displays with set_pixel_bytes() get a direct packed-bytes store.
+        """
+        set_pixel_bytes = getattr(self.display, 'set_pixel_bytes', None)
+        if set_pixel_bytes is not None:
+            packed = color if isinstance(color, bytes) else bytes(color)
+            return lambda x, y: set_pixel_bytes(x, y, packed)
+
+        set_pixel = self.display.set_pixel
+        r, g, b = color
+        return lambda x, y: set_pixel(x, y, r, g, b)
+
     def draw_text(self, x, y, text, color, font=FONT_5X7, spacing=1):
         """
         Draw text string.
@@ -138,20 +164,20 @@ class Renderer:
             spacing: Pixels between characters
         """
         char_width = font.get('width', 5)
-        char_height = font.get('height', 7)
+        r, g, b = color
+        blit = getattr(self.display, 'blit_mask', None)
 
         cursor_x = x
         for char in text.upper():  # Uppercase for consistency
-            bitmap = get_char_bitmap(char, font)
-            if bitmap:
-                for row_idx, row_data in enumerate(bitmap):
-                    for col_idx in range(char_width):
-                        # Check if pixel is set (MSB first)
-                        if row_data & (1 << (char_width - 1 - col_idx)):
-                            px = cursor_x + col_idx
-                            py = y + row_idx
-                            if 0 <= px < self.width and 0 <= py < self.height:
-                                self.draw_pixel(px, py, color)
+            mask = get_char_mask(char, font)
+            if blit:
+                blit(cursor_x, y, mask, r, g, b)
+            else:
+                for dx, dy in mask:
+                    px = cursor_x + dx
+                    py = y + dy
+                    if 0 <= px < self.width and 0 <= py < self.height:
+                        self.display.set_pixel(px, py, r, g, b)
 
             cursor_x += char_width + spacing
 
@@ -171,19 +197,20 @@ class Renderer:
             color: (r, g, b) tuple
             filled: If True, fill rectangle
         """
+        put = self._pixel_writer(color)
         if filled:
             for py in range(y, min(y + h, self.height)):
                 for px in range(x, min(x + w, self.width)):
-                    self.draw_pixel(px, py, color)
+                    put(px, py)
         else:
             # Top and bottom
             for px in range(x, min(x + w, self.width)):
-                self.draw_pixel(px, y, color)
-                self.draw_pixel(px, y + h - 1, color)
+                put(px, y)
+                put(px, y + h - 1)
             # Left and right
             for py in range(y, min(y + h, self.height)):
-                self.draw_pixel(x, py, color)
-                self.draw_pixel(x + w - 1, py, color)
+                put(x, py)
+                put(x + w - 1, py)
 
     def draw_line(self, x0, y0, x1, y1, color):
         """Draw line using Bresenham's algorithm."""
@@ -192,9 +219,10 @@ class Renderer:
         sx = 1 if x0 < x1 else -1
         sy = 1 if y0 < y1 else -1
         err = dx + dy
+        put = self._pixel_writer(color)
 
         while True:
-            self.draw_pixel(x0, y0, color)
+            put(x0, y0)
 
             if x0 == x1 and y0 == y1:
                 break
@@ -215,8 +243,6 @@ class Renderer:
             game: Dict with keys: home_team, away_team, home_score, away_score,
                   status, period/quarter, time_remaining
         """
-        self.display.clear()
-
         # Get team info
         away_team = game.get('away_team', 'AWY')[:3].upper()
         home_team = game.get('home_team', 'HME')[:3].upper()
@@ -226,10 +252,6 @@ class Renderer:
         period = game.get('period', '')
         time_remaining = game.get('time_remaining', '')
 
-        # Get team colors
-        away_color = TEAM_COLORS.get(away_team, DEFAULT_TEAM_COLOR)
-        home_color = TEAM_COLORS.get(home_team, DEFAULT_TEAM_COLOR)
-
         # Layout:
         # Row 0-10: Away team name + score
         # Row 11-20: Separator
@@ -237,18 +259,24 @@ class Renderer:
         # Row 32-45: Status/period
         # Row 46-63: Time remaining
 
-        # Away team (top)
-        self.draw_text(4, 4, away_team, away_color, FONT_6X8)
+        # Static layout comes from a cached snapshot when the display
+        # supports it; only scores and status are drawn every frame
+        snapshot = getattr(self.display, 'snapshot', None)
+        if snapshot is None:
+            self._draw_game_template(away_team, home_team)
+        else:
+            key = (away_team, home_team, self.display.brightness)
+            template = self._game_templates.get(key)
+            if template is None:
+                self._draw_game_template(away_team, home_team)
+                if len(self._game_templates) >= GAME_TEMPLATE_CACHE_SIZE:
+                    del self._game_templates[next(iter(self._game_templates))]
+                self._game_templates[key] = snapshot()
+            else:
+                self.display.restore(template)
+
+        # Scores
         self.draw_text(40, 4, away_score, WHITE, FONT_6X8)
-
-        # Separator
-        self.draw_line(4, 18, 60, 18, DIM_WHITE)
-
-        # @ symbol
-        self.draw_text(28, 20, "@", DIM_WHITE, FONT_5X7)
-
-        # Home team (bottom)
-        self.draw_text(4, 26, home_team, home_color, FONT_6X8)
         self.draw_text(40, 26, home_score, WHITE, FONT_6X8)
 
         # Status area
@@ -264,6 +292,26 @@ class Renderer:
         elif status == 'pre':
             self.draw_text_centered(48, "UPCOMING", DIM_WHITE, FONT_5X7)
 
+    def _draw_game_template(self, away_team, home_team):
+        """Draw the static part of the game layout (teams, separator, @)."""
+        self.display.clear()
+
+        # Get team colors
+        away_color = TEAM_COLORS.get(away_team, DEFAULT_TEAM_COLOR)
+        home_color = TEAM_COLORS.get(home_team, DEFAULT_TEAM_COLOR)
+
+        # Away team (top)
+        self.draw_text(4, 4, away_team, away_color, FONT_6X8)
+
+        # Separator
+        self.draw_line(4, 18, 60, 18, DIM_WHITE)
+
+        # @ symbol
+        self.draw_text(28, 20, "@", DIM_WHITE, FONT_5X7)
+
+        # Home team (bottom)
+        self.draw_text(4, 26, home_team, home_color, FONT_6X8)
+
     def draw_idle(self):
         """Draw idle screen when no games active."""
         self.display.clear()
@@ -307,9 +355,10 @@ class Renderer:
             sport_colors = {'NFL': (0, 180, 0), 'NBA': (255, 120, 0), 'NHL': (0, 120, 255), 'MLB': (220, 0, 0)}
             sport_color = sport_colors.get(sport, DIM_WHITE)
             # Draw 2px wide bar
+            put = self._pixel_writer(sport_color)
             for dy in range(16):
-                self.draw_pixel(0, y_pos + dy, sport_color)
-                self.draw_pixel(1, y_pos + dy, sport_color)
+                put(0, y_pos + dy)
+                put(1, y_pos + dy)
 
             # Row 1: "AWY @ HME" - shifted right to make room for bar
             self.draw_text(4, y_pos, away, away_color, FONT_5X7)
@@ -16,10 +16,14 @@ Usage:
     display.show()  # Print to console
 """
 
+import sys
+
 
 class DisplaySimulator:
     """Simulates 64x64 LED matrix in terminal."""
 
+    __slots__ = ('width', 'height', 'framebuffer', 'brightness', '_lut')
+
     def __init__(self, width=64, height=64):
         """
         Initialize simulator.
@@ -31,7 +35,7 @@ class DisplaySimulator:
         self.width = width
         self.height = height
         self.framebuffer = bytearray(width * height * 3)
-        self.brightness = 255
+        self.set_brightness(255)
 
     def set_pixel(self, x, y, r, g, b):
         """
@@ -48,14 +52,60 @@ class DisplaySimulator:
             return  # Out of bounds
 
         # Apply brightness
-        r = int(r * self.brightness / 255)
-        g = int(g * self.brightness / 255)
-        b = int(b * self.brightness / 255)
+        lut = self._lut
+        offset = (y * self.width + x) * 3
+        self.framebuffer[offset] = lut[r]
+        self.framebuffer[offset + 1] = lut[g]
+        self.framebuffer[offset + 2] = lut[b]
+
+    def set_pixel_bytes(self, x, y, color):
+        """
+        Set pixel from a packed bytes((r, g, b)) color.
+
+        At full brightness the color is stored with a single slice copy;
+        otherwise it goes through set_pixel() for scaling.
+
+        Args:
+            x, y: Coordinates
+            color: bytes of length 3
+        """
+        if self.brightness != 255:
+            self.set_pixel(x, y, color[0], color[1], color[2])
+            return
+
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return  # Out of bounds
 
         offset = (y * self.width + x) * 3
-        self.framebuffer[offset] = r
-        self.framebuffer[offset + 1] = g
-        self.framebuffer[offset + 2] = b
+        self.framebuffer[offset:offset + 3] = color
+
+    def blit_mask(self, x, y, mask, r, g, b):
+        """
+        Set every pixel of a glyph mask to one color.
+
+        Brightness is looked up once for the whole mask instead of per pixel.
+
+        Args:
+            x, y: Top-left position of the mask
+            mask: Iterable of (dx, dy) offsets (see fonts.get_char_mask)
+            r, g, b: Color values (0-255)
+        """
+        lut = self._lut
+        r = lut[r]
+        g = lut[g]
+        b = lut[b]
+
+        width = self.width
+        height = self.height
+        fb = self.framebuffer
+        for dx, dy in mask:
+            px = x + dx
+            py = y + dy
+            if 0 <= px < width and 0 <= py < height:
+                offset = (py * width + px) * 3
+                fb[offset] = r
+                fb[offset + 1] = g
+                fb[offset + 2] = b
 
     def get_pixel(self, x, y):
         """Get pixel color at coordinates."""
@@ -66,16 +116,62 @@ class DisplaySimulator:
             self.framebuffer[offset + 2]
         )
 
+    def snapshot(self):
+        """Return an immutable copy of the framebuffer."""
+        return bytes(self.framebuffer)
+
+    def restore(self, snapshot):
+        """Restore the framebuffer from a snapshot() copy."""
+        self.framebuffer[:] = snapshot
+
+    def fill_rect(self, x, y, w, h, r, g, b):
+        """
+        Fill a rectangle with one color.
+
+        The rectangle is clipped to the display, and each row is written
+        with one slice copy of a prebuilt run of pixels.
+
+        Args:
+            x, y: Top-left position
+            w, h: Width and height in pixels
+            r, g, b: Color values (0-255)
+        """
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self.width)
+        y1 = min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        lut = self._lut
+        r = lut[r]
+        g = lut[g]
+        b = lut[b]
+
+        run = bytes((r, g, b)) * (x1 - x0)
+        n = len(run)
+        stride = self.width * 3
+        fb = self.framebuffer
+        offset = (y0 * self.width + x0) * 3
+        for _ in range(y1 - y0):
+            fb[offset:offset + n] = run
+            offset += stride
+
     def clear(self, r=0, g=0, b=0):
         """Clear display to color."""
-        for i in range(0, len(self.framebuffer), 3):
-            self.framebuffer[i] = r
-            self.framebuffer[i + 1] = g
-            self.framebuffer[i + 2] = b
+        # One slice copy per row rather than three stores per pixel
+        run = bytes((r, g, b)) * self.width
+        n = len(run)
+        fb = self.framebuffer
+        for offset in range(0, len(fb), n):
+            fb[offset:offset + n] = run
 
     def set_brightness(self, value):
         """Set global brightness (0-255)."""
         self.brightness = max(0, min(255, value))
+        # Scaled value for every channel level, so drawing is a lookup
+        brightness = self.brightness
+        self._lut = bytes([i * brightness // 255 for i in range(256)])
 
     def show(self, mode='ascii'):
         """
@@ -91,11 +187,17 @@ class DisplaySimulator:
         elif mode == 'color':
             self._show_color()
 
+    def _emit(self, lines):
+        """Write a whole frame to stdout in one call."""
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+
     def _show_ascii(self):
         """Show full ASCII art representation."""
-        print('\n' + '=' * (self.width + 2))
+        border = '=' * (self.width + 2)
+        lines = ['', border]
         for y in range(self.height):
-            row = '|'
+            row = ['|']
             for x in range(self.width):
                 r, g, b = self.get_pixel(x, y)
                 brightness = (r + g + b) // 3
@@ -111,16 +213,18 @@ class DisplaySimulator:
                     char = '.'
                 else:
                     char = ' '
-                row += char
-            row += '|'
-            print(row)
-        print('=' * (self.width + 2))
+                row.append(char)
+            row.append('|')
+            lines.append(''.join(row))
+        lines.append(border)
+        self._emit(lines)
 
     def _show_compact(self):
         """Show compact representation (useful for 64x64)."""
-        print('\n' + '-' * (self.width // 2 + 2))
+        border = '-' * (self.width // 2 + 2)
+        lines = ['', border]
         for y in range(0, self.height, 2):  # Every other row
-            row = '|'
+            row = ['|']
             for x in range(0, self.width, 2):  # Every other column
                 r1, g1, b1 = self.get_pixel(x, y)
                 # Sample 2x2 block
@@ -132,16 +236,18 @@ class DisplaySimulator:
                     char = '+'
                 else:
                     char = ' '
-                row += char
-            row += '|'
-            print(row)
-        print('-' * (self.width // 2 + 2))
+                row.append(char)
+            row.append('|')
+            lines.append(''.join(row))
+        lines.append(border)
+        self._emit(lines)
 
     def _show_color(self):
         """Show with ANSI color codes (terminal dependent)."""
-        print('\n' + '=' * (self.width + 2))
+        border = '=' * (self.width + 2)
+        lines = ['', border]
         for y in range(self.height):
-            row = '|'
+            row = ['|']
             for x in range(self.width):
                 r, g, b = self.get_pixel(x, y)
                 # Simple ANSI color mapping
@@ -164,29 +270,34 @@ class DisplaySimulator:
                 else:
                     char = ' '
 
-                row += f'{color_code}{char}\033[0m'
-            row += '|'
-            print(row)
-        print('=' * (self.width + 2))
+                row.append(f'{color_code}{char}\033[0m')
+            row.append('|')
+            lines.append(''.join(row))
+        lines.append(border)
+        self._emit(lines)
 
     def save_to_file(self, filename):
         """Save current display state to text file."""
+        lines = []
+        for y in range(self.height):
+            row = []
+            for x in range(self.width):
+                r, g, b = self.get_pixel(x, y)
+                brightness = (r + g + b) // 3
+                if brightness > 200:
+                    row.append('#')
+                elif brightness > 150:
+                    row.append('*')
+                elif brightness > 100:
+                    row.append('+')
+                elif brightness > 50:
+                    row.append('.')
+                else:
+                    row.append(' ')
+            lines.append(''.join(row))
+
         with open(filename, 'w') as f:
-            for y in range(self.height):
-                for x in range(self.width):
-                    r, g, b = self.get_pixel(x, y)
-                    brightness = (r + g + b) // 3
-                    if brightness > 200:
-                        f.write('#')
-                    elif brightness > 150:
-                        f.write('*')
-                    elif brightness > 100:
-                        f.write('+')
-                    elif brightness > 50:
-                        f.write('.')
-                    else:
-                        f.write(' ')
-                f.write('\n')
+            f.write('\n'.join(lines) + '\n')
 
 
 # Example usage and tests
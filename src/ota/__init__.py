@@ -1,3 +1,11 @@
 # OTA module - Over-the-air updates
 from .updater import OTAUpdater, get_updater, check_and_update
-from .routes import UpdateRoutes, UPDATE_PAGE_HTML
+from .routes import UpdateRoutes
+
+
+def __getattr__(name):
+    # UPDATE_PAGE_HTML is read from disk on first access
+    if name == 'UPDATE_PAGE_HTML':
+        from . import routes
+        return routes.UPDATE_PAGE_HTML
+    raise AttributeError(name)
@@ -7,16 +7,126 @@ Adds update management endpoints to the web interface:
 - POST /api/update/rollback - Rollback to previous version
 - GET /api/update/history - View update history
 - GET /api/update/status - Current update status
+- GET /api/update/overview - Status and update check in one response
+- GET /updates - Update management page
+
+Performance notes:
+    These handlers are glue code bound by JSON encode/decode and file
+    I/O, with no numeric loops, so Numba/Cython-style compilation does
+    not apply (and would add startup cost on the device). Speedups here
+    come from a native JSON encoder (orjson when present), reading only
+    the newest fixed-width history records (OTAUpdater.read_history),
+    and reusing the serialized status response while it is unchanged.
 """
 
-import json
-
 try:
     import os
     OS_AVAILABLE = True
 except ImportError:
     OS_AVAILABLE = False
 
+try:
+    import gzip
+    GZIP_AVAILABLE = True
+except ImportError:
+    GZIP_AVAILABLE = False
+
+try:
+    from _thread import allocate_lock
+except ImportError:
+    allocate_lock = None
+
+# orjson-backed encoder when available; same import fallback as ota.updater
+try:
+    from ..utils.jsonio import dumps as _dumps
+except ImportError:
+    from utils.jsonio import dumps as _dumps
+
+
+# Responses use WebServer's (status, headers, body) contract; headers may
+# be a pre-encoded block or a dict
+_JSON = 'application/json'
+_JSON_HEADERS = b'Content-Type: application/json\r\nConnection: close\r\n'
+
+_HTML_HEADERS = b'Content-Type: text/html; charset=utf-8\r\nConnection: close\r\n'
+_GZ_HTML_HEADERS = (b'Content-Type: text/html; charset=utf-8\r\n'
+                    b'Content-Encoding: gzip\r\n'
+                    b'Vary: Accept-Encoding\r\n'
+                    b'Connection: close\r\n')
+
+
+def _json_response(obj):
+    """Build a ('200 OK', headers, body) JSON response."""
+    return ('200 OK', _JSON_HEADERS, _dumps(obj))
+
+
+def _json_error(message):
+    """Build a JSON error response."""
+    return ('200 OK', _JSON_HEADERS, _dumps({'status': 'error', 'message': message}))
+
+
+# Prefixes for error messages that include an exception
+_CHECK_ERR = 'Update check failed: '
+_INSTALL_ERR = 'Installation error: '
+_ROLLBACK_ERR = 'Rollback error: '
+_HISTORY_ERR = 'Error reading history: '
+_STATUS_ERR = 'Status error: '
+
+# Fixed error responses, serialized once at import
+_ERR_IN_PROGRESS = _json_error('Update already in progress')
+_ERR_NO_UPDATE = _json_error('No update available. Check for updates first.')
+_ERR_INSTALL_FAILED = _json_error('Update installation failed')
+_ERR_ROLLBACK_FAILED = _json_error('Rollback failed. No backup available?')
+
+
+def _tail_lines(path, n=20, block=8192):
+    """
+    Read the last n lines of a file by seeking back from the end.
+
+    Only about n lines' worth of blocks are read, however long the file is.
+    The default block holds well over 20 log entries, so the usual case is
+    a single read, split into lines in C by splitlines().
+
+    Args:
+        path: File to read
+        n: Number of lines to return
+        block: Bytes to read per backwards step
+
+    Returns:
+        List of up to n non-empty lines as bytes, oldest first
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        pos = f.tell()
+        data = b''
+        while pos > 0 and data.count(b'\n') <= n:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+
+    lines = data.splitlines()
+    if pos > 0:
+        lines = lines[1:]  # First line is partial
+    lines = [line for line in lines if line]
+    return lines[-n:]
+
+
+class _SerialLock:
+    """Non-blocking stand-in lock for builds without _thread."""
+
+    def __init__(self):
+        self._held = False
+
+    def acquire(self, blocking=True):
+        if self._held:
+            return False
+        self._held = True
+        return True
+
+    def release(self):
+        self._held = False
+
 
 class UpdateRoutes:
     """Web routes for update management."""
@@ -31,6 +141,24 @@ class UpdateRoutes:
         self.updater = updater
         self.update_in_progress = False
 
+        # Held for the duration of an install so concurrent requests
+        # cannot both start the update flow
+        self._install_lock = allocate_lock() if allocate_lock else _SerialLock()
+
+        # Bind updater methods once instead of per request
+        self._check_for_update = updater.check_for_update
+        self._full_update_flow = updater.full_update_flow
+        self._rollback = updater.rollback
+        self._restart = updater.restart_device
+        self._get_status = updater.get_status
+        self._get_changelog = updater.get_changelog
+        self._is_breaking = updater.is_breaking_change
+        self._read_history = updater.read_history
+
+        # Last serialized status response, reused while the status is unchanged
+        self._status_key = None
+        self._status_response = None
+
     def register(self, server):
         """
         Register routes with web server.
@@ -38,11 +166,13 @@ class UpdateRoutes:
         Args:
             server: WebServer instance
         """
-        server.add_route('/api/update/check', self.handle_check_update, 'GET')
-        server.add_route('/api/update/install', self.handle_install_update, 'POST')
-        server.add_route('/api/update/rollback', self.handle_rollback, 'POST')
-        server.add_route('/api/update/history', self.handle_update_history, 'GET')
-        server.add_route('/api/update/status', self.handle_update_status, 'GET')
+        server.route('/api/update/check', self.handle_check_update, ['GET'])
+        server.route('/api/update/install', self.handle_install_update, ['POST'])
+        server.route('/api/update/rollback', self.handle_rollback, ['POST'])
+        server.route('/api/update/history', self.handle_update_history, ['GET'])
+        server.route('/api/update/status', self.handle_update_status, ['GET'])
+        server.route('/api/update/overview', self.handle_overview, ['GET'])
+        server.route('/updates', self.handle_update_page, ['GET'])
 
     def handle_check_update(self, request):
         """
@@ -57,26 +187,52 @@ class UpdateRoutes:
                 "breaking_changes": bool,
                 "size_bytes": int
             }
+
+        The response carries a weak ETag built from the installed and
+        latest versions and the manifest checksum, so it is stable across
+        restarts. A request with If-None-Match is answered from the
+        recent check, if any, instead of forcing a fetch, and gets an
+        empty 304 when the tag still matches.
         """
         try:
-            update_available = self.updater.check_for_update()
-
-            response = {
-                "update_available": update_available,
-                "current_version": self.updater.current_version,
-                "latest_version": self.updater.latest_version if update_available else self.updater.current_version,
-                "changelog": self.updater.get_changelog() if update_available else "",
-                "breaking_changes": self.updater.is_breaking_change() if update_available else False,
-                "size_bytes": self.updater.update_info.get('size_bytes', 0) if update_available and self.updater.update_info else 0
-            }
+            u = self.updater
+            if_none_match = request.get('headers', {}).get('if-none-match')
+            update_available = self._check_for_update(not if_none_match)
+            info = u.update_info or {}
+
+            etag = 'W/"%s-%s-%s"' % (u.current_version, u.latest_version,
+                                     info.get('checksum', ''))
+            if if_none_match == etag:
+                return ('304 Not Modified', {'ETag': etag}, b'')
 
-            return ('application/json', json.dumps(response))
+            return ('200 OK',
+                    {'Content-Type': _JSON, 'ETag': etag, 'Connection': 'close'},
+                    _dumps(self._check_result(update_available)))
 
         except Exception as e:
-            return ('application/json', json.dumps({
-                'status': 'error',
-                'message': f"Update check failed: {e}"
-            }))
+            return _json_error(_CHECK_ERR + str(e))
+
+    def _check_result(self, update_available):
+        """Build the update check response dict."""
+        u = self.updater
+        if not update_available:
+            return {
+                "update_available": False,
+                "current_version": u.current_version,
+                "latest_version": u.current_version,
+                "changelog": "",
+                "breaking_changes": False,
+                "size_bytes": 0
+            }
+
+        return {
+            "update_available": True,
+            "current_version": u.current_version,
+            "latest_version": u.latest_version,
+            "changelog": self._get_changelog(),
+            "breaking_changes": self._is_breaking(),
+            "size_bytes": (u.update_info or {}).get('size_bytes', 0)
+        }
 
     def handle_install_update(self, request):
         """
@@ -88,42 +244,37 @@ class UpdateRoutes:
                 "message": str
             }
         """
-        if self.update_in_progress:
-            return ('application/json', json.dumps({
-                'status': 'error',
-                'message': 'Update already in progress'
-            }))
+        # Check-and-set in one step; the lock stays held after a
+        # successful install since the device is about to restart
+        if not self._install_lock.acquire(0):
+            return _ERR_IN_PROGRESS
+
+        self._status_key = None
 
         if not self.updater.update_info:
-            return ('application/json', json.dumps({
-                'status': 'error',
-                'message': 'No update available. Check for updates first.'
-            }))
+            self._install_lock.release()
+            return _ERR_NO_UPDATE
 
         try:
             self.update_in_progress = True
 
             # Start update flow
-            success = self.updater.full_update_flow()
+            success = self._full_update_flow()
 
             if success:
-                return ('application/json', json.dumps({
+                return _json_response({
                     'status': 'installing',
                     'message': 'Update installing. Device will restart shortly.'
-                }))
+                })
             else:
                 self.update_in_progress = False
-                return ('application/json', json.dumps({
-                    'status': 'error',
-                    'message': 'Update installation failed'
-                }))
+                self._install_lock.release()
+                return _ERR_INSTALL_FAILED
 
         except Exception as e:
             self.update_in_progress = False
-            return ('application/json', json.dumps({
-                'status': 'error',
-                'message': f'Installation error: {e}'
-            }))
+            self._install_lock.release()
+            return _json_error(_INSTALL_ERR + str(e))
 
     def handle_rollback(self, request):
         """
@@ -135,28 +286,24 @@ class UpdateRoutes:
                 "message": str
             }
         """
+        self._status_key = None
+
         try:
-            success = self.updater.rollback()
+            success = self._rollback()
 
             if success:
                 # Restart after rollback
-                self.updater.restart_device()
+                self._restart()
 
-                return ('application/json', json.dumps({
+                return _json_response({
                     'status': 'success',
                     'message': 'Rolling back. Device will restart shortly.'
-                }))
+                })
             else:
-                return ('application/json', json.dumps({
-                    'status': 'error',
-                    'message': 'Rollback failed. No backup available?'
-                }))
+                return _ERR_ROLLBACK_FAILED
 
         except Exception as e:
-            return ('application/json', json.dumps({
-                'status': 'error',
-                'message': f'Rollback error: {e}'
-            }))
+            return _json_error(_ROLLBACK_ERR + str(e))
 
     def handle_update_history(self, request):
         """
@@ -176,35 +323,50 @@ class UpdateRoutes:
             }
         """
         try:
-            history = []
+            try:
+                return _json_response({'history': self._read_history(20)})
+            except OSError:
+                pass  # No binary history yet; fall back to the legacy log
 
-            # Read log file
+            # Legacy JSON-per-line log. Entries are appended in time
+            # order, so the last 20 lines are the 20 newest entries
             try:
-                with open('/logs/ota_update.log', 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                entry = json.loads(line)
-                                history.append(entry)
-                            except:
-                                pass
-            except:
-                pass  # Log file might not exist
-
-            # Sort by timestamp (newest first)
-            history.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-
-            # Limit to last 20 entries
-            history = history[:20]
-
-            return ('application/json', json.dumps({'history': history}))
+                lines = _tail_lines('/logs/ota_update.log', 20)
+            except OSError:
+                lines = []  # Log file might not exist
+
+            # Log lines are already JSON objects with exactly the fields
+            # above, so splice them into the body instead of decoding and
+            # re-encoding each one. Torn lines (e.g. from power loss
+            # mid-write) fail the brace check and are skipped.
+            entries = [
+                line for line in reversed(lines)  # Newest first
+                if line.startswith(b'{') and line.endswith(b'}')
+            ]
+
+            return ('200 OK', _JSON_HEADERS,
+                    b'{"history": [' + b', '.join(entries) + b']}')
 
         except Exception as e:
-            return ('application/json', json.dumps({
-                'status': 'error',
-                'message': f'Error reading history: {e}'
-            }))
+            return _json_error(_HISTORY_ERR + str(e))
+
+    def handle_update_page(self, request):
+        """
+        Serve the update management page.
+
+        The page is kept as the file's bytes, so it is never re-encoded
+        per request. It is gzip-compressed once, on first request, and
+        sent with Content-Encoding: gzip to clients that accept it.
+
+        Response:
+            ('200 OK', headers, body)
+        """
+        headers = request.get('headers', {})
+        if 'gzip' in headers.get('accept-encoding', ''):
+            page_gz = _get_update_page_gz()
+            if page_gz:
+                return ('200 OK', _GZ_HTML_HEADERS, page_gz)
+        return ('200 OK', _HTML_HEADERS, _get_update_page())
 
     def handle_update_status(self, request):
         """
@@ -219,304 +381,77 @@ class UpdateRoutes:
             }
         """
         try:
-            status = self.updater.get_status()
+            status = self._get_status()
             status['update_in_progress'] = self.update_in_progress
 
-            return ('application/json', json.dumps(status))
+            # Status values are all scalars, so they form the cache key
+            key = tuple(status.values())
+            if key != self._status_key:
+                self._status_response = _json_response(status)
+                self._status_key = key
+
+            return self._status_response
 
         except Exception as e:
-            return ('application/json', json.dumps({
-                'status': 'error',
-                'message': f'Status error: {e}'
-            }))
-
-
-# HTML Template for Update Interface
-UPDATE_PAGE_HTML = """<!DOCTYPE html>
-<html>
-<head>
-    <title>Updates - Sports Ticker</title>
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        * { box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Arial, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: #1a1a2e;
-            color: #eee;
-        }
-        .container {
-            max-width: 600px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        h1 { color: #00d4ff; }
-        h2 { color: #00d4ff; font-size: 1.2em; margin-top: 30px; }
-        .card {
-            background: #16213e;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 20px;
-        }
-        .version {
-            font-size: 24px;
-            font-weight: bold;
-            color: #00d4ff;
-        }
-        .changelog {
-            background: #0f3460;
-            border-left: 4px solid #00ff88;
-            padding: 15px;
-            margin: 15px 0;
-            font-family: monospace;
-            white-space: pre-wrap;
-        }
-        button {
-            background: #00d4ff;
-            color: #1a1a2e;
-            border: none;
-            padding: 12px 24px;
-            font-size: 16px;
-            border-radius: 5px;
-            cursor: pointer;
-            margin-right: 10px;
-            margin-top: 10px;
-        }
-        button:hover { background: #00b8e6; }
-        button:disabled { background: #666; cursor: not-allowed; }
-        button.danger { background: #e94560; }
-        button.danger:hover { background: #d63850; }
-        button.secondary { background: #0f3460; color: #00d4ff; }
-        .status {
-            display: inline-block;
-            padding: 6px 12px;
-            border-radius: 4px;
-            font-size: 14px;
-            font-weight: bold;
-        }
-        .status.success { background: #00ff8833; color: #00ff88; }
-        .status.failed { background: #e9456033; color: #e94560; }
-        .status.rolled_back { background: #ffc10733; color: #ffc107; }
-        .history-entry {
-            border-bottom: 1px solid #0f3460;
-            padding: 15px 0;
-        }
-        .history-entry:last-child { border-bottom: none; }
-        .loading {
-            display: none;
-            text-align: center;
-            padding: 20px;
-        }
-        .loading.active { display: block; }
-        .spinner {
-            border: 4px solid #0f3460;
-            border-top: 4px solid #00d4ff;
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-            margin: 0 auto;
-        }
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        .warning {
-            background: #ffc10722;
-            border-left: 4px solid #ffc107;
-            padding: 15px;
-            margin: 15px 0;
-            color: #ffc107;
-        }
-        .nav {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 20px;
-        }
-        .nav a {
-            background: #0f3460;
-            color: #00d4ff;
-            text-decoration: none;
-            padding: 10px 20px;
-            border-radius: 5px;
-        }
-        .nav a:hover { background: #00d4ff; color: #1a1a2e; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Software Updates</h1>
-        <nav class="nav">
-            <a href="/">Home</a>
-            <a href="/teams">Teams</a>
-            <a href="/settings">Settings</a>
-        </nav>
-
-        <div class="card">
-            <strong>Current Version:</strong>
-            <span class="version" id="currentVersion">Loading...</span>
-        </div>
-
-        <div class="card" id="updateCard" style="display:none;">
-            <h2>Update Available</h2>
-            <div>
-                <strong>New Version:</strong>
-                <span class="version" id="latestVersion"></span>
-            </div>
-            <div id="breakingWarning" class="warning" style="display:none;">
-                Warning: This update includes breaking changes.
-            </div>
-            <div class="changelog" id="changelog"></div>
-            <div>
-                <strong>Download Size:</strong> <span id="downloadSize"></span>
-            </div>
-            <div style="margin-top: 20px;">
-                <button onclick="installUpdate()" id="installBtn">Install Update</button>
-                <button onclick="checkForUpdates()" class="secondary">Check Again</button>
-            </div>
-        </div>
-
-        <div class="card" id="noUpdateCard" style="display:none;">
-            <p>You're running the latest version</p>
-            <button onclick="checkForUpdates()" class="secondary">Check for Updates</button>
-        </div>
-
-        <div class="loading" id="loading">
-            <div class="spinner"></div>
-            <p id="loadingText">Checking for updates...</p>
-        </div>
-
-        <div class="card">
-            <h2>Actions</h2>
-            <button onclick="rollback()" class="danger">Rollback to Previous Version</button>
-            <button onclick="showHistory()" class="secondary">View Update History</button>
-        </div>
-
-        <div class="card" id="historyCard" style="display:none;">
-            <h2>Update History</h2>
-            <div id="historyList"></div>
-        </div>
-    </div>
-
-    <script>
-        function setLoading(active, text) {
-            document.getElementById('loading').className = active ? 'loading active' : 'loading';
-            document.getElementById('loadingText').textContent = text || 'Loading...';
-        }
+            return _json_error(_STATUS_ERR + str(e))
 
-        async function checkForUpdates() {
-            setLoading(true, 'Checking for updates...');
-            document.getElementById('updateCard').style.display = 'none';
-            document.getElementById('noUpdateCard').style.display = 'none';
-
-            try {
-                const response = await fetch('/api/update/check');
-                const data = await response.json();
-
-                document.getElementById('currentVersion').textContent = data.current_version;
-
-                if (data.update_available) {
-                    document.getElementById('latestVersion').textContent = data.latest_version;
-                    document.getElementById('changelog').textContent = data.changelog || 'No changelog';
-                    document.getElementById('downloadSize').textContent = formatBytes(data.size_bytes);
-                    document.getElementById('breakingWarning').style.display = data.breaking_changes ? 'block' : 'none';
-                    document.getElementById('updateCard').style.display = 'block';
-                } else {
-                    document.getElementById('noUpdateCard').style.display = 'block';
-                }
-            } catch (error) {
-                alert('Error: ' + error.message);
-            } finally {
-                setLoading(false);
-            }
-        }
+    def handle_overview(self, request):
+        """
+        Get update status and check for updates in one request.
+
+        Saves the update page a second round trip on load.
 
-        async function installUpdate() {
-            if (!confirm('Install update? Device will restart.')) return;
-
-            setLoading(true, 'Installing update...');
-            document.getElementById('installBtn').disabled = true;
-
-            try {
-                const response = await fetch('/api/update/install', { method: 'POST' });
-                const data = await response.json();
-
-                if (data.status === 'installing') {
-                    alert('Update installing. Device will restart.');
-                    setLoading(true, 'Restarting...');
-                } else {
-                    alert('Failed: ' + data.message);
-                    setLoading(false);
-                    document.getElementById('installBtn').disabled = false;
-                }
-            } catch (error) {
-                alert('Error: ' + error.message);
-                setLoading(false);
-                document.getElementById('installBtn').disabled = false;
+        Response:
+            {
+                "status": {...same as /api/update/status...},
+                "check": {...same as /api/update/check...}
             }
-        }
+        """
+        try:
+            update_available = self._check_for_update(True)
+            status = self._get_status()
+            status['update_in_progress'] = self.update_in_progress
 
-        async function rollback() {
-            if (!confirm('Rollback to previous version? Device will restart.')) return;
+            return _json_response({
+                'status': status,
+                'check': self._check_result(update_available)
+            })
 
-            setLoading(true, 'Rolling back...');
+        except Exception as e:
+            return _json_error(_CHECK_ERR + str(e))
 
-            try {
-                const response = await fetch('/api/update/rollback', { method: 'POST' });
-                const data = await response.json();
 
-                if (data.status === 'success') {
-                    alert('Rolling back. Device will restart.');
-                } else {
-                    alert('Failed: ' + data.message);
-                }
-            } catch (error) {
-                alert('Error: ' + error.message);
-            } finally {
-                setLoading(false);
-            }
-        }
+# The update page HTML lives in update_page.html next to this module and
+# is only read (and compressed) the first time it is served, so importing
+# this module does not keep ~10 KB of markup on the heap. It is read as
+# bytes, ready to send: no decode on load and no encode per response.
+_UPDATE_PAGE_FILE = __file__[:max(__file__.rfind('/'), __file__.rfind('\\')) + 1] + 'update_page.html'
+_update_page = None
+_update_page_gz = None
 
-        async function showHistory() {
-            setLoading(true, 'Loading history...');
-
-            try {
-                const response = await fetch('/api/update/history');
-                const data = await response.json();
-
-                const list = document.getElementById('historyList');
-                list.innerHTML = data.history.length === 0
-                    ? '<p>No update history</p>'
-                    : data.history.map(e => `
-                        <div class="history-entry">
-                            <strong>${e.from_version} → ${e.to_version}</strong><br>
-                            <span class="status ${e.status}">${e.status}</span>
-                            <span style="color:#888">${new Date(e.timestamp * 1000).toLocaleString()}</span>
-                            ${e.error ? '<br><span style="color:#e94560">' + e.error + '</span>' : ''}
-                        </div>
-                    `).join('');
-
-                document.getElementById('historyCard').style.display = 'block';
-            } catch (error) {
-                alert('Error: ' + error.message);
-            } finally {
-                setLoading(false);
-            }
-        }
 
-        function formatBytes(bytes) {
-            if (!bytes) return '0 B';
-            const k = 1024;
-            const sizes = ['B', 'KB', 'MB'];
-            const i = Math.floor(Math.log(bytes) / Math.log(k));
-            return Math.round(bytes / Math.pow(k, i) * 10) / 10 + ' ' + sizes[i];
-        }
+def _get_update_page():
+    """Get the UTF-8 update page bytes, loading them on first use."""
+    global _update_page
+    if _update_page is None:
+        with open(_UPDATE_PAGE_FILE, 'rb') as f:
+            _update_page = f.read().rstrip(b'\n')
+    return _update_page
+
+
+def _get_update_page_gz():
+    """Get the gzip-compressed update page, or None without gzip."""
+    global _update_page_gz
+    if _update_page_gz is None and GZIP_AVAILABLE:
+        _update_page_gz = gzip.compress(_get_update_page(), 9)
+    return _update_page_gz
+
 
-        checkForUpdates();
-    </script>
-</body>
-</html>"""
+def __getattr__(name):
+    # UPDATE_PAGE_HTML stays importable as a str, but is loaded lazily
+    if name == 'UPDATE_PAGE_HTML':
+        return _get_update_page().decode('utf-8')
+    raise AttributeError(name)
 
 
 # Test when run directly
@@ -530,3 +465,4 @@ if __name__ == '__main__':
     print("  POST /api/update/rollback")
     print("  GET  /api/update/history")
     print("  GET  /api/update/status")
+    print("  GET  /updates")
@@ -19,6 +19,7 @@ Usage:
 
 import json
 import gc
+import struct
 import time
 
 # Try to import MicroPython-specific modules
@@ -46,6 +47,265 @@ try:
 except ImportError:
     MACHINE_AVAILABLE = False
 
+try:
+    import _thread
+    THREAD_AVAILABLE = True
+except ImportError:
+    THREAD_AVAILABLE = False
+
+# Streaming gzip decoder for compressed version.json responses:
+# deflate on MicroPython 1.21+, uzlib on older builds, gzip on CPython
+try:
+    import deflate
+
+    def _gunzip(stream):
+        return deflate.DeflateIO(stream, deflate.GZIP)
+except ImportError:
+    try:
+        import uzlib
+
+        def _gunzip(stream):
+            return uzlib.DecompIO(stream, 31)  # 16 + 15: gzip header
+    except ImportError:
+        try:
+            import gzip
+
+            def _gunzip(stream):
+                return gzip.GzipFile(fileobj=stream)
+        except ImportError:
+            _gunzip = None
+
+
+# Single-write JSON file helpers, orjson-backed when available; ota is a
+# top-level package when src/ itself is on sys.path
+try:
+    from ..utils.jsonio import load as _load, dump as _dump
+except ImportError:
+    from utils.jsonio import load as _load, dump as _dump
+
+
+class _ChunkWriter:
+    """
+    Write downloaded chunks to a file and feed them to a hasher.
+
+    Where _thread is available the flash write and SHA-256 update run on
+    a second thread (the other core on RP2040/RP2350 and ESP32), so they
+    overlap with reading the next chunk from the socket. Chunks are
+    handed over through a one-slot mailbox guarded by two locks, so at
+    most one chunk waits while another is being written. Without
+    _thread, or if the thread cannot be started, writes happen inline.
+    """
+
+    def __init__(self, f, sha=None):
+        self._f = f
+        self._sha = sha
+        self._error = None
+        self._threaded = False
+
+        if THREAD_AVAILABLE:
+            self._slot = None
+            self._empty = _thread.allocate_lock()  # Held while slot is full
+            self._full = _thread.allocate_lock()   # Held while slot is empty
+            self._done = _thread.allocate_lock()   # Held until worker exits
+            self._full.acquire()
+            self._done.acquire()
+            try:
+                _thread.start_new_thread(self._run, ())
+                self._threaded = True
+            except Exception:
+                pass  # e.g. second core already in use
+
+    def _run(self):
+        f, sha = self._f, self._sha
+        try:
+            while True:
+                self._full.acquire()
+                chunk = self._slot
+                self._empty.release()
+                if chunk is None:
+                    break
+                if self._error is None:
+                    try:
+                        f.write(chunk)
+                        if sha:
+                            sha.update(chunk)
+                    except Exception as e:
+                        self._error = e
+        finally:
+            self._done.release()
+
+    def write(self, chunk):
+        """Queue a chunk (or write it inline without a worker thread)."""
+        if not self._threaded:
+            self._f.write(chunk)
+            if self._sha:
+                self._sha.update(chunk)
+            return
+
+        if self._error is not None:
+            raise self._error
+        self._empty.acquire()
+        self._slot = chunk
+        self._full.release()
+
+    def close(self):
+        """Wait for queued chunks to be written, then stop the worker."""
+        if not self._threaded:
+            return
+        self._threaded = False
+        self._empty.acquire()
+        self._slot = None
+        self._full.release()
+        self._done.acquire()
+        if self._error is not None:
+            raise self._error
+
+
+# Memo of version string -> parsed tuple (None if invalid); the poller
+# parses the same few version strings over and over. Cleared when full.
+_VERSION_MEMO_SIZE = 32
+_version_memo = {}
+
+
+def _parse_version(version):
+    """
+    Parse 'MAJOR.MINOR.PATCH' into an int tuple, zero-padded to 3 parts.
+
+    Args:
+        version: Version string
+
+    Returns:
+        Tuple of three ints, or None if the string is not a valid version
+    """
+    try:
+        return _version_memo[version]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+    try:
+        parts = [int(x) for x in version.split('.')]
+        parts += [0] * (3 - len(parts))
+        parsed = tuple(parts[:3])
+    except (ValueError, AttributeError):
+        parsed = None
+    if len(_version_memo) >= _VERSION_MEMO_SIZE:
+        _version_memo.clear()
+    _version_memo[version] = parsed
+    return parsed
+
+
+def _version_greater(v1, v2):
+    """
+    Compare semantic versions (MAJOR.MINOR.PATCH).
+
+    Args:
+        v1: Candidate version string
+        v2: Version string to compare against
+
+    Returns:
+        True if v1 is newer than v2; False if not or either is invalid
+    """
+    return _tuple_greater(_parse_version(v1), _parse_version(v2))
+
+
+def _tuple_greater(p1, p2):
+    """Compare two parsed versions; False if either is None."""
+    return p1 is not None and p2 is not None and p1 > p2
+
+
+# st_mode directory bit (stat.S_IFDIR); MicroPython has no stat module
+_S_IFDIR = 0x4000
+
+
+# Monotonic millisecond clock for check intervals; wall time can jump
+# when NTP first syncs. ticks_diff copes with ticks_ms wraparound.
+try:
+    _ticks_ms = time.ticks_ms
+    _ticks_diff = time.ticks_diff
+except AttributeError:
+    def _ticks_ms():
+        return int(time.monotonic() * 1000)
+
+    def _ticks_diff(a, b):
+        return a - b
+
+
+# Collect only when free heap drops below this many bytes
+GC_THRESHOLD = 4096
+
+
+def _maybe_gc(threshold=GC_THRESHOLD):
+    """
+    Run gc.collect() only under memory pressure.
+
+    A full collection scans the whole heap, so doing it after every call
+    costs more than it frees. CPython has no gc.mem_free() and never
+    needs the collect.
+    """
+    mem_free = getattr(gc, 'mem_free', None)
+    if mem_free and mem_free() < threshold:
+        gc.collect()
+
+
+def _write_json_atomic(path, data):
+    """
+    Write JSON to a temp file and rename it into place.
+
+    A power cut mid-write leaves the previous file intact instead of a
+    torn one. rename() replaces the target on LittleFS, and MicroPython's
+    FAT driver unlinks an existing target first.
+    """
+    if not OS_AVAILABLE:
+        with open(path, 'w') as f:
+            _dump(data, f)
+        return
+
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        _dump(data, f)
+    os.rename(tmp, path)
+
+
+# Installed version read from version.json, keyed by (path, mtime, size),
+# so constructing another updater skips re-parsing an unchanged file
+_installed_version_cache = {}
+
+
+def _stat_key(path):
+    """Get a (path, mtime, size) cache key, or None if it can't be stat'd."""
+    if not OS_AVAILABLE:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st[8], st[6])
+
+
+def _ensure_dir(path):
+    """Create a directory unless it already exists."""
+    try:
+        os.stat(path)
+    except OSError:
+        os.mkdir(path)
+
+
+def _listdir_set(path):
+    """Get the names in a directory as a set (empty if unreadable)."""
+    try:
+        return set(os.listdir(path))
+    except OSError:
+        return set()
+
+
+def _get_header(response, name):
+    """Get a response header by lower-case name, ignoring the server's case."""
+    for key, value in (getattr(response, 'headers', None) or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
 
 class OTAUpdater:
     """Manages over-the-air software updates."""
@@ -53,41 +313,78 @@ class OTAUpdater:
     # Version file format
     VERSION_FILE = '/version.json'
 
+    # Last fetched version.json with its ETag/Last-Modified validators
+    VERSION_CACHE_FILE = '/version_cache.json'
+
     # Update configuration
     UPDATE_CHECK_INTERVAL = 86400  # 24 hours
     MAX_DOWNLOAD_RETRIES = 3
+    DOWNLOAD_CHUNK_SIZE = 1024
     BACKUP_DIR = '/backups'
     UPDATE_DIR = '/tmp/update'
+    DOWNLOAD_PATH = UPDATE_DIR + '/update.tar.gz'
     BOOT_COUNT_FILE = '/boot_count.txt'
     MAX_BOOT_FAILURES = 3
 
-    def __init__(self, update_url, auto_check=True):
+    # Update history: fixed-width binary records, newest last. Error text
+    # is appended to a side file and referenced by offset/length.
+    # Record: timestamp, from_version, to_version, status index,
+    # error offset, error length (0 = no error)
+    HISTORY_FILE = '/logs/ota_update.bin'
+    HISTORY_ERROR_FILE = '/logs/ota_update.err'
+    HISTORY_RECORD = '<I12s12sBIH'
+    HISTORY_RECORD_SIZE = struct.calcsize(HISTORY_RECORD)
+    HISTORY_STATUSES = ('success', 'failed', 'rolled_back')
+
+    def __init__(self, update_url, auto_check=True, verbose=False):
         """
         Initialize OTA updater.
 
         Args:
             update_url: URL to version.json file
             auto_check: Automatically check for updates daily
+            verbose: Print routine progress messages (errors always print)
         """
         self.update_url = update_url
         self.auto_check = auto_check
+        self.verbose = verbose
         self.current_version = self._load_current_version()
         self.latest_version = None
         self.update_info = None
         self._last_check = 0
+        self._checked_at = None  # Monotonic ms of last successful check
+        self._logs_dir_ready = False
+
+        # Conditional GET state for the version check
+        self._etag = None
+        self._last_modified = None
+        self._cached_info = None
+        self._load_version_cache()
 
         # Check boot count for rollback detection
         self._check_boot_failures()
 
     def _load_current_version(self):
         """Load current version from version.json."""
+        key = _stat_key(self.VERSION_FILE)
+        if key is not None:
+            cached = _installed_version_cache.get(key)
+            if cached is not None:
+                return cached
+        elif OS_AVAILABLE:
+            return '0.0.0'  # Missing file
+
         try:
             with open(self.VERSION_FILE, 'r') as f:
-                data = json.load(f)
-                return data.get('version', '0.0.0')
+                version = _load(f).get('version', '0.0.0')
         except:
             return '0.0.0'
 
+        if key is not None:
+            _installed_version_cache.clear()
+            _installed_version_cache[key] = version
+        return version
+
     def _save_version(self, version):
         """Save version info."""
         data = {
@@ -95,8 +392,9 @@ class OTAUpdater:
             'installed': int(time.time()),
             'build': 'prod'
         }
-        with open(self.VERSION_FILE, 'w') as f:
-            json.dump(data, f)
+        # mtime may not change within the filesystem's timestamp resolution
+        _installed_version_cache.clear()
+        _write_json_atomic(self.VERSION_FILE, data)
 
     def _check_boot_failures(self):
         """Check if we've had multiple boot failures (rollback trigger)."""
@@ -130,69 +428,119 @@ class OTAUpdater:
         except:
             pass
 
-    def check_for_update(self):
+    def _load_version_cache(self):
+        """Load the cached version.json and its HTTP validators."""
+        try:
+            with open(self.VERSION_CACHE_FILE, 'r') as f:
+                data = _load(f)
+            self._etag = data.get('etag')
+            self._last_modified = data.get('last_modified')
+            self._cached_info = data.get('update_info')
+        except:
+            pass
+
+    def _save_version_cache(self):
+        """Persist version.json and its HTTP validators."""
+        try:
+            _write_json_atomic(self.VERSION_CACHE_FILE, {
+                'etag': self._etag,
+                'last_modified': self._last_modified,
+                'update_info': self._cached_info
+            })
+        except:
+            pass
+
+    def check_for_update(self, force=False):
         """
         Check if update is available.
 
+        version.json is fetched with a conditional GET, so an unchanged
+        file costs a 304 with no body to parse.
+
+        Args:
+            force: Ask the server even if the last check is recent
+
         Returns:
             bool: True if update available
         """
+        if (not force and self._checked_at is not None and self.update_info
+                and _ticks_diff(_ticks_ms(), self._checked_at)
+                < self.UPDATE_CHECK_INTERVAL * 1000):
+            return self._version_greater(self.latest_version, self.current_version)
+
         if not REQUESTS_AVAILABLE:
             print("OTA: urequests not available")
             return False
 
         try:
-            print(f"OTA: Checking for updates at {self.update_url}")
-            response = urequests.get(self.update_url, timeout=10)
-
-            if response.status_code != 200:
+            if self.verbose:
+                print(f"OTA: Checking for updates at {self.update_url}")
+            headers = {'Accept-Encoding': 'gzip'} if _gunzip else {}
+            if self._cached_info:
+                if self._etag:
+                    headers['If-None-Match'] = self._etag
+                if self._last_modified:
+                    headers['If-Modified-Since'] = self._last_modified
+            response = urequests.get(self.update_url, timeout=10, headers=headers)
+
+            if response.status_code == 304 and self._cached_info:
+                response.close()
+                self.update_info = self._cached_info
+            elif response.status_code != 200:
                 print(f"OTA: Check failed: HTTP {response.status_code}")
                 response.close()
                 return False
+            else:
+                if _get_header(response, 'content-encoding') == 'gzip':
+                    self.update_info = json.load(_gunzip(response.raw))
+                else:
+                    self.update_info = response.json()
+                self._etag = _get_header(response, 'etag')
+                self._last_modified = _get_header(response, 'last-modified')
+                response.close()
+                self._cached_info = self.update_info
+                self._save_version_cache()
 
-            self.update_info = response.json()
             self.latest_version = self.update_info.get('version', '0.0.0')
-            response.close()
-
             self._last_check = time.time()
+            self._checked_at = _ticks_ms()
 
-            print(f"OTA: Current: {self.current_version}, Latest: {self.latest_version}")
+            if self.verbose:
+                print(f"OTA: Current: {self.current_version}, Latest: {self.latest_version}")
 
             # Compare versions
             if self._version_greater(self.latest_version, self.current_version):
-                print(f"OTA: Update available: v{self.latest_version}")
+                if self.verbose:
+                    print(f"OTA: Update available: v{self.latest_version}")
                 return True
             else:
-                print("OTA: Already on latest version")
+                if self.verbose:
+                    print("OTA: Already on latest version")
                 return False
 
         except Exception as e:
             print(f"OTA: Update check error: {e}")
             return False
         finally:
-            gc.collect()
+            _maybe_gc()
+
+    @property
+    def current_version(self):
+        """Installed version string."""
+        return self._current_version
+
+    @current_version.setter
+    def current_version(self, version):
+        # Parse once here, so comparisons against the installed version
+        # never re-parse it and always see the latest assignment
+        self._current_version = version
+        self.current_version_tuple = _parse_version(version)
 
     def _version_greater(self, v1, v2):
         """Compare semantic versions (MAJOR.MINOR.PATCH)."""
-        try:
-            parts1 = [int(x) for x in v1.split('.')]
-            parts2 = [int(x) for x in v2.split('.')]
-
-            # Pad to 3 parts
-            while len(parts1) < 3:
-                parts1.append(0)
-            while len(parts2) < 3:
-                parts2.append(0)
-
-            for i in range(3):
-                if parts1[i] > parts2[i]:
-                    return True
-                elif parts1[i] < parts2[i]:
-                    return False
-
-            return False  # Equal
-        except:
-            return False
+        if v2 is self._current_version:
+            return _tuple_greater(_parse_version(v1), self.current_version_tuple)
+        return _version_greater(v1, v2)
 
     def get_changelog(self):
         """Get changelog for latest version."""
@@ -238,50 +586,167 @@ class OTAUpdater:
         except:
             pass
 
-        download_path = f"{self.UPDATE_DIR}/update.tar.gz"
+        download_path = self.DOWNLOAD_PATH
+
+        # Remove any partial file left by an earlier, unrelated download
+        try:
+            os.remove(download_path)
+        except OSError:
+            pass
+
+        # Hash state and byte count carry over between attempts, so a
+        # retry resumes with a Range request instead of starting over
+        hashing = bool(expected_checksum and HASH_AVAILABLE)
+        sha = hashlib.sha256() if hashing else None
+        bytes_read = 0
+
+        # Optional per-block manifest: each block_size slice of the file
+        # is checked as soon as it arrives, so corruption is caught one
+        # block in rather than after the whole download
+        block_size = self.update_info.get('block_size', 0)
+        block_hashes = self.update_info.get('block_hashes')
+        verify_blocks = bool(block_size and block_hashes and HASH_AVAILABLE)
 
         # Download with retries
         for attempt in range(self.MAX_DOWNLOAD_RETRIES):
             try:
-                print(f"OTA: Downloading update (attempt {attempt + 1})...")
+                if self.verbose:
+                    print(f"OTA: Downloading update (attempt {attempt + 1})...")
 
-                response = urequests.get(download_url, timeout=60)
-
-                if response.status_code != 200:
+                # Resync with what actually reached flash
+                try:
+                    on_disk = os.stat(download_path)[6]
+                except OSError:
+                    on_disk = 0
+                if on_disk != bytes_read:
+                    sha = self._file_hasher(download_path) if hashing else None
+                    bytes_read = on_disk
+
+                if bytes_read:
+                    if self.verbose:
+                        print(f"OTA: Resuming from byte {bytes_read}")
+                    response = urequests.get(
+                        download_url, timeout=60, stream=True,
+                        headers={'Range': f'bytes={bytes_read}-'}
+                    )
+                else:
+                    response = urequests.get(download_url, timeout=60, stream=True)
+
+                if response.status_code == 200 and bytes_read:
+                    # Server ignored the Range header; start over
+                    sha = hashlib.sha256() if hashing else None
+                    bytes_read = 0
+                elif response.status_code not in (200, 206):
                     print(f"OTA: Download failed: HTTP {response.status_code}")
                     response.close()
+                    time.sleep(2 ** attempt)  # Back off before retry
                     continue
 
-                # Save to file
-                content = response.content
-                response.close()
+                length = int(_get_header(response, 'content-length') or 0)
+                total = bytes_read + length
 
-                with open(download_path, 'wb') as f:
-                    f.write(content)
+                if verify_blocks:
+                    # Pick up a partially received block from flash
+                    block_fill = bytes_read % block_size
+                    if block_fill:
+                        block_sha = self._file_hasher(download_path, bytes_read - block_fill)
+                    else:
+                        block_sha = hashlib.sha256()
+                corrupt = False
 
-                print(f"OTA: Downloaded {len(content)} bytes")
+                # Stream to flash and hash in the same pass, so only a
+                # couple of chunks are ever held in RAM
+                try:
+                    with open(download_path, 'ab' if bytes_read else 'wb') as f:
+                        writer = _ChunkWriter(f, sha)
+                        try:
+                            while True:
+                                size = self.DOWNLOAD_CHUNK_SIZE
+                                if verify_blocks:
+                                    # Never read across a block boundary
+                                    size = min(size, block_size - block_fill)
+                                chunk = response.raw.read(size)
+                                if not chunk:
+                                    break
+                                writer.write(chunk)
+                                bytes_read += len(chunk)
+
+                                if verify_blocks:
+                                    block_sha.update(chunk)
+                                    block_fill += len(chunk)
+                                    if block_fill == block_size:
+                                        i = bytes_read // block_size - 1
+                                        if (i >= len(block_hashes)
+                                                or block_sha.hexdigest() != block_hashes[i]):
+                                            corrupt = True
+                                            break
+                                        block_sha = hashlib.sha256()
+                                        block_fill = 0
+
+                                if progress_callback:
+                                    progress_callback(bytes_read, total)
+                        finally:
+                            writer.close()
+                finally:
+                    response.close()
+
+                if verify_blocks and not corrupt:
+                    full_blocks = bytes_read // block_size
+                    if block_fill and full_blocks == len(block_hashes) - 1:
+                        # Short final block
+                        corrupt = block_sha.hexdigest() != block_hashes[-1]
+                    elif full_blocks + (1 if block_fill else 0) < len(block_hashes):
+                        print(f"OTA: Download incomplete at {bytes_read} bytes")
+                        time.sleep(2 ** attempt)  # Back off, then resume
+                        continue
+
+                if corrupt:
+                    print(f"OTA: Block hash mismatch near byte {bytes_read}")
+                    try:
+                        os.remove(download_path)
+                    except OSError:
+                        pass
+                    sha = hashlib.sha256() if hashing else None
+                    bytes_read = 0
+                    continue
+
+                if length and bytes_read < total:
+                    # Stream ended early without an error; resume it
+                    # rather than verify (or return) a short file
+                    print(f"OTA: Download incomplete at {bytes_read} of {total} bytes")
+                    time.sleep(2 ** attempt)  # Back off, then resume
+                    continue
+
+                if self.verbose:
+                    print(f"OTA: Downloaded {bytes_read} bytes")
 
                 # Verify checksum
-                if expected_checksum and HASH_AVAILABLE:
-                    actual_checksum = self._calculate_checksum(download_path)
+                if sha:
+                    actual_checksum = sha.hexdigest()
                     expected_hash = expected_checksum.split(':')[1] if ':' in expected_checksum else expected_checksum
 
                     if actual_checksum != expected_hash:
                         print(f"OTA: Checksum mismatch!")
                         print(f"  Expected: {expected_hash}")
                         print(f"  Actual: {actual_checksum}")
+                        try:
+                            os.remove(download_path)
+                        except OSError:
+                            pass
+                        sha = hashlib.sha256()
+                        bytes_read = 0
                         continue
 
-                    print("OTA: Checksum verified")
+                    if self.verbose:
+                        print("OTA: Checksum verified")
 
-                gc.collect()
                 return download_path
 
             except Exception as e:
                 print(f"OTA: Download error: {e}")
-                time.sleep(5)  # Wait before retry
+                time.sleep(2 ** attempt)  # Back off before retry
             finally:
-                gc.collect()
+                _maybe_gc()
 
         print("OTA: Download failed after all retries")
         return None
@@ -291,14 +756,27 @@ class OTAUpdater:
         if not HASH_AVAILABLE:
             return ''
 
+        return self._file_hasher(filepath).hexdigest()
+
+    def _file_hasher(self, filepath, start=0):
+        """Return a SHA256 hasher fed with a file's contents from start."""
         sha = hashlib.sha256()
-        with open(filepath, 'rb') as f:
-            while True:
-                chunk = f.read(1024)
-                if not chunk:
-                    break
-                sha.update(chunk)
-        return sha.hexdigest()
+
+        # One reusable buffer; memoryview slices avoid a bytes
+        # allocation per chunk
+        buf = bytearray(8192)
+        mv = memoryview(buf)
+        try:
+            with open(filepath, 'rb') as f:
+                if start:
+                    f.seek(start)
+                n = f.readinto(buf)
+                while n:
+                    sha.update(mv[:n])
+                    n = f.readinto(buf)
+        except OSError:
+            pass  # Missing file hashes as empty
+        return sha
 
     def backup_current_version(self):
         """Backup current version before update."""
@@ -309,17 +787,9 @@ class OTAUpdater:
             import os
             backup_path = f"{self.BACKUP_DIR}/v{self.current_version}"
 
-            # Create backups directory
-            try:
-                os.mkdir(self.BACKUP_DIR)
-            except:
-                pass
-
-            # Create version-specific backup
-            try:
-                os.mkdir(backup_path)
-            except:
-                pass
+            # Create backups directory and version-specific backup
+            _ensure_dir(self.BACKUP_DIR)
+            _ensure_dir(backup_path)
 
             # Backup main files
             files_to_backup = [
@@ -329,61 +799,80 @@ class OTAUpdater:
                 self.VERSION_FILE.lstrip('/')
             ]
 
+            # One copy buffer shared by every file in the backup
+            buf = bytearray(8192)
+
             for filename in files_to_backup:
                 try:
-                    self._copy_file(f'/{filename}', f'{backup_path}/{filename}')
+                    self._copy_file(f'/{filename}', f'{backup_path}/{filename}', buf)
                 except:
                     pass  # File might not exist
 
             # Backup src directory
-            self._backup_directory('/src', f'{backup_path}/src')
+            _ensure_dir(f'{backup_path}/src')
+            self._backup_directory('/src', f'{backup_path}/src', buf)
 
-            print(f"OTA: Backup created: {backup_path}")
+            if self.verbose:
+                print(f"OTA: Backup created: {backup_path}")
             return True
 
         except Exception as e:
             print(f"OTA: Backup error: {e}")
             return False
 
-    def _backup_directory(self, src_dir, dst_dir):
-        """Recursively backup directory."""
+    def _backup_directory(self, src_dir, dst_dir, buf=None):
+        """Recursively backup directory into an existing dst_dir."""
         import os
 
-        try:
-            os.mkdir(dst_dir)
-        except:
-            pass
-
         try:
             items = os.listdir(src_dir)
         except:
             return
 
+        existing = _listdir_set(dst_dir)
+
         for item in items:
             src_path = f"{src_dir}/{item}"
             dst_path = f"{dst_dir}/{item}"
 
             try:
-                # Check if directory
-                os.listdir(src_path)
+                mode = os.stat(src_path)[0]
+            except OSError:
+                continue
+
+            if mode & _S_IFDIR:
                 # It's a directory, recurse
-                self._backup_directory(src_path, dst_path)
-            except:
+                if item not in existing:
+                    try:
+                        os.mkdir(dst_path)
+                    except OSError:
+                        pass  # e.g. a file of the same name; copies below fail
+                self._backup_directory(src_path, dst_path, buf)
+            else:
                 # It's a file, copy it
                 try:
-                    self._copy_file(src_path, dst_path)
+                    self._copy_file(src_path, dst_path, buf)
                 except:
                     pass
 
-    def _copy_file(self, src, dst):
-        """Copy file from src to dst."""
+    def _copy_file(self, src, dst, buf=None):
+        """
+        Copy file from src to dst.
+
+        Args:
+            src: Source path
+            dst: Destination path
+            buf: Reusable bytearray to copy through (allocated if None)
+        """
+        if buf is None:
+            buf = bytearray(8192)
+        mv = memoryview(buf)
         with open(src, 'rb') as f_src:
             with open(dst, 'wb') as f_dst:
-                while True:
-                    chunk = f_src.read(1024)
-                    if not chunk:
-                        break
-                    f_dst.write(chunk)
+                n = f_src.readinto(buf)
+                while n:
+                    f_dst.write(mv[:n])
+                    n = f_src.readinto(buf)
 
     def install_update(self, update_path=None):
         """
@@ -396,7 +885,8 @@ class OTAUpdater:
             bool: True if installation successful
         """
         try:
-            print("OTA: Installing update...")
+            if self.verbose:
+                print("OTA: Installing update...")
 
             # In a full implementation, we would:
             # 1. Extract the tarball
@@ -419,28 +909,87 @@ class OTAUpdater:
             return False
 
     def _log_update(self, status, error=None):
-        """Log update attempt."""
-        log_entry = {
-            'timestamp': int(time.time()),
-            'from_version': self.current_version,
-            'to_version': self.latest_version,
-            'status': status,
-            'error': error
-        }
-
+        """Append an update attempt to the binary history."""
         try:
-            # Ensure logs directory exists
+            # Ensure logs directory exists (checked once per updater)
+            if not self._logs_dir_ready:
+                _ensure_dir('/logs')
+                self._logs_dir_ready = True
+
+            err_offset = err_len = 0
+            if error:
+                err = error.encode('utf-8')[:0xFFFF]
+                with open(self.HISTORY_ERROR_FILE, 'ab') as f:
+                    f.seek(0, 2)
+                    err_offset = f.tell()
+                    f.write(err)
+                err_len = len(err)
+
+            record = struct.pack(
+                self.HISTORY_RECORD,
+                int(time.time()),
+                (self.current_version or '').encode('utf-8'),
+                (self.latest_version or '').encode('utf-8'),
+                self.HISTORY_STATUSES.index(status),
+                err_offset,
+                err_len
+            )
+            with open(self.HISTORY_FILE, 'ab') as f:
+                f.write(record)
+        except:
+            pass
+
+    def read_history(self, n=20):
+        """
+        Read the newest update history entries.
+
+        Only the last n records are read, by seeking back from the end of
+        the file, and each is decoded with a single struct.unpack_from.
+
+        Args:
+            n: Maximum number of entries to return
+
+        Returns:
+            List of entry dicts, newest first
+
+        Raises:
+            OSError: If the history file does not exist
+        """
+        size = self.HISTORY_RECORD_SIZE
+        with open(self.HISTORY_FILE, 'rb') as f:
+            f.seek(0, 2)
+            total = f.tell() // size  # Ignore a torn trailing record
+            count = min(n, total)
+            f.seek((total - count) * size)
+            buf = f.read(count * size)
+
+        records = [
+            struct.unpack_from(self.HISTORY_RECORD, buf, i * size)
+            for i in range(count - 1, -1, -1)  # Newest first
+        ]
+
+        errors = {}
+        if any(r[5] for r in records):
             try:
-                import os
-                os.mkdir('/logs')
-            except:
+                with open(self.HISTORY_ERROR_FILE, 'rb') as f:
+                    for r in records:
+                        if r[5]:
+                            f.seek(r[4])
+                            errors[r[4]] = f.read(r[5]).decode('utf-8')
+            except OSError:
                 pass
 
-            # Append to log file
-            with open('/logs/ota_update.log', 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
-        except:
-            pass
+        statuses = self.HISTORY_STATUSES
+        return [
+            {
+                'timestamp': ts,
+                'from_version': from_ver.rstrip(b'\0').decode('utf-8'),
+                'to_version': to_ver.rstrip(b'\0').decode('utf-8'),
+                'status': statuses[status] if status < len(statuses) else 'unknown',
+                'error': errors.get(err_offset) if err_len else None
+            }
+            for ts, from_ver, to_ver, status, err_offset, err_len in records
+        ]
 
     def rollback(self):
         """Rollback to previous version."""
@@ -449,7 +998,8 @@ class OTAUpdater:
 
         try:
             import os
-            print("OTA: Rolling back to previous version...")
+            if self.verbose:
+                print("OTA: Rolling back to previous version...")
 
             # Find most recent backup
             try:
@@ -470,7 +1020,7 @@ class OTAUpdater:
             print(f"OTA: Restoring from: {backup_path}")
 
             # Restore files
-            self._restore_directory(backup_path, '/')
+            self._restore_directory(backup_path, '/', bytearray(8192))
 
             # Reset boot count
             self.mark_boot_successful()
@@ -484,7 +1034,7 @@ class OTAUpdater:
             print(f"OTA: Rollback error: {e}")
             return False
 
-    def _restore_directory(self, src_dir, dst_dir):
+    def _restore_directory(self, src_dir, dst_dir, buf=None):
         """Recursively restore directory."""
         import os
 
@@ -493,23 +1043,29 @@ class OTAUpdater:
         except:
             return
 
+        existing = _listdir_set(dst_dir)
+
         for item in items:
             src_path = f"{src_dir}/{item}"
             dst_path = f"{dst_dir}/{item}"
 
             try:
-                # Check if directory
-                os.listdir(src_path)
+                mode = os.stat(src_path)[0]
+            except OSError:
+                continue
+
+            if mode & _S_IFDIR:
                 # It's a directory, recurse
-                try:
-                    os.mkdir(dst_path)
-                except:
-                    pass
-                self._restore_directory(src_path, dst_path)
-            except:
+                if item not in existing:
+                    try:
+                        os.mkdir(dst_path)
+                    except OSError:
+                        pass  # e.g. a file of the same name; copies below fail
+                self._restore_directory(src_path, dst_path, buf)
+            else:
                 # It's a file, copy it
                 try:
-                    self._copy_file(src_path, dst_path)
+                    self._copy_file(src_path, dst_path, buf)
                 except:
                     pass
 
@@ -518,6 +1074,13 @@ class OTAUpdater:
         print("OTA: Restarting device...")
         time.sleep(2)
 
+        # Buffered log lines would be lost with the reset
+        try:
+            from ..utils.logger import flush_logs
+        except ImportError:
+            from utils.logger import flush_logs
+        flush_logs()
+
         if MACHINE_AVAILABLE:
             import machine
             machine.reset()
@@ -557,6 +1120,8 @@ class OTAUpdater:
         except Exception as e:
             print(f"OTA: Update flow error: {e}")
             return False
+        finally:
+            gc.collect()
 
     def get_status(self):
         """Get current OTA status."""
@@ -1,8 +1,34 @@
 # Utilities module - Helper functions
-from .config import ConfigManager, get_config
-from .network import NetworkManager, get_network, load_credentials
-from .logger import Logger, get_logger, set_level, enable_file_logging
-from .time_utils import (
-    get_local_time, get_hour, format_time, format_time_12h,
-    format_date, sync_ntp, set_timezone, is_between_hours
-)
+#
+# Submodules are imported on first use of one of their names (module
+# __getattr__), so importing utils does not load network/logger/etc.
+# until something actually needs them.
+
+_LAZY = {
+    'ConfigManager': 'config',
+    'get_config': 'config',
+    'NetworkManager': 'network',
+    'get_network': 'network',
+    'load_credentials': 'network',
+    'Logger': 'logger',
+    'get_logger': 'logger',
+    'set_level': 'logger',
+    'enable_file_logging': 'logger',
+    'get_local_time': 'time_utils',
+    'get_hour': 'time_utils',
+    'format_time': 'time_utils',
+    'format_time_12h': 'time_utils',
+    'format_date': 'time_utils',
+    'sync_ntp': 'time_utils',
+    'set_timezone': 'time_utils',
+    'is_between_hours': 'time_utils',
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(name)
+    value = getattr(__import__(__name__ + '.' + module, None, None, (name,)), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
@@ -7,15 +7,34 @@ Uses JSON storage with sensible defaults.
 Usage:
     from utils.config import ConfigManager
 
-    config = ConfigManager()
-    config.load()
+    config = ConfigManager()  # Loads the file once
     print(config.get('brightness'))
     config.set('brightness', 200)
     config.save()
 """
 
-import json
 import gc
+import time
+
+try:
+    import os
+    OS_AVAILABLE = True
+except ImportError:
+    OS_AVAILABLE = False
+
+# CPython has no ticks_* functions; fall back to a monotonic ms clock
+try:
+    _ticks_ms = time.ticks_ms
+    _ticks_diff = time.ticks_diff
+except AttributeError:
+    def _ticks_ms():
+        return int(time.monotonic() * 1000)
+
+    def _ticks_diff(a, b):
+        return a - b
+
+# Single-write JSON file helpers, orjson-backed when available
+from .jsonio import load as _load, dump as _dump
 
 # Default configuration values
 DEFAULTS = {
@@ -38,39 +57,115 @@ DEFAULTS = {
 # Configuration file path
 CONFIG_FILE = 'config.json'
 
+# Minimum spacing between debounced writes from flush_if_needed()
+SAVE_DEBOUNCE_MS = 5000
+
+# Parsed configs keyed by (filename, mtime, size), so reloading an
+# unchanged file skips the flash read and JSON decode
+_CONFIG_CACHE = {}
+
+
+def _maybe_gc(threshold=4096):
+    """Collect garbage only when free heap is below threshold bytes."""
+    mem_free = getattr(gc, 'mem_free', None)  # MicroPython only
+    if mem_free and mem_free() < threshold:
+        gc.collect()
+
+
+def _copy(value):
+    """Copy nested dicts/lists so callers can't mutate cached config."""
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def _cache_key(filename):
+    """Get the config cache key for a file, or None if it can't be stat'd."""
+    if not OS_AVAILABLE:
+        return None
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    return (filename, st[8], st[6])
+
 
 class ConfigManager:
     """Manages application configuration."""
 
-    def __init__(self, filename=CONFIG_FILE):
+    def __init__(self, filename=CONFIG_FILE, lazy=False):
         """
         Initialize configuration manager.
 
         Args:
             filename: Path to configuration file
+            lazy: If True, don't load the file until load() is called
         """
         self.filename = filename
         self._config = {}
+        self._loaded = None  # Result of the first load(), once it has run
         self._dirty = False
+        self._last_save = None  # ticks_ms of the last write
+
+        # (sport, team_id) -> team dict, and sport -> [team_id, ...] in
+        # list order; None until built, and cleared whenever the teams
+        # list is set, reset or reloaded. get() and set() copy the list,
+        # so it can't change behind the index's back.
+        self._team_index = None
+        self._team_ids_by_sport = None
+
+        # 24-bit mask of quiet hours (bit h set if hour h is quiet), and
+        # the (enabled, start, end) values it was computed from
+        self._quiet_mask = 0
+        self._quiet_mask_key = None
+
+        if not lazy:
+            self.load()
 
-    def load(self):
+    def load(self, force=False):
         """
         Load configuration from file.
 
+        Only the first call reads the file; later calls return the same
+        result unless forced.
+
+        Args:
+            force: Re-read the file even if it was already loaded
+
         Returns:
             True if loaded successfully, False otherwise
         """
+        if self._loaded is not None and not force:
+            return self._loaded
+        self._loaded = self._read()
+        return self._loaded
+
+    def _read(self):
+        """Read the configuration file, falling back to defaults."""
+        self._team_index = None  # Rebuilt from the loaded teams
+        cache_key = _cache_key(self.filename)
+        cached = _CONFIG_CACHE.get(cache_key) if cache_key else None
+        if cached is not None:
+            self._config = _copy(cached)
+            self._dirty = False
+            return True
+
         try:
             with open(self.filename, 'r') as f:
-                self._config = json.load(f)
+                loaded = _load(f)
 
-            # Merge with defaults for any missing keys
-            for key, value in DEFAULTS.items():
-                if key not in self._config:
-                    self._config[key] = value
+            # Defaults for any missing keys, overridden by the file in
+            # one C-level update instead of a per-key loop
+            self._config = DEFAULTS.copy()
+            self._config.update(loaded)
+
+            if cache_key:
+                _CONFIG_CACHE[cache_key] = _copy(self._config)
 
             self._dirty = False
-            gc.collect()
+            _maybe_gc()
             return True
 
         except OSError:
@@ -86,18 +181,41 @@ class ConfigManager:
             self._dirty = True
             return False
 
-    def save(self):
+    def save(self, force=False):
         """
         Save configuration to file.
 
+        Skips the flash write when nothing has changed since the last
+        load or save.
+
+        Args:
+            force: Write even if there are no unsaved changes
+
         Returns:
-            True if saved successfully, False otherwise
+            True if saved successfully (or nothing to save), False otherwise
         """
+        if not self._dirty and not force:
+            return True
+
+        # Drop cached parses of this file; mtime may not change within
+        # the filesystem's timestamp resolution
+        for key in [k for k in _CONFIG_CACHE if k[0] == self.filename]:
+            del _CONFIG_CACHE[key]
+
         try:
-            with open(self.filename, 'w') as f:
-                json.dump(self._config, f)
+            # Write a temp file and rename it over the config, so a power
+            # cut mid-write leaves the old file intact
+            if OS_AVAILABLE:
+                tmp = self.filename + '.tmp'
+                with open(tmp, 'w') as f:
+                    _dump(self._config, f)
+                os.rename(tmp, self.filename)
+            else:
+                with open(self.filename, 'w') as f:
+                    _dump(self._config, f)
             self._dirty = False
-            gc.collect()
+            self._last_save = _ticks_ms()
+            _maybe_gc()
             return True
 
         except OSError as e:
@@ -113,8 +231,10 @@ class ConfigManager:
             default: Default value if key not found
 
         Returns:
-            Configuration value or default
+            Configuration value or default; the teams list is a copy
         """
+        if key == 'teams':
+            return _copy(self._config.get(key, default))
         return self._config.get(key, default)
 
     def set(self, key, value):
@@ -125,7 +245,15 @@ class ConfigManager:
             key: Configuration key
             value: Value to set
         """
-        if self._config.get(key) != value:
+        current = self._config.get(key)
+        # Passing back the same list/dict means it was edited in place,
+        # so it compares equal to itself but still needs saving
+        if current != value or (current is value and isinstance(value, (list, dict))):
+            if key == 'teams':
+                # Own copy, so later edits to the caller's list can't
+                # leave the index stale
+                value = _copy(value)
+                self._team_index = None
             self._config[key] = value
             self._dirty = True
 
@@ -149,9 +277,38 @@ class ConfigManager:
         if key is None:
             self._config = DEFAULTS.copy()
             self._dirty = True
+            self._team_index = None
         elif key in DEFAULTS:
             self._config[key] = DEFAULTS[key]
             self._dirty = True
+            if key == 'teams':
+                self._team_index = None
+
+    def mark_dirty(self):
+        """
+        Flag the configuration for a deferred save.
+
+        set(), update() and reset() already do this when a value changes;
+        the write happens on the next flush_if_needed() call that is due.
+        """
+        self._dirty = True
+
+    def flush_if_needed(self):
+        """
+        Save pending changes, at most once per SAVE_DEBOUNCE_MS.
+
+        Call this periodically from the main loop.
+
+        Returns:
+            True if a save was attempted
+        """
+        if not self._dirty:
+            return False
+        if (self._last_save is not None and
+                _ticks_diff(_ticks_ms(), self._last_save) < SAVE_DEBOUNCE_MS):
+            return False
+        self.save()
+        return True
 
     @property
     def is_dirty(self):
@@ -167,6 +324,21 @@ class ConfigManager:
         """Get list of configured teams."""
         return self.get('teams', [])
 
+    def _get_team_index(self):
+        """Get the (sport, team_id) index of configured teams."""
+        if self._team_index is None:
+            teams = self._config.get('teams', [])
+            index = {}
+            by_sport = {}
+            for t in teams:
+                key = (t.get('sport'), t.get('team_id'))
+                if key not in index:
+                    by_sport.setdefault(key[0], []).append(key[1])
+                index[key] = t
+            self._team_index = index
+            self._team_ids_by_sport = by_sport
+        return self._team_index
+
     def add_team(self, sport, team_id, team_name=None):
         """
         Add a team to favorites.
@@ -179,20 +351,24 @@ class ConfigManager:
         Returns:
             True if added, False if already exists
         """
-        teams = self.get_teams()
-
-        # Check for duplicate
-        for team in teams:
-            if team.get('sport') == sport and team.get('team_id') == team_id:
-                return False
+        index = self._get_team_index()
+        key = (sport.lower(), team_id.upper())
+        if key in index:
+            return False
 
-        teams.append({
-            'sport': sport.lower(),
-            'team_id': team_id.upper(),
+        team = {
+            'sport': key[0],
+            'team_id': key[1],
             'team_name': team_name or team_id
-        })
+        }
 
-        self.set('teams', teams)
+        # New list rather than appending, so a list shared with DEFAULTS
+        # or a caller is never mutated
+        self._config['teams'] = self._config.get('teams', []) + [team]
+        self._dirty = True
+
+        index[key] = team
+        self._team_ids_by_sport.setdefault(key[0], []).append(key[1])
         return True
 
     def remove_team(self, sport, team_id):
@@ -206,17 +382,16 @@ class ConfigManager:
         Returns:
             True if removed, False if not found
         """
-        teams = self.get_teams()
-        original_count = len(teams)
-
-        teams = [t for t in teams
-                 if not (t.get('sport') == sport.lower() and
-                        t.get('team_id') == team_id.upper())]
+        index = self._get_team_index()
+        key = (sport.lower(), team_id.upper())
+        if index.pop(key, None) is None:
+            return False
 
-        if len(teams) < original_count:
-            self.set('teams', teams)
-            return True
-        return False
+        self._config['teams'] = [t for t in self._config.get('teams', [])
+                                 if (t.get('sport'), t.get('team_id')) != key]
+        self._dirty = True
+        self._team_ids_by_sport[key[0]].remove(key[1])
+        return True
 
     def get_team_ids(self, sport=None):
         """
@@ -228,12 +403,37 @@ class ConfigManager:
         Returns:
             List of team ID strings
         """
-        teams = self.get_teams()
+        self._get_team_index()
         if sport:
-            teams = [t for t in teams if t.get('sport') == sport.lower()]
-        return [t.get('team_id') for t in teams]
+            return list(self._team_ids_by_sport.get(sport.lower(), ()))
+        return [t.get('team_id') for t in self._config.get('teams', [])]
 
     # Quiet hours helpers
+    def _get_quiet_mask(self):
+        """Get the quiet-hours bitmask, rebuilding it if the setting changed."""
+        quiet = self.get('quiet_hours', {})
+        # Keyed on the values rather than the dict, so edits made to the
+        # dict in place are picked up too
+        enabled = quiet.get('enabled', False)
+        start = quiet.get('start', 23)
+        end = quiet.get('end', 7)
+        key = (enabled, start, end)
+        if self._quiet_mask_key != key:
+            mask = 0
+            if enabled:
+                for hour in range(24):
+                    if start <= end:
+                        # Simple range (e.g., 9-17)
+                        in_quiet = start <= hour < end
+                    else:
+                        # Overnight range (e.g., 23-7)
+                        in_quiet = hour >= start or hour < end
+                    if in_quiet:
+                        mask |= 1 << hour
+            self._quiet_mask = mask
+            self._quiet_mask_key = key
+        return self._quiet_mask
+
     def is_quiet_hours(self, current_hour):
         """
         Check if current time is within quiet hours.
@@ -244,56 +444,54 @@ class ConfigManager:
         Returns:
             True if in quiet hours
         """
-        quiet = self.get('quiet_hours', {})
-        if not quiet.get('enabled', False):
-            return False
-
-        start = quiet.get('start', 23)
-        end = quiet.get('end', 7)
-
-        if start <= end:
-            # Simple range (e.g., 9-17)
-            return start <= current_hour < end
-        else:
-            # Overnight range (e.g., 23-7)
-            return current_hour >= start or current_hour < end
+        return bool(self._get_quiet_mask() >> (current_hour % 24) & 1)
 
     # Validation
-    def validate(self):
+    def validate_codes(self):
         """
         Validate configuration values.
 
         Returns:
-            List of validation error strings (empty if valid)
+            List of (code, message) tuples (empty if valid); the code is
+            a short tag such as 'brightness_range' for programmatic checks
         """
         errors = []
 
         # Brightness
         brightness = self.get('brightness')
         if not isinstance(brightness, int) or not 0 <= brightness <= 255:
-            errors.append("Brightness must be 0-255")
+            errors.append(('brightness_range', "Brightness must be 0-255"))
 
         # Update interval
         interval = self.get('update_interval')
         if not isinstance(interval, int) or not 30 <= interval <= 600:
-            errors.append("Update interval must be 30-600 seconds")
+            errors.append(('interval_range', "Update interval must be 30-600 seconds"))
 
         # Teams
         teams = self.get('teams')
         if not isinstance(teams, list):
-            errors.append("Teams must be a list")
+            errors.append(('teams_type', "Teams must be a list"))
         else:
             valid_sports = {'nfl', 'nba', 'mlb', 'nhl'}
             for i, team in enumerate(teams):
                 if not isinstance(team, dict):
-                    errors.append(f"Team {i} must be a dict")
+                    errors.append(('team_type', f"Team {i} must be a dict"))
                 elif team.get('sport', '').lower() not in valid_sports:
-                    errors.append(f"Team {i} has invalid sport")
+                    errors.append(('team_sport', f"Team {i} has invalid sport"))
                 elif not team.get('team_id'):
-                    errors.append(f"Team {i} missing team_id")
+                    errors.append(('team_id_missing', f"Team {i} missing team_id"))
 
         return errors
 
+    def validate(self):
+        """
+        Validate configuration values.
+
+        Returns:
+            List of validation error strings (empty if valid)
+        """
+        return [message for _, message in self.validate_codes()]
+
 
 # Singleton instance
 _config = None
@@ -304,7 +502,6 @@ def get_config():
     global _config
     if _config is None:
         _config = ConfigManager()
-        _config.load()
     return _config
 
 
@@ -313,10 +510,8 @@ if __name__ == '__main__':
     print("Config Manager Test")
     print("=" * 40)
 
-    config = ConfigManager('test_config.json')
-
     # Test defaults
-    config.load()
+    config = ConfigManager('test_config.json')
     print(f"Brightness: {config.get('brightness')}")
     print(f"Update interval: {config.get('update_interval')}")
 
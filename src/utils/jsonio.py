@@ -0,0 +1,37 @@
+"""
+JSON File Helpers
+
+Shared load/dump for the JSON files the ticker keeps on flash.
+
+Prefers orjson on CPython (native parser/encoder); MicroPython has no
+orjson and falls back to its built-in json module. Either way a document
+is serialized first and written with one write() call, rather than
+json.dump's many small writes through the file layer.
+
+Usage:
+    from utils.jsonio import load, dump
+
+    with open('config.json', 'w') as f:
+        dump(data, f)
+"""
+
+import json
+
+try:
+    import orjson
+
+    def load(f):
+        """Read a JSON document from an open file."""
+        return orjson.loads(f.read())
+
+    def dumps(obj):
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    load = json.load
+    dumps = json.dumps
+
+
+def dump(obj, f):
+    """Write obj to an open file as JSON with a single write()."""
+    f.write(dumps(obj))
@@ -15,6 +15,18 @@ Usage:
 import time
 import gc
 
+# Bound once so Timer/timed skip the attribute lookups; CPython has no
+# ticks_* functions, so fall back to a monotonic millisecond clock
+try:
+    _ticks_ms = time.ticks_ms
+    _ticks_diff = time.ticks_diff
+except AttributeError:
+    def _ticks_ms():
+        return int(time.monotonic() * 1000)
+
+    def _ticks_diff(a, b):
+        return a - b
+
 # Log levels
 DEBUG = 10
 INFO = 20
@@ -37,6 +49,21 @@ _log_file = None
 _max_file_size = 50000  # 50KB max log file
 _loggers = {}
 
+# Lines waiting to be appended to the log file, written in one go once
+# _FLUSH_THRESHOLD bytes have built up or an ERROR+ record arrives
+_FLUSH_THRESHOLD = 4096
+_file_buf = []
+_file_buf_bytes = 0
+
+# Log file handle, kept open while file logging is enabled, and the
+# file's size so rotation needs no os.stat per flush
+_log_file_fp = None
+_log_file_size = 0
+
+# Last formatted timestamp, reused for every log line in the same second
+_ts_cache_sec = -1
+_ts_cache_str = ""
+
 
 def set_level(level):
     """Set global log level."""
@@ -70,13 +97,121 @@ def enable_file_logging(filename='logs/debug.log', max_size=50000):
     except ImportError:
         pass
 
+    _open_log_file()
+
 
 def disable_file_logging():
     """Disable file logging."""
     global _file_logging
+    flush_logs()
+    _close_log_file()
     _file_logging = False
 
 
+def _open_log_file():
+    """
+    (Re)open the log file for appending and note its current size.
+
+    If the file can't be opened, file logging is turned off, so lines
+    are not buffered for a handle that will never exist.
+    """
+    global _log_file_fp, _log_file_size, _file_logging
+    _close_log_file()
+    try:
+        _log_file_fp = open(_log_file, 'a')
+        _log_file_fp.seek(0, 2)
+        _log_file_size = _log_file_fp.tell()
+    except Exception as e:
+        _log_file_fp = None
+        _file_logging = False
+        print(f"Log open error: {e}; file logging disabled")
+
+
+def _close_log_file():
+    """Close the log file handle if open."""
+    global _log_file_fp
+    if _log_file_fp is not None:
+        try:
+            _log_file_fp.close()
+        except Exception:
+            pass
+        _log_file_fp = None
+
+
+def flush_logs():
+    """Write any buffered log lines to the log file."""
+    global _file_buf, _file_buf_bytes, _log_file_size
+    if not _file_buf:
+        return
+
+    data = ''.join(_file_buf)
+    _file_buf = []
+    _file_buf_bytes = 0
+
+    if _log_file_fp is None:
+        return  # No file to write to; drop the lines rather than keep them
+
+    try:
+        _log_file_fp.write(data)
+        _log_file_fp.flush()
+
+        # Running byte count; rotate as soon as it passes the limit
+        _log_file_size += len(data)
+        if _log_file_size > _max_file_size:
+            _rotate_log()
+
+    except Exception as e:
+        print(f"Log write error: {e}")
+
+
+def _rotate_log():
+    """Rotate log file when it gets too large."""
+    _close_log_file()
+    try:
+        import os
+
+        # Delete old backup
+        try:
+            os.remove(_log_file + '.old')
+        except OSError:
+            pass
+
+        # Rename current to backup
+        try:
+            os.rename(_log_file, _log_file + '.old')
+        except OSError:
+            pass
+
+    except ImportError:
+        pass
+
+    _open_log_file()
+
+
+# Flush buffered lines at interpreter exit where supported (CPython;
+# MicroPython has no atexit, so main.py's shutdown() and
+# OTAUpdater.restart_device() flush before stopping or resetting)
+try:
+    import atexit
+    atexit.register(flush_logs)
+except ImportError:
+    pass
+
+
+def _timestamp():
+    """Get the current time as HH:MM:SS, formatting at most once a second."""
+    global _ts_cache_sec, _ts_cache_str
+    try:
+        now = int(time.time())
+        if now != _ts_cache_sec:
+            t = time.localtime(now)
+            _ts_cache_str = "{:02d}:{:02d}:{:02d}".format(t[3], t[4], t[5])
+            _ts_cache_sec = now
+        return _ts_cache_str
+    except (OSError, OverflowError, ValueError):
+        return "??:??:??"
+
+
 class Logger:
     """Simple logger with module name prefix."""
 
@@ -101,112 +236,86 @@ class Logger:
         """Set logger-specific level."""
         self._level = value
 
-    def _log(self, level, message, *args):
+    def _log(self, level, level_name, message, *args):
         """
         Internal log method.
 
         Args:
             level: Log level
+            level_name: Display name for the level (from LEVEL_NAMES)
             message: Message string (can use % formatting)
             args: Format arguments
         """
-        if level < self.level:
+        # Inlined self.level: skips the property call for filtered lines
+        if level < (self._level if self._level is not None else _global_level):
             return
 
-        # Format message
-        if args:
+        # Format message; a bad format string logs the raw message
+        if args and '%' in message:
             try:
                 message = message % args
-            except:
+            except (TypeError, ValueError):
                 pass
 
         # Get timestamp
-        try:
-            t = time.localtime()
-            timestamp = "{:02d}:{:02d}:{:02d}".format(t[3], t[4], t[5])
-        except:
-            timestamp = "??:??:??"
+        timestamp = _timestamp()
 
         # Build log line
-        level_name = LEVEL_NAMES.get(level, '???')
-        line = f"[{timestamp}] {level_name} {self.name}: {message}"
+        line = "[%s] %s %s: %s" % (timestamp, level_name, self.name, message)
 
         # Print to console
         print(line)
 
         # Write to file if enabled
         if _file_logging and _log_file:
-            self._write_to_file(line)
+            self._write_to_file(line, level)
 
-    def _write_to_file(self, line):
-        """Write log line to file."""
-        try:
-            # Check file size and rotate if needed
-            try:
-                import os
-                size = os.stat(_log_file)[6]
-                if size > _max_file_size:
-                    self._rotate_log()
-            except OSError:
-                pass  # File doesn't exist yet
-
-            # Append to file
-            with open(_log_file, 'a') as f:
-                f.write(line + '\n')
+    def _write_to_file(self, line, level=INFO):
+        """Buffer a log line for the file, flushing when due."""
+        global _file_buf_bytes
+        _file_buf.append(line + '\n')
+        _file_buf_bytes += len(line) + 1
 
-        except Exception as e:
-            print(f"Log write error: {e}")
-
-    def _rotate_log(self):
-        """Rotate log file when it gets too large."""
-        try:
-            import os
-
-            # Delete old backup
-            try:
-                os.remove(_log_file + '.old')
-            except OSError:
-                pass
-
-            # Rename current to backup
-            try:
-                os.rename(_log_file, _log_file + '.old')
-            except OSError:
-                pass
-
-        except ImportError:
-            pass
+        # Errors go out immediately so they survive a crash or reset
+        if level >= ERROR or _file_buf_bytes >= _FLUSH_THRESHOLD:
+            flush_logs()
 
     def debug(self, message, *args):
         """Log debug message."""
-        self._log(DEBUG, message, *args)
+        if DEBUG >= (self._level if self._level is not None else _global_level):
+            self._log(DEBUG, 'DEBUG', message, *args)
 
     def info(self, message, *args):
         """Log info message."""
-        self._log(INFO, message, *args)
+        if INFO >= (self._level if self._level is not None else _global_level):
+            self._log(INFO, 'INFO', message, *args)
 
     def warning(self, message, *args):
         """Log warning message."""
-        self._log(WARNING, message, *args)
+        if WARNING >= (self._level if self._level is not None else _global_level):
+            self._log(WARNING, 'WARN', message, *args)
 
     def warn(self, message, *args):
         """Log warning message (alias)."""
-        self._log(WARNING, message, *args)
+        if WARNING >= (self._level if self._level is not None else _global_level):
+            self._log(WARNING, 'WARN', message, *args)
 
     def error(self, message, *args):
         """Log error message."""
-        self._log(ERROR, message, *args)
+        if ERROR >= (self._level if self._level is not None else _global_level):
+            self._log(ERROR, 'ERROR', message, *args)
 
     def critical(self, message, *args):
         """Log critical message."""
-        self._log(CRITICAL, message, *args)
+        if CRITICAL >= (self._level if self._level is not None else _global_level):
+            self._log(CRITICAL, 'CRIT', message, *args)
 
     def exception(self, message, exc=None):
         """Log error with exception info."""
         if exc:
-            self._log(ERROR, f"{message}: {type(exc).__name__}: {exc}")
+            self._log(ERROR, 'ERROR', f"{message}: {type(exc).__name__}: {exc}")
         else:
-            self._log(ERROR, message)
+            self._log(ERROR, 'ERROR', message)
 
 
 def get_logger(name):
@@ -228,25 +337,50 @@ def get_logger(name):
 
 
 # Memory monitoring helpers
+
+# Minimum spacing between the manual collections done below; a full
+# sweep is O(heap) and these helpers are often called every loop pass
+_GC_INTERVAL_MS = 5000
+_last_gc_ms = None
+
+
+def _collect_if_due():
+    """
+    Run gc.collect() unless one ran within the last _GC_INTERVAL_MS.
+
+    Returns:
+        True if a collection ran
+    """
+    global _last_gc_ms
+    now = _ticks_ms()
+    if _last_gc_ms is not None and _ticks_diff(now, _last_gc_ms) < _GC_INTERVAL_MS:
+        return False
+    gc.collect()
+    _last_gc_ms = now
+    return True
+
+
 def log_memory(logger=None):
     """Log current memory usage."""
-    gc.collect()
+    _collect_if_due()
     free = gc.mem_free()
-    alloc = gc.mem_alloc()
-    total = free + alloc
+    total = free + gc.mem_alloc()
+    pct = free * 100 / total
 
     if logger:
-        logger.debug("Memory: %d/%d bytes free (%.1f%%)",
-                     free, total, (free / total) * 100)
+        logger.debug("Memory: %d/%d bytes free (%.1f%%)", free, total, pct)
     else:
-        print(f"Memory: {free}/{total} bytes free ({(free/total)*100:.1f}%)")
+        print("Memory: %d/%d bytes free (%.1f%%)" % (free, total, pct))
 
 
 def log_memory_if_low(threshold=10000, logger=None):
     """Log memory warning if free memory is below threshold."""
-    gc.collect()
     free = gc.mem_free()
 
+    # Only pay for a collection when the uncollected figure looks low
+    if free < threshold and _collect_if_due():
+        free = gc.mem_free()
+
     if free < threshold:
         if logger:
             logger.warning("Low memory: %d bytes free", free)
@@ -273,12 +407,12 @@ class Timer:
         self.start_time = None
 
     def __enter__(self):
-        self.start_time = time.ticks_ms()
+        self.start_time = _ticks_ms()
         return self
 
     def __exit__(self, *args):
-        elapsed = time.ticks_diff(time.ticks_ms(), self.start_time)
-        message = f"{self.name} took {elapsed}ms"
+        elapsed = _ticks_diff(_ticks_ms(), self.start_time)
+        message = "%s took %dms" % (self.name, elapsed)
 
         if self.logger:
             self.logger.debug(message)
@@ -323,11 +457,11 @@ def timed(logger_name):
     def decorator(func):
         def wrapper(*args, **kwargs):
             log = get_logger(logger_name)
-            start = time.ticks_ms()
+            start = _ticks_ms()
             try:
                 return func(*args, **kwargs)
             finally:
-                elapsed = time.ticks_diff(time.ticks_ms(), start)
+                elapsed = _ticks_diff(_ticks_ms(), start)
                 log.debug("%s took %dms", func.__name__, elapsed)
         return wrapper
     return decorator
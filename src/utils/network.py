@@ -22,6 +22,12 @@ try:
 except ImportError:
     NETWORK_AVAILABLE = False
 
+# ifconfig() result reported while disconnected or off-device
+_NO_IFCONFIG = ('0.0.0.0', '0.0.0.0', '0.0.0.0', '0.0.0.0')
+
+# How long an ifconfig() result is reused before asking the driver again
+_IFCONFIG_TTL_MS = 1000
+
 
 class NetworkManager:
     """Manages WiFi connectivity."""
@@ -42,6 +48,10 @@ class NetworkManager:
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 5
         self._check_interval = 30  # seconds
+        self._ifc_cache = None
+        self._ifc_cache_t = 0
+        self._mac_str = None
+        self._is_conn_cached = False  # Last isconnected() seen by check_connection
 
         if NETWORK_AVAILABLE:
             self._wlan = network.WLAN(network.STA_IF)
@@ -67,6 +77,7 @@ class NetworkManager:
         self._password = password
         self._state = self.STATE_CONNECTING
         self._reconnect_attempts = 0
+        self._ifc_cache = None
 
         print(f"Network: Connecting to {ssid}...")
 
@@ -107,6 +118,7 @@ class NetworkManager:
 
         self._state = self.STATE_CONNECTED
         self._last_check = time.time()
+        self._is_conn_cached = True
         gc.collect()
 
         print(f"Network: Connected! IP: {self.ip_address}")
@@ -121,6 +133,8 @@ class NetworkManager:
             self._wlan.disconnect()
         self._wlan.active(False)
         self._state = self.STATE_DISCONNECTED
+        self._ifc_cache = None
+        self._is_conn_cached = False
         print("Network: Disconnected")
 
     @property
@@ -130,54 +144,64 @@ class NetworkManager:
             return False
         return self._wlan.isconnected()
 
+    def _get_ifconfig(self, connected=None):
+        """
+        Get the (ip, subnet, gateway, dns) tuple, reusing it for up to 1s.
+
+        Args:
+            connected: Result of isconnected() if the caller already has it
+
+        Returns:
+            ifconfig() tuple, or all zeros when not connected
+        """
+        if not NETWORK_AVAILABLE or not self._wlan:
+            return _NO_IFCONFIG
+
+        now = time.ticks_ms()
+        if (self._ifc_cache is not None and
+                time.ticks_diff(now, self._ifc_cache_t) < _IFCONFIG_TTL_MS):
+            return self._ifc_cache
+
+        if connected is None:
+            connected = self._wlan.isconnected()
+        ifc = self._wlan.ifconfig() if connected else _NO_IFCONFIG
+        self._ifc_cache = ifc
+        self._ifc_cache_t = now
+        return ifc
+
     @property
     def ip_address(self):
         """Get current IP address."""
-        if not NETWORK_AVAILABLE or not self._wlan:
-            return "0.0.0.0"
-
-        if self._wlan.isconnected():
-            return self._wlan.ifconfig()[0]
-        return "0.0.0.0"
+        return self._get_ifconfig()[0]
 
     @property
     def subnet_mask(self):
         """Get subnet mask."""
-        if not NETWORK_AVAILABLE or not self._wlan:
-            return "0.0.0.0"
-
-        if self._wlan.isconnected():
-            return self._wlan.ifconfig()[1]
-        return "0.0.0.0"
+        return self._get_ifconfig()[1]
 
     @property
     def gateway(self):
         """Get gateway address."""
-        if not NETWORK_AVAILABLE or not self._wlan:
-            return "0.0.0.0"
-
-        if self._wlan.isconnected():
-            return self._wlan.ifconfig()[2]
-        return "0.0.0.0"
+        return self._get_ifconfig()[2]
 
     @property
     def dns_server(self):
         """Get DNS server address."""
-        if not NETWORK_AVAILABLE or not self._wlan:
-            return "0.0.0.0"
-
-        if self._wlan.isconnected():
-            return self._wlan.ifconfig()[3]
-        return "0.0.0.0"
+        return self._get_ifconfig()[3]
 
     @property
     def mac_address(self):
-        """Get MAC address as string."""
+        """Get MAC address as string (read once; the hardware MAC is fixed)."""
+        if self._mac_str:
+            return self._mac_str
+
         if not NETWORK_AVAILABLE or not self._wlan:
             return "00:00:00:00:00:00"
 
         mac = self._wlan.config('mac')
-        return ':'.join('{:02x}'.format(b) for b in mac)
+        self._mac_str = "%02x:%02x:%02x:%02x:%02x:%02x" % (
+            mac[0], mac[1], mac[2], mac[3], mac[4], mac[5])
+        return self._mac_str
 
     @property
     def rssi(self):
@@ -187,7 +211,7 @@ class NetworkManager:
 
         try:
             return self._wlan.status('rssi')
-        except:
+        except (OSError, ValueError):
             return -100
 
     @property
@@ -220,19 +244,22 @@ class NetworkManager:
 
         current_time = time.time()
 
-        # Only check periodically
+        # Only check periodically; in between, report the last result
+        # without going back into the driver
         if current_time - self._last_check < self._check_interval:
-            return self.is_connected
+            return self._is_conn_cached
 
         self._last_check = current_time
 
         if self._wlan.isconnected():
             self._state = self.STATE_CONNECTED
             self._reconnect_attempts = 0
+            self._is_conn_cached = True
             return True
 
         # Not connected, try to reconnect
-        return self._attempt_reconnect()
+        self._is_conn_cached = self._attempt_reconnect()
+        return self._is_conn_cached
 
     def _attempt_reconnect(self):
         """Attempt to reconnect to WiFi."""
@@ -284,21 +311,15 @@ class NetworkManager:
         Returns:
             List of network info dicts
         """
-        raw_networks = self.scan()
-        networks = []
-
-        for net in raw_networks:
-            ssid = net[0].decode('utf-8') if isinstance(net[0], bytes) else net[0]
-            networks.append({
-                'ssid': ssid,
-                'rssi': net[3],
-                'channel': net[2],
-                'security': 'Open' if net[4] == 0 else 'Secured'
-            })
-
-        # Sort by signal strength
-        networks.sort(key=lambda x: x['rssi'], reverse=True)
-        return networks
+        # Sort the raw tuples on RSSI before building any dicts
+        raw_networks = sorted(self.scan(), key=lambda n: n[3], reverse=True)
+
+        return [{
+            'ssid': net[0].decode('utf-8') if isinstance(net[0], bytes) else net[0],
+            'rssi': net[3],
+            'channel': net[2],
+            'security': 'Open' if net[4] == 0 else 'Secured'
+        } for net in raw_networks]
 
     def get_status(self):
         """
@@ -307,16 +328,18 @@ class NetworkManager:
         Returns:
             Dict with network status info
         """
+        connected = self.is_connected
+        ip, subnet, gateway, dns = self._get_ifconfig(connected)
         return {
-            'connected': self.is_connected,
+            'connected': connected,
             'state': self.state_string,
             'ssid': self._ssid or 'None',
-            'ip': self.ip_address,
-            'subnet': self.subnet_mask,
-            'gateway': self.gateway,
-            'dns': self.dns_server,
+            'ip': ip,
+            'subnet': subnet,
+            'gateway': gateway,
+            'dns': dns,
             'mac': self.mac_address,
-            'rssi': self.rssi,
+            'rssi': self.rssi if connected else -100,
             'reconnect_attempts': self._reconnect_attempts,
         }
 
@@ -20,6 +20,21 @@ except ImportError:
 
 # Default timezone offset (Eastern Time)
 _timezone_offset = -5  # Hours from UTC
+_timezone_offset_seconds = _timezone_offset * 3600
+
+# Local time tuple for the last whole second it was computed for, so
+# repeated queries within a second share one localtime() call
+_last_sec = -1
+_last_local = None
+
+# is_dst() result for the (year, month, day) it was computed for
+_dst_cache = (None, None, None, False)
+
+# parse_game_time() results keyed by the API time string; the same
+# games are formatted on every render pass. Oldest entries go first.
+_PARSE_CACHE_SIZE = 32
+_parse_cache = {}
+_parse_order = []
 
 
 def set_timezone(offset):
@@ -29,8 +44,12 @@ def set_timezone(offset):
     Args:
         offset: Hours offset (e.g., -5 for EST, -8 for PST)
     """
-    global _timezone_offset
+    global _timezone_offset, _timezone_offset_seconds, _last_sec
     _timezone_offset = offset
+    _timezone_offset_seconds = offset * 3600
+    _last_sec = -1  # Cached local time used the old offset
+    _parse_cache.clear()
+    del _parse_order[:]
 
 
 def get_timezone():
@@ -79,9 +98,12 @@ def get_local_time():
     Returns:
         Time tuple (year, month, day, hour, minute, second, weekday, yearday)
     """
-    utc = time.time()
-    local = utc + (_timezone_offset * 3600)
-    return time.localtime(local)
+    global _last_sec, _last_local
+    utc = int(time.time())
+    if utc != _last_sec:
+        _last_local = time.localtime(utc + _timezone_offset_seconds)
+        _last_sec = utc
+    return _last_local
 
 
 def get_hour():
@@ -141,14 +163,9 @@ def format_time_12h(t=None):
         t = get_local_time()
 
     hour = t[3]
-    minute = t[4]
 
-    period = "AM" if hour < 12 else "PM"
-    hour_12 = hour % 12
-    if hour_12 == 0:
-        hour_12 = 12
-
-    return f"{hour_12}:{minute:02d} {period}"
+    # 0 -> 12, 13 -> 1, ...
+    return "%d:%02d %s" % ((hour + 11) % 12 + 1, t[4], ('AM', 'PM')[hour >= 12])
 
 
 def format_date(t=None, short=False):
@@ -200,7 +217,18 @@ def is_dst():
     Returns:
         True if DST is in effect
     """
+    global _dst_cache
     t = get_local_time()
+    if t[:3] == _dst_cache[:3]:
+        return _dst_cache[3]
+
+    result = _is_dst(t)
+    _dst_cache = (t[0], t[1], t[2], result)
+    return result
+
+
+def _is_dst(t):
+    """Evaluate the US DST rules for a local time tuple."""
     month = t[1]
     day = t[2]
     weekday = t[6]  # 0=Monday
@@ -242,20 +270,15 @@ def seconds_until(hour, minute=0):
     Returns:
         Seconds until target time (may be next day)
     """
+    # Shared per-second tuple; read the fields in place
     now = get_local_time()
-    current_hour = now[3]
-    current_minute = now[4]
-    current_second = now[5]
-
-    # Convert to seconds since midnight
-    current_secs = current_hour * 3600 + current_minute * 60 + current_second
-    target_secs = hour * 3600 + minute * 60
 
-    diff = target_secs - current_secs
+    # Seconds since midnight
+    diff = (hour * 3600 + minute * 60) - (now[3] * 3600 + now[4] * 60 + now[5])
 
     # If target is in the past, add a day
     if diff <= 0:
-        diff += 24 * 3600
+        diff += 86400
 
     return diff
 
@@ -303,17 +326,32 @@ def parse_game_time(time_str):
     Returns:
         Local time tuple or None
     """
-    try:
-        # Simple ISO parsing (MicroPython compatible)
-        # Format: "2024-12-25T13:00:00Z"
-        date_part, time_part = time_str.replace('Z', '').split('T')
+    if time_str in _parse_cache:
+        return _parse_cache[time_str]
+
+    local = _parse_game_time(time_str)
 
-        year, month, day = map(int, date_part.split('-'))
-        hour, minute, second = map(int, time_part.split(':')[:3])
+    if len(_parse_order) >= _PARSE_CACHE_SIZE:
+        del _parse_cache[_parse_order.pop(0)]
+    _parse_cache[time_str] = local
+    _parse_order.append(time_str)
+    return local
+
+
+def _parse_game_time(time_str):
+    """Uncached parse behind parse_game_time()."""
+    try:
+        # Fixed-width ISO layout: "2024-12-25T13:00:00Z"
+        year = int(time_str[0:4])
+        month = int(time_str[5:7])
+        day = int(time_str[8:10])
+        hour = int(time_str[11:13])
+        minute = int(time_str[14:16])
+        second = int(time_str[17:19])
 
         # Convert from UTC to local
         utc_secs = time.mktime((year, month, day, hour, minute, second, 0, 0))
-        local_secs = utc_secs + (_timezone_offset * 3600)
+        local_secs = utc_secs + _timezone_offset_seconds
 
         return time.localtime(local_secs)
 
@@ -1,3 +1,3 @@
 # Web module - HTTP server and routes
-from .server import WebServer
+from .server import WebServer, Request, JsonBytes
 from .routes import setup_routes
@@ -14,14 +14,68 @@ Usage:
     setup_routes(server, app)
 """
 
-import json
+import time
+
+# C JSON codec on MicroPython; stdlib json on desktop Python
+try:
+    import ujson as json
+except ImportError:
+    import json
+from .server import JsonBytes
 from .templates import (
     HOME_PAGE,
     TEAMS_PAGE,
     SETTINGS_PAGE,
+    STYLE_CSS,
     render_template,
+    render_template_gz,
 )
 
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+
+# Setting defaults; underscore const() names compile to immediates
+_DEF_BRIGHT = const(128)
+_DEF_INTERVAL = const(120)
+_DEF_TZ = const(-5)
+
+# Shared read-only stand-in for a missing team list
+_EMPTY = ()
+
+# CPython has no ticks_* functions; fall back to a monotonic ms clock
+try:
+    _ticks_ms = time.ticks_ms
+    _ticks_diff = time.ticks_diff
+except AttributeError:
+    def _ticks_ms():
+        return int(time.monotonic() * 1000)
+
+    def _ticks_diff(a, b):
+        return a - b
+
+# Encoded /api/status and /api/games replies, reused for _CACHE_TTL_MS
+# so dashboards polling every second don't rebuild them each time.
+# The games entry is also keyed on the app.current_games list it was
+# built from, which check_scores() replaces when new data arrives.
+_CACHE_TTL_MS = const(1000)
+_status_cache = {'ts': 0, 'body': None}
+_games_cache = {'ts': 0, 'body': None, 'src': None}
+
+# The stylesheet only changes with a firmware update; pages link it as
+# /style.css?v=<content hash>, so a changed stylesheet is a new URL
+_CSS_HEADERS = (b'Content-Type: text/css\r\n'
+                b'Cache-Control: max-age=31536000, immutable\r\n'
+                b'Connection: close\r\n')
+
+# Pages sent to clients whose Accept-Encoding includes gzip
+_GZ_HTML_HEADERS = (b'Content-Type: text/html; charset=utf-8\r\n'
+                    b'Content-Encoding: gzip\r\n'
+                    b'Vary: Accept-Encoding\r\n'
+                    b'Connection: close\r\n')
+
 
 def setup_routes(server, app):
     """
@@ -31,13 +85,19 @@ def setup_routes(server, app):
         server: WebServer instance
         app: SportsTicker application instance
     """
+    # Fixed for the life of the app; looked up once here rather than
+    # on every request
+    version = getattr(app, '__version__', '1.0.0')
+    wifi = getattr(app, 'wifi', None)
+
     # HTML Pages
-    server.route('/', lambda r: handle_home(r, app), ['GET'])
+    server.route('/', lambda r: handle_home(r, app, version, wifi), ['GET'])
     server.route('/teams', lambda r: handle_teams_page(r, app), ['GET'])
     server.route('/settings', lambda r: handle_settings_page(r, app), ['GET'])
+    server.route('/style.css', handle_style, ['GET'])
 
     # API Endpoints
-    server.route('/api/status', lambda r: handle_api_status(r, app), ['GET'])
+    server.route('/api/status', lambda r: handle_api_status(r, app, version, wifi), ['GET'])
     server.route('/api/config', lambda r: handle_api_config(r, app), ['GET', 'POST'])
     server.route('/api/teams', lambda r: handle_api_teams(r, app), ['GET', 'POST', 'DELETE'])
     server.route('/api/settings', lambda r: handle_api_settings(r, app), ['GET', 'POST'])
@@ -59,65 +119,96 @@ def setup_routes(server, app):
 
 # === HTML Page Handlers ===
 
-def handle_home(request, app):
+def _page_response(request, page, info):
+    """Render a page, gzipped when the client accepts it."""
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        body = render_template_gz(page, info)
+        if body is not None:
+            return ('200 OK', _GZ_HTML_HEADERS, body)
+    return render_template(page, info)
+
+
+def handle_home(request, app, version='1.0.0', wifi=None):
     """Render home page."""
     # Get system info
+    cfg = app.config
     info = {
-        'version': app.__version__ if hasattr(app, '__version__') else '1.0.0',
-        'ip': app.wifi.ip_address if app.wifi else 'Not connected',
-        'teams_count': len(app.config.get('teams', [])) if app.config else 0,
-        'games_count': len(app.current_games) if hasattr(app, 'current_games') else 0,
+        'version': version,
+        'ip': wifi.ip_address if wifi else 'Not connected',
+        'teams_count': len(cfg.get('teams', _EMPTY)) if cfg else 0,
+        'games_count': len(getattr(app, 'current_games', _EMPTY)),
     }
-    return render_template(HOME_PAGE, info)
+    return _page_response(request, HOME_PAGE, info)
 
 
 def handle_teams_page(request, app):
     """Render teams configuration page."""
+    cfg = app.config
     info = {
-        'teams': app.config.get('teams', []) if app.config else [],
+        'teams': cfg.get('teams', _EMPTY) if cfg else _EMPTY,
     }
-    return render_template(TEAMS_PAGE, info)
+    return _page_response(request, TEAMS_PAGE, info)
 
 
 def handle_settings_page(request, app):
     """Render settings page."""
-    info = {
-        'brightness': app.config.get('brightness', 128) if app.config else 128,
-        'update_interval': app.config.get('update_interval', 120) if app.config else 120,
-        'proxy_url': app.config.get('proxy_url', '') if app.config else '',
-    }
-    return render_template(SETTINGS_PAGE, info)
+    cfg = app.config
+    if cfg:
+        info = {
+            'brightness': cfg.get('brightness', _DEF_BRIGHT),
+            'update_interval': cfg.get('update_interval', _DEF_INTERVAL),
+            'proxy_url': cfg.get('proxy_url', ''),
+        }
+    else:
+        info = {
+            'brightness': _DEF_BRIGHT,
+            'update_interval': _DEF_INTERVAL,
+            'proxy_url': '',
+        }
+    return _page_response(request, SETTINGS_PAGE, info)
+
+
+def handle_style(request):
+    """Serve the shared stylesheet."""
+    return ('200 OK', _CSS_HEADERS, STYLE_CSS)
 
 
 # === API Handlers ===
 
-def handle_api_status(request, app):
+def handle_api_status(request, app, version='1.0.0', wifi=None):
     """Return system status."""
     import gc
 
+    now = _ticks_ms()
+    if (_status_cache['body'] is not None and
+            _ticks_diff(now, _status_cache['ts']) < _CACHE_TTL_MS):
+        return JsonBytes(_status_cache['body'])
+
     status = {
         'status': 'ok',
-        'version': getattr(app, '__version__', '1.0.0'),
-        'wifi_connected': app.wifi.is_connected if app.wifi else False,
-        'ip_address': app.wifi.ip_address if app.wifi else None,
+        'version': version,
+        'wifi_connected': wifi.is_connected if wifi else False,
+        'ip_address': wifi.ip_address if wifi else None,
         'free_memory': gc.mem_free(),
-        'games_active': len(app.current_games) if hasattr(app, 'current_games') else 0,
+        'games_active': len(getattr(app, 'current_games', _EMPTY)),
     }
 
-    return status
+    body = json.dumps(status).encode('utf-8')
+    _status_cache['ts'] = now
+    _status_cache['body'] = body
+    return JsonBytes(body)
 
 
 def handle_api_config(request, app):
     """Get or set configuration."""
-    if request['method'] == 'GET':
+    if request.method == 'GET':
         return app.config.data if app.config else {}
 
-    elif request['method'] == 'POST':
+    elif request.method == 'POST':
         try:
-            body = json.loads(request['body'])
+            body = json.loads(request.body)
             if app.config:
                 app.config.update(body)
-                app.config.save()
             return {'status': 'ok', 'message': 'Config saved'}
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
@@ -125,13 +216,13 @@ def handle_api_config(request, app):
 
 def handle_api_teams(request, app):
     """Manage team list."""
-    if request['method'] == 'GET':
-        teams = app.config.get('teams', []) if app.config else []
-        return {'teams': teams}
+    if request.method == 'GET':
+        cfg = app.config
+        return {'teams': cfg.get('teams', _EMPTY) if cfg else _EMPTY}
 
-    elif request['method'] == 'POST':
+    elif request.method == 'POST':
         try:
-            body = json.loads(request['body'])
+            body = json.loads(request.body)
             team = {
                 'sport': body.get('sport', 'nfl'),
                 'team_id': body.get('team_id', '').upper(),
@@ -142,29 +233,29 @@ def handle_api_teams(request, app):
             if app.config:
                 teams = app.config.get('teams', [])
                 # Check for duplicate
-                for t in teams:
-                    if t['team_id'] == team['team_id'] and t['sport'] == team['sport']:
-                        return {'status': 'error', 'message': 'Team already exists'}
-                teams.append(team)
-                app.config.set('teams', teams)
-                app.config.save()
+                existing = {(t['team_id'], t['sport']) for t in teams}
+                if (team['team_id'], team['sport']) in existing:
+                    return {'status': 'error', 'message': 'Team already exists'}
+                app.config.set('teams', teams + [team])
 
             return {'status': 'ok', 'message': 'Team added', 'team': team}
 
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
 
-    elif request['method'] == 'DELETE':
+    elif request.method == 'DELETE':
         try:
-            body = json.loads(request['body'])
+            body = json.loads(request.body)
             team_id = body.get('team_id', '').upper()
             sport = body.get('sport', 'nfl')
 
             if app.config:
                 teams = app.config.get('teams', [])
-                teams = [t for t in teams if not (t['team_id'] == team_id and t['sport'] == sport)]
+                target = (team_id, sport)
+                if target not in {(t['team_id'], t['sport']) for t in teams}:
+                    return {'status': 'error', 'message': 'Team not found'}
+                teams = [t for t in teams if (t['team_id'], t['sport']) != target]
                 app.config.set('teams', teams)
-                app.config.save()
 
             return {'status': 'ok', 'message': 'Team removed'}
 
@@ -174,19 +265,27 @@ def handle_api_teams(request, app):
 
 def handle_api_settings(request, app):
     """Get or update settings."""
-    if request['method'] == 'GET':
-        settings = {
-            'brightness': app.config.get('brightness', 128) if app.config else 128,
-            'update_interval': app.config.get('update_interval', 120) if app.config else 120,
-            'auto_updates': app.config.get('auto_updates', True) if app.config else True,
-            'timezone_offset': app.config.get('timezone_offset', -5) if app.config else -5,
-            'proxy_url': app.config.get('proxy_url', '') if app.config else '',
+    if request.method == 'GET':
+        cfg = app.config
+        if not cfg:
+            return {
+                'brightness': _DEF_BRIGHT,
+                'update_interval': _DEF_INTERVAL,
+                'auto_updates': True,
+                'timezone_offset': _DEF_TZ,
+                'proxy_url': '',
+            }
+        return {
+            'brightness': cfg.get('brightness', _DEF_BRIGHT),
+            'update_interval': cfg.get('update_interval', _DEF_INTERVAL),
+            'auto_updates': cfg.get('auto_updates', True),
+            'timezone_offset': cfg.get('timezone_offset', _DEF_TZ),
+            'proxy_url': cfg.get('proxy_url', ''),
         }
-        return settings
 
-    elif request['method'] == 'POST':
+    elif request.method == 'POST':
         try:
-            body = json.loads(request['body'])
+            body = json.loads(request.body)
 
             if app.config:
                 if 'brightness' in body:
@@ -203,8 +302,6 @@ def handle_api_settings(request, app):
                     if app.api:
                         app.api.proxy_url = body['proxy_url'].strip() or None
 
-                app.config.save()
-
                 # Apply brightness immediately
                 if app.display and 'brightness' in body:
                     app.display.set_brightness(int(body['brightness']))
@@ -217,8 +314,18 @@ def handle_api_settings(request, app):
 
 def handle_api_games(request, app):
     """Get current games."""
-    games = app.current_games if hasattr(app, 'current_games') else []
-    return {'games': games}
+    games = getattr(app, 'current_games', _EMPTY)
+
+    now = _ticks_ms()
+    if (_games_cache['body'] is not None and _games_cache['src'] is games and
+            _ticks_diff(now, _games_cache['ts']) < _CACHE_TTL_MS):
+        return JsonBytes(_games_cache['body'])
+
+    body = json.dumps({'games': games}).encode('utf-8')
+    _games_cache['ts'] = now
+    _games_cache['body'] = body
+    _games_cache['src'] = games
+    return JsonBytes(body)
 
 
 # === OTA Update Handlers ===
@@ -229,7 +336,7 @@ def handle_update_check(request, app):
         return {'status': 'error', 'message': 'OTA not configured'}
 
     try:
-        has_update = app.ota.check_for_update()
+        has_update = app.ota.check_for_update(force=True)
         return {
             'update_available': has_update,
             'current_version': app.ota.current_version,
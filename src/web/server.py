@@ -16,9 +16,110 @@ Usage:
 """
 
 import socket
-import json
+import sys
+import time
 import gc
 
+# C JSON codec on MicroPython; stdlib json on desktop Python
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+# The native emitter is picked up from the literal @micropython.native
+# decorator; on desktop Python it is a no-op
+try:
+    import micropython
+except ImportError:
+    class micropython:
+        @staticmethod
+        def native(func):
+            return func
+
+# Route keys are interned where the port supports it (CPython; most
+# MicroPython builds lack sys.intern and already store literal paths as
+# qstrs). Request paths are never interned: they are client-controlled,
+# and an intern pool only grows.
+_intern = getattr(sys, 'intern', lambda s: s)
+
+# Canonical method strings, so a parsed method and a route key are the
+# same object and tuple key comparison short-circuits on identity
+_METHODS = {m: m for m in ('GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS', 'PATCH')}
+
+# CPython has no ticks_* functions; fall back to a monotonic ms clock
+try:
+    _ticks_ms = time.ticks_ms
+    _ticks_diff = time.ticks_diff
+except AttributeError:
+    def _ticks_ms():
+        return int(time.monotonic() * 1000)
+
+    def _ticks_diff(a, b):
+        return a - b
+
+# After a request the heap is only collected straight away when free
+# memory is below GC_FREE_THRESHOLD; otherwise the collection waits for
+# an idle poll at least IDLE_GC_DELAY_MS later
+GC_FREE_THRESHOLD = 16384
+IDLE_GC_DELAY_MS = 1000
+
+# Largest request body read; anything beyond is left unread
+RX_MAX_SIZE = 32768
+
+# Size of the reused send buffer: one TCP segment. Responses are
+# gathered into it and sent a full segment at a time
+TX_COALESCE_SIZE = 1460
+
+_STATUS_200 = b'HTTP/1.1 200 OK\r\n'
+
+# Pre-serialized header blocks for the server's own replies; response
+# tuples may carry header bytes like these in place of a dict
+_HDR_JSON = b'Content-Type: application/json\r\nConnection: close\r\n'
+_HDR_HTML = b'Content-Type: text/html; charset=utf-8\r\nConnection: close\r\n'
+
+
+class Request:
+    """Parsed HTTP request passed to route handlers."""
+
+    __slots__ = ('method', 'path', 'query_string', 'headers', 'body')
+
+    def __init__(self, method, path, query_string, headers, body):
+        """
+        Args:
+            method: Upper-case HTTP method
+            path: URL path without the query string
+            query_string: Raw query string ('' if none)
+            headers: Dict of lower-cased header names to values
+            body: Raw request body bytes (JSON decoders accept bytes)
+        """
+        self.method = method
+        self.path = path
+        self.query_string = query_string
+        self.headers = headers
+        self.body = body
+
+    # Dict-style access for handlers written against the old dict form
+    def __getitem__(self, key):
+        """Get a field by name, as request['path']."""
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        """Get a field by name, or default if there is no such field."""
+        return getattr(self, key, default)
+
+
+class JsonBytes:
+    """Handler result holding an already-serialized JSON body."""
+
+    __slots__ = ('body',)
+
+    def __init__(self, body):
+        """
+        Args:
+            body: Encoded JSON (bytes or str)
+        """
+        self.body = body
+
 
 class WebServer:
     """Simple HTTP server for MicroPython."""
@@ -31,9 +132,16 @@ class WebServer:
             port: Port to listen on (default 80)
         """
         self.port = port
-        self.routes = {}
+        self.routes = {}          # (method, path) -> handler
+        self.known_paths = set()  # Exact paths, to tell 405 from 404
+        self.wildcards = []       # (prefix, methods, handler) for '/*' routes
         self.socket = None
         self.running = False
+        self._gc_due = None  # ticks_ms of the request awaiting a collect
+        # Send buffer reused by every response (requests are served one
+        # at a time)
+        self._txbuf = bytearray(TX_COALESCE_SIZE)
+        self._txview = memoryview(self._txbuf)
 
     def route(self, path, handler, methods=None):
         """
@@ -46,11 +154,18 @@ class WebServer:
         """
         if methods is None:
             methods = ['GET', 'POST', 'PUT', 'DELETE']
+        methods = [_METHODS.get(m.upper(), m.upper()) for m in methods]
+        path = _intern(path)
 
-        self.routes[path] = {
-            'handler': handler,
-            'methods': [m.upper() for m in methods]
-        }
+        if path.endswith('/*'):
+            self.wildcards.append((path[:-2], set(methods), handler))
+            # Longest prefix first, so the most specific route wins
+            self.wildcards.sort(key=lambda w: len(w[0]), reverse=True)
+            return
+
+        for method in methods:
+            self.routes[(method, path)] = handler
+        self.known_paths.add(path)
 
     def start(self):
         """Start the web server."""
@@ -95,140 +210,116 @@ class WebServer:
                 # Read request
                 request = self._read_request(client)
                 if request:
-                    print(f"[HTTP] {request['method']} {request['path']}")
+                    print(f"[HTTP] {request.method} {request.path}")
                     # Parse and handle
                     response = self._process_request(request)
                     # Send response
                     self._send_response(client, response)
             finally:
                 client.close()
-                gc.collect()
+                mem_free = getattr(gc, 'mem_free', None)  # MicroPython only
+                if mem_free and mem_free() < GC_FREE_THRESHOLD:
+                    gc.collect()
+                    self._gc_due = None
+                else:
+                    self._gc_due = _ticks_ms()
 
         except OSError:
-            # No connection waiting (non-blocking)
-            pass
+            # No connection waiting (non-blocking); tidy up after the
+            # last request once things have been quiet for a moment
+            if (self._gc_due is not None and
+                    _ticks_diff(_ticks_ms(), self._gc_due) >= IDLE_GC_DELAY_MS):
+                gc.collect()
+                self._gc_due = None
         except Exception as e:
             print(f"Request error: {e}")
 
+    @micropython.native
     def _read_request(self, client):
         """Read and parse HTTP request."""
         try:
-            data = b''
-            # Read headers
-            while True:
-                chunk = client.recv(1024)
-                if not chunk:
-                    break
-                data += chunk
-                # Check for end of headers
-                if b'\r\n\r\n' in data:
-                    break
+            # MicroPython sockets are streams with a C-level readline();
+            # CPython needs a file wrapper for the same calls
+            stream = client if hasattr(client, 'readline') else client.makefile('rb')
 
-            if not data:
+            # Parse request line
+            parts = stream.readline().decode('utf-8').split(' ')
+            if len(parts) < 2:
                 return None
 
-            # Parse headers to get Content-Length
-            header_end = data.find(b'\r\n\r\n')
-            headers_raw = data[:header_end].decode('utf-8')
-            body_start = data[header_end + 4:]
+            method = parts[0].upper()
+            method = _METHODS.get(method, method)
+            full_path = parts[1]
 
-            # Check for Content-Length
-            content_length = 0
-            for line in headers_raw.split('\r\n'):
-                if line.lower().startswith('content-length:'):
-                    content_length = int(line.split(':')[1].strip())
-                    break
+            # Split path and query string
+            q = full_path.find('?')
+            if q >= 0:
+                path = full_path[:q]
+                query_string = full_path[q + 1:]
+            else:
+                path = full_path
+                query_string = ''
 
-            # Read remaining body if needed
-            while len(body_start) < content_length:
-                chunk = client.recv(1024)
-                if not chunk:
+            # Parse headers (the OTA routes read conditional-request headers)
+            headers = {}
+            while True:
+                line = stream.readline()
+                if not line or line == b'\r\n':
                     break
-                body_start += chunk
+                colon = line.find(b':')
+                if colon >= 0:
+                    name = line[:colon].decode('utf-8').strip().lower()
+                    headers[name] = line[colon + 1:].decode('utf-8').strip()
+
+            # Body stays raw bytes; JSON decoders accept bytes
+            body = b''
+            content_length = int(headers.get('content-length', 0))
+            if content_length > 0:
+                body = stream.read(min(content_length, RX_MAX_SIZE)) or b''
 
-            # Combine for parsing
-            full_data = headers_raw + '\r\n\r\n' + body_start.decode('utf-8')
-            return self._parse_request(full_data)
+            return Request(method, path, query_string, headers, body)
 
         except Exception as e:
             print(f"Read error: {e}")
             return None
 
-    def _parse_request(self, data):
-        """Parse HTTP request string."""
-        lines = data.split('\r\n')
-        if not lines:
-            return None
-
-        # Parse request line
-        parts = lines[0].split(' ')
-        if len(parts) < 2:
-            return None
-
-        method = parts[0].upper()
-        full_path = parts[1]
-
-        # Split path and query string
-        if '?' in full_path:
-            path, query_string = full_path.split('?', 1)
-        else:
-            path = full_path
-            query_string = ''
-
-        # Parse headers
-        headers = {}
-        body_start = 0
-        for i, line in enumerate(lines[1:], 1):
-            if line == '':
-                body_start = i + 1
-                break
-            if ':' in line:
-                key, value = line.split(':', 1)
-                headers[key.strip().lower()] = value.strip()
-
-        # Get body if present
-        body = '\r\n'.join(lines[body_start:]) if body_start < len(lines) else ''
-
-        return {
-            'method': method,
-            'path': path,
-            'query_string': query_string,
-            'headers': headers,
-            'body': body,
-        }
-
+    @micropython.native
     def _process_request(self, request):
         """Process request and generate response."""
-        path = request['path']
-        method = request['method']
-
-        # Find matching route
-        route_info = self.routes.get(path)
-
-        if not route_info:
-            # Check for API routes with wildcards
-            for route_path, info in self.routes.items():
-                if route_path.endswith('/*'):
-                    prefix = route_path[:-2]
-                    if path.startswith(prefix):
-                        route_info = info
-                        break
-
-        if not route_info:
-            return self._error_response(404, 'Not Found')
-
-        if method not in route_info['methods']:
-            return self._error_response(405, 'Method Not Allowed')
+        path = request.path
+        method = request.method
+
+        # Find matching route: one lookup for exact paths, wildcard
+        # prefixes only scanned on a miss
+        handler = self.routes.get((method, path))
+
+        if handler is None:
+            if path in self.known_paths:
+                return self._error_response(405, 'Method Not Allowed')
+
+            for prefix, methods, wildcard_handler in self.wildcards:
+                if path.startswith(prefix):
+                    if method not in methods:
+                        return self._error_response(405, 'Method Not Allowed')
+                    handler = wildcard_handler
+                    break
+            else:
+                return self._error_response(404, 'Not Found')
 
         try:
-            handler = route_info['handler']
             result = handler(request)
 
-            # Handler can return dict, string, or tuple
-            if isinstance(result, dict):
+            # Handler can return JsonBytes, dict, string, tuple, or list
+            # of HTML bytes chunks (rendered templates). Exact type
+            # checks first: a pointer compare, no MRO walk.
+            if type(result) is JsonBytes:
+                return ('200 OK', _HDR_JSON, result.body)
+            elif type(result) is dict:
                 return self._json_response(result)
             elif isinstance(result, tuple):
                 return result
+            elif isinstance(result, list):
+                return self._html_response(result)
             else:
                 return self._html_response(str(result))
 
@@ -236,57 +327,80 @@ class WebServer:
             print(f"Handler error: {e}")
             return self._error_response(500, f'Internal Error: {e}')
 
+    @micropython.native
     def _send_response(self, client, response):
         """Send HTTP response to client."""
         status, headers, body = response
 
-        # Encode body to bytes for accurate Content-Length
-        if isinstance(body, str):
-            body_bytes = body.encode('utf-8')
+        # Encode body to bytes for accurate Content-Length; a list body
+        # is pre-encoded chunks sent one after another
+        if isinstance(body, list):
+            chunks = body
+        elif isinstance(body, str):
+            chunks = [body.encode('utf-8')]
         else:
-            body_bytes = body
-
-        # Update Content-Length with actual byte length
-        headers['Content-Length'] = str(len(body_bytes))
-
-        # Build and send headers
-        status_line = f"HTTP/1.1 {status}\r\n"
-        header_lines = ''.join(f"{k}: {v}\r\n" for k, v in headers.items())
-        header_data = f"{status_line}{header_lines}\r\n"
-
+            chunks = [body]
+
+        body_len = 0
+        for chunk in chunks:
+            body_len += len(chunk)
+
+        # Status line and headers, then the body chunks, are gathered
+        # into the reused send buffer and sent a full segment at a time:
+        # scatter-gather without joining the page into one bytes object.
+        # Pieces larger than the buffer are sent as they are.
+        if status == '200 OK':
+            parts = [_STATUS_200]
+        else:
+            parts = [b'HTTP/1.1 ', status.encode('utf-8'), b'\r\n']
+        if isinstance(headers, bytes):
+            parts.append(headers)
+        else:
+            for name, value in headers.items():
+                if name != 'Content-Length':
+                    parts.append(name.encode('utf-8'))
+                    parts.append(b': ')
+                    parts.append(value.encode('utf-8'))
+                    parts.append(b'\r\n')
+        parts.append(b'Content-Length: %d\r\n\r\n' % body_len)
+        parts.extend(chunks)
+
+        buf = self._txbuf
+        view = self._txview
+        size = len(buf)
+        used = 0
         try:
-            # Use sendall to ensure complete transmission
-            client.sendall(header_data.encode('utf-8'))
-            client.sendall(body_bytes)
+            for piece in parts:
+                n = len(piece)
+                if used + n > size:
+                    if used:
+                        client.sendall(view[:used])
+                        used = 0
+                    if n > size:
+                        client.sendall(piece)
+                        continue
+                buf[used:used + n] = piece
+                used += n
+            if used:
+                client.sendall(view[:used])
         except Exception as e:
             print(f"Send error: {e}")
 
     def _html_response(self, html, status=200):
         """Create HTML response tuple."""
-        headers = {
-            'Content-Type': 'text/html; charset=utf-8',
-            'Connection': 'close',
-        }
-        return (f"{status} OK", headers, html)
+        return ('200 OK' if status == 200 else f"{status} OK", _HDR_HTML, html)
 
     def _json_response(self, data, status=200):
         """Create JSON response tuple."""
         body = json.dumps(data)
-        headers = {
-            'Content-Type': 'application/json',
-            'Connection': 'close',
-        }
-        status_text = 'OK' if status == 200 else 'Error'
-        return (f"{status} {status_text}", headers, body)
+        if status == 200:
+            return ('200 OK', _HDR_JSON, body)
+        return (f"{status} Error", _HDR_JSON, body)
 
     def _error_response(self, code, message):
         """Create error response tuple."""
         body = json.dumps({'error': message})
-        headers = {
-            'Content-Type': 'application/json',
-            'Connection': 'close',
-        }
-        return (f"{code} {message}", headers, body)
+        return (f"{code} {message}", _HDR_JSON, body)
 
 
 # Test when run directly (on desktop Python)
@@ -300,7 +414,7 @@ if __name__ == '__main__':
         return "<h1>Sports Ticker</h1><p>Web server working!</p>"
 
     def api_handler(request):
-        return {'status': 'ok', 'method': request['method']}
+        return {'status': 'ok', 'method': request.method}
 
     server.route('/', home_handler, ['GET'])
     server.route('/api/status', api_handler, ['GET', 'POST'])
@@ -0,0 +1,282 @@
+"""
+Page Sources for the Web Interface
+
+HTML skeleton, navigation bars and page content for web.templates.
+Only needed while the pages are compiled at import: web.templates
+unloads this module afterwards so these strings don't stay on the heap.
+Placeholders are %(name)s fields; the *_SCRIPT blocks have none and
+are appended to their page's content without interpolation.
+"""
+
+# Base HTML structure
+BASE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>%(title)s - Sports Ticker</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <link rel="stylesheet" href="/style.css?v=%(css_version)s">
+</head>
+<body>
+    <div class="container">
+        <h1>Sports Ticker</h1>
+        %(nav)s
+        %(content)s
+        <div class="footer">Sports Ticker v%(version)s</div>
+    </div>
+</body>
+</html>"""
+
+# Navigation bar per page, with that page's link marked active
+NAV_HOME = """<nav class="nav">
+            <a href="/" class="active">Home</a>
+            <a href="/teams">Teams</a>
+            <a href="/settings">Settings</a>
+        </nav>"""
+
+NAV_TEAMS = """<nav class="nav">
+            <a href="/">Home</a>
+            <a href="/teams" class="active">Teams</a>
+            <a href="/settings">Settings</a>
+        </nav>"""
+
+NAV_SETTINGS = """<nav class="nav">
+            <a href="/">Home</a>
+            <a href="/teams">Teams</a>
+            <a href="/settings" class="active">Settings</a>
+        </nav>"""
+
+# Home page content
+HOME_CONTENT = """
+<div class="card">
+    <h2>System Status</h2>
+    <div class="stat">
+        <span class="stat-label">Version</span>
+        <span class="stat-value">%(version)s</span>
+    </div>
+    <div class="stat">
+        <span class="stat-label">IP Address</span>
+        <span class="stat-value">%(ip)s</span>
+    </div>
+    <div class="stat">
+        <span class="stat-label">Teams Configured</span>
+        <span class="stat-value">%(teams_count)s</span>
+    </div>
+    <div class="stat">
+        <span class="stat-label">Active Games</span>
+        <span class="stat-value">%(games_count)s</span>
+    </div>
+</div>
+<div class="card">
+    <h2>Quick Actions</h2>
+    <button onclick="location.href='/teams'">Configure Teams</button>
+    <button onclick="location.href='/settings'">Settings</button>
+    <button onclick="checkUpdates()">Check Updates</button>
+</div>
+<div class="card">
+    <h2>Demo Mode</h2>
+    <p style="color:#888;font-size:0.9em;margin-bottom:15px;">Test display screens without waiting for real game data.</p>
+    <button onclick="showDemo('live')">Live Game</button>
+    <button onclick="showDemo('final')">Final Score</button>
+    <button onclick="showDemo('upcoming')">Upcoming</button>
+    <button class="danger" onclick="showDemo('reset')">Reset</button>
+</div>
+"""
+
+# Home page script; added after interpolation, so written as plain JS
+HOME_SCRIPT = """<script>
+function checkUpdates() {
+    fetch('/api/update/check')
+        .then(r => r.json())
+        .then(data => {
+            if (data.update_available) {
+                if (confirm('Update ' + data.latest_version + ' available!\\n\\n' + data.changelog + '\\n\\nInstall now?')) {
+                    fetch('/api/update/install', {method: 'POST'})
+                        .then(() => alert('Installing... Device will restart.'));
+                }
+            } else {
+                alert('You are on the latest version.');
+            }
+        })
+        .catch(e => alert('Error: ' + e));
+}
+
+function showDemo(mode) {
+    fetch('/api/demo/' + mode, {method: 'POST'})
+        .then(r => r.json())
+        .then(data => {
+            if (data.status === 'ok') {
+                // Brief confirmation
+                var msg = mode === 'reset' ? 'Display reset to live data' : 'Showing ' + mode + ' demo';
+                console.log(msg);
+            } else {
+                alert('Error: ' + data.message);
+            }
+        })
+        .catch(e => alert('Demo error: ' + e));
+}
+</script>
+"""
+
+# Teams page content
+TEAMS_CONTENT = """
+<div class="card">
+    <h2>Add Team</h2>
+    <form id="addTeamForm">
+        <select id="sport" name="sport">
+            <option value="nfl">NFL - Football</option>
+            <option value="nba">NBA - Basketball</option>
+            <option value="mlb">MLB - Baseball</option>
+            <option value="nhl">NHL - Hockey</option>
+        </select>
+        <input type="text" id="team_id" placeholder="Team ID (e.g., DET, GB, KC)" required>
+        <input type="text" id="team_name" placeholder="Team Name (optional)">
+        <button type="submit">Add Team</button>
+    </form>
+</div>
+<div class="card">
+    <h2>Your Teams</h2>
+    <div id="teamsList">Loading...</div>
+</div>
+"""
+
+# Teams page script; added after interpolation, so written as plain JS
+TEAMS_SCRIPT = """<script>
+function loadTeams() {
+    fetch('/api/teams')
+        .then(r => r.json())
+        .then(data => {
+            const list = document.getElementById('teamsList');
+            if (data.teams.length === 0) {
+                list.innerHTML = '<p>No teams configured. Add your favorite teams above!</p>';
+                return;
+            }
+            list.innerHTML = data.teams.map(t => `
+                <div class="team-item">
+                    <div class="team-info">
+                        <div class="team-sport">${t.sport.toUpperCase()}</div>
+                        <div class="team-name">${t.team_id} - ${t.team_name || 'Unknown'}</div>
+                    </div>
+                    <button class="danger" onclick="removeTeam('${t.sport}', '${t.team_id}')">Remove</button>
+                </div>
+            `).join('');
+        });
+}
+
+function removeTeam(sport, teamId) {
+    if (!confirm('Remove ' + teamId + '?')) return;
+    fetch('/api/teams', {
+        method: 'DELETE',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({sport: sport, team_id: teamId})
+    }).then(() => loadTeams());
+}
+
+document.getElementById('addTeamForm').onsubmit = function(e) {
+    e.preventDefault();
+    fetch('/api/teams', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({
+            sport: document.getElementById('sport').value,
+            team_id: document.getElementById('team_id').value,
+            team_name: document.getElementById('team_name').value
+        })
+    }).then(r => r.json()).then(data => {
+        if (data.status === 'ok') {
+            document.getElementById('team_id').value = '';
+            document.getElementById('team_name').value = '';
+            loadTeams();
+        } else {
+            alert(data.message);
+        }
+    });
+};
+
+loadTeams();
+</script>
+"""
+
+# Settings page content
+SETTINGS_CONTENT = """
+<div class="card">
+    <h2>Display Settings</h2>
+    <label>Brightness</label>
+    <div class="slider-container">
+        <input type="range" id="brightness" min="0" max="255" value="%(brightness)s" class="slider">
+        <span id="brightnessVal">%(brightness)s</span>
+    </div>
+    <label>Update Interval (seconds)</label>
+    <input type="number" id="update_interval" value="%(update_interval)s" min="30" max="600">
+    <button onclick="saveSettings()">Save Settings</button>
+</div>
+<div class="card">
+    <h2>API Settings</h2>
+    <label>Proxy URL</label>
+    <input type="text" id="proxy_url" value="%(proxy_url)s" placeholder="https://your-proxy.vercel.app">
+    <p style="color:#888;font-size:0.85em;margin-top:-5px;">Required for fetching scores. ESPN data is too large for Pico without a proxy.</p>
+    <button onclick="saveProxy()">Save Proxy URL</button>
+    <button onclick="testProxy()">Test Connection</button>
+</div>
+<div class="card">
+    <h2>System</h2>
+    <button onclick="location.reload()">Refresh Page</button>
+    <button class="danger" onclick="rollback()">Rollback Update</button>
+</div>
+"""
+
+# Settings page script; added after interpolation, so written as plain JS
+SETTINGS_SCRIPT = """<script>
+document.getElementById('brightness').oninput = function() {
+    document.getElementById('brightnessVal').textContent = this.value;
+};
+
+function saveSettings() {
+    fetch('/api/settings', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({
+            brightness: parseInt(document.getElementById('brightness').value),
+            update_interval: parseInt(document.getElementById('update_interval').value)
+        })
+    }).then(r => r.json()).then(data => {
+        alert(data.status === 'ok' ? 'Settings saved!' : 'Error: ' + data.message);
+    });
+}
+
+function saveProxy() {
+    fetch('/api/settings', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({
+            proxy_url: document.getElementById('proxy_url').value
+        })
+    }).then(r => r.json()).then(data => {
+        alert(data.status === 'ok' ? 'Proxy URL saved!' : 'Error: ' + data.message);
+    });
+}
+
+function testProxy() {
+    var url = document.getElementById('proxy_url').value;
+    if (!url) {
+        alert('Please enter a proxy URL first');
+        return;
+    }
+    fetch(url + '/api/health')
+        .then(r => r.json())
+        .then(data => {
+            if (data.status === 'ok') {
+                alert('Proxy connection successful!');
+            } else {
+                alert('Proxy responded but status not ok: ' + JSON.stringify(data));
+            }
+        })
+        .catch(e => alert('Connection failed: ' + e));
+}
+
+function rollback() {
+    if (!confirm('Rollback to previous version? Device will restart.')) return;
+    fetch('/api/update/rollback', {method: 'POST'})
+        .then(() => alert('Rolling back... Device will restart.'));
+}
+</script>
+"""
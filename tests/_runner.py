@@ -0,0 +1,86 @@
+"""
+Shared runner for test modules run directly
+
+Importing this puts src on sys.path, once; conftest.py does the same
+under pytest, and duplicate entries are re-searched on every import.
+
+Usage (in a test module):
+    if __name__ == '__main__':
+        import _runner
+
+    def run_tests():
+        from _runner import run_test_classes
+        return run_test_classes([TestFoo, TestBar])
+"""
+
+import os
+import sys
+import traceback
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+
+def run_test_classes(test_classes, setup=None, teardown=None,
+                     fresh_instance=False, error_chars=100):
+    """
+    Run each class's test_* methods and print results.
+
+    Args:
+        test_classes: Test classes, run in the order given
+        setup: Optional callable run before the first test
+        teardown: Optional callable run after the last test, even on error
+        fresh_instance: Build a new instance for every test method
+        error_chars: Characters of each failure to repeat in the summary
+            (None for all)
+
+    Returns:
+        True if every test passed
+    """
+    passed = 0
+    failed = 0
+    errors = []
+
+    if setup is not None:
+        setup()
+    try:
+        for test_class in test_classes:
+            print(f"\n{test_class.__name__}")
+            print("-" * 40)
+
+            # Discover from the class's own namespace, once per class; same
+            # alphabetical order dir() gave
+            test_methods = sorted(name for name, value in vars(test_class).items()
+                                  if name.startswith('test_') and callable(value))
+
+            instance = test_class()
+
+            for method_name in test_methods:
+                try:
+                    if fresh_instance:
+                        instance = test_class()
+                    getattr(instance, method_name)()
+                    print(f"  [PASS] {method_name}")
+                    passed += 1
+                except AssertionError as e:
+                    print(f"  [FAIL] {method_name}: {e}")
+                    failed += 1
+                    errors.append((method_name, str(e)))
+                except Exception as e:
+                    print(f"  [ERROR] {method_name}: {e}")
+                    failed += 1
+                    errors.append((method_name, traceback.format_exc()))
+    finally:
+        if teardown is not None:
+            teardown()
+
+    print("\n" + "=" * 40)
+    print(f"Results: {passed} passed, {failed} failed")
+
+    if errors:
+        print("\nFailures:")
+        for name, error in errors:
+            print(f"  - {name}: {error[:error_chars]}")
+
+    return failed == 0
@@ -0,0 +1,8 @@
+"""
+Pytest configuration.
+
+Puts src on sys.path once for the whole session, before any test module
+is imported, using the same setup test modules get when run directly.
+"""
+
+from . import _runner  # noqa: F401
@@ -2,7 +2,8 @@
 """
 Test Runner for Sports Ticker
 
-Runs all test suites and reports results.
+Runs all test suites and reports results. Each module runs in its own
+worker process, in parallel; output is printed in the listed order.
 
 Usage:
     python tests/run_all_tests.py
@@ -10,30 +11,39 @@ Usage:
 
 import sys
 import os
+import io
+import multiprocessing
 
-# Add project root to path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-sys.path.insert(0, os.path.join(project_root, 'src'))
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(tests_dir)
 
 
-def run_all_tests():
-    """Run all test modules."""
-    print("=" * 60)
-    print("Sports Ticker - Test Suite")
-    print("=" * 60)
+def _setup_path():
+    """Add project root and src to path (also run in each worker)."""
+    for path in (project_root, os.path.join(project_root, 'src')):
+        if path not in sys.path:
+            sys.path.insert(0, path)
 
-    results = {}
 
-    # Import and run each test module
-    test_modules = [
-        ('test_display', 'Display Module'),
-        ('test_api', 'API Module'),
-        ('test_config', 'Config Module'),
-        ('test_ota', 'OTA Module'),
-    ]
+_setup_path()
+
 
-    for module_name, description in test_modules:
+def _run_one(test_module):
+    """
+    Import and run one test module, capturing what it prints.
+
+    Args:
+        test_module: (module_name, description) tuple
+
+    Returns:
+        (module_name, result, output) with result one of 'PASS',
+        'FAIL', 'ERROR' or 'SKIP'
+    """
+    module_name, description = test_module
+    out = io.StringIO()
+    stdout = sys.stdout
+    sys.stdout = out
+    try:
         print(f"\n{'#' * 60}")
         print(f"# {description}")
         print(f"{'#' * 60}")
@@ -45,14 +55,44 @@ def run_all_tests():
             # Run tests
             if hasattr(module, 'run_tests'):
                 success = module.run_tests()
-                results[module_name] = 'PASS' if success else 'FAIL'
+                result = 'PASS' if success else 'FAIL'
             else:
                 print(f"  No run_tests() function in {module_name}")
-                results[module_name] = 'SKIP'
+                result = 'SKIP'
 
         except Exception as e:
             print(f"  Error running {module_name}: {e}")
-            results[module_name] = 'ERROR'
+            result = 'ERROR'
+    finally:
+        sys.stdout = stdout
+
+    return (module_name, result, out.getvalue())
+
+
+def run_all_tests():
+    """Run all test modules."""
+    print("=" * 60)
+    print("Sports Ticker - Test Suite")
+    print("=" * 60)
+
+    results = {}
+
+    # Import and run each test module
+    test_modules = [
+        ('test_display', 'Display Module'),
+        ('test_api', 'API Module'),
+        ('test_config', 'Config Module'),
+        ('test_ota', 'OTA Module'),
+    ]
+
+    # Modules are independent, so each gets a fresh worker process
+    with multiprocessing.Pool(min(4, len(test_modules)),
+                              initializer=_setup_path) as pool:
+        outputs = pool.map(_run_one, test_modules)
+
+    for module_name, result, output in outputs:
+        print(output, end='')
+        results[module_name] = result
 
     # Summary
     print("\n" + "=" * 60)
@@ -81,8 +121,8 @@ def run_all_tests():
 
 
 if __name__ == '__main__':
-    # Change to tests directory
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    # Change to tests directory; workers inherit it
+    os.chdir(tests_dir)
 
     success = run_all_tests()
     sys.exit(0 if success else 1)
@@ -8,11 +8,10 @@ Tests API functionality including:
 """
 
 import sys
-import os
 import json
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+if __name__ == '__main__':
+    import _runner  # Adds src to sys.path for direct runs
 
 from api.parser import ScoreParser
 from api.cache import Cache, ScorecardCache
@@ -270,52 +269,14 @@ class TestESPNClientMock:
 
 def run_tests():
     """Run all tests and print results."""
-    import traceback
+    from _runner import run_test_classes
 
-    test_classes = [
+    return run_test_classes([
         TestScoreParser,
         TestCache,
         TestScorecardCache,
         TestESPNClientMock,
-    ]
-
-    passed = 0
-    failed = 0
-    errors = []
-
-    for test_class in test_classes:
-        print(f"\n{test_class.__name__}")
-        print("-" * 40)
-
-        instance = test_class()
-
-        for method_name in dir(instance):
-            if not method_name.startswith('test_'):
-                continue
-
-            try:
-                method = getattr(instance, method_name)
-                method()
-                print(f"  [PASS] {method_name}")
-                passed += 1
-            except AssertionError as e:
-                print(f"  [FAIL] {method_name}: {e}")
-                failed += 1
-                errors.append((method_name, str(e)))
-            except Exception as e:
-                print(f"  [ERROR] {method_name}: {e}")
-                failed += 1
-                errors.append((method_name, traceback.format_exc()))
-
-    print("\n" + "=" * 40)
-    print(f"Results: {passed} passed, {failed} failed")
-
-    if errors:
-        print("\nFailures:")
-        for name, error in errors:
-            print(f"  - {name}: {error[:100]}")
-
-    return failed == 0
+    ])
 
 
 if __name__ == '__main__':
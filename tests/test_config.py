@@ -9,147 +9,274 @@ Tests configuration functionality including:
 """
 
 import sys
-import os
+import io
 import json
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+if __name__ == '__main__':
+    import _runner  # Adds src to sys.path for direct runs
 
+import utils.config as config_module
 from utils.config import ConfigManager, DEFAULTS
 
 
+class MemoryFS:
+    """In-memory stand-in for the open()/os calls utils.config makes."""
+
+    def __init__(self):
+        self.files = {}  # filename -> (text, mtime)
+        self._clock = 0
+
+    def open(self, filename, mode='r'):
+        if 'r' in mode:
+            if filename not in self.files:
+                raise OSError(2, 'No such file', filename)
+            return io.StringIO(self.files[filename][0])
+        return _MemoryFile(self, filename)
+
+    def write(self, filename, text):
+        # Every write gets a new mtime, as the config cache expects
+        self._clock += 1
+        self.files[filename] = (text, self._clock)
+
+    def stat(self, filename):
+        if filename not in self.files:
+            raise OSError(2, 'No such file', filename)
+        text, mtime = self.files[filename]
+        return (0o100644, 0, 0, 1, 0, 0, len(text), mtime, mtime, mtime)
+
+    def rename(self, src, dst):
+        self.files[dst] = self.files.pop(src)
+
+    def remove(self, filename):
+        del self.files[filename]
+
+    def exists(self, filename):
+        return filename in self.files
+
+
+class _MemoryFile(io.StringIO):
+    """Writable file whose contents are stored in a MemoryFS on close."""
+
+    def __init__(self, fs, filename):
+        super().__init__()
+        self._fs = fs
+        self._filename = filename
+
+    def close(self):
+        if not self.closed:
+            self._fs.write(self._filename, self.getvalue())
+        super().close()
+
+
+# Config tests read and write memory, not disk; only utils.config sees
+# it, and only while this module's tests run
+_FS = MemoryFS()
+_REAL_OS = config_module.os
+
+
+def setup_module(module=None):
+    """Point utils.config's open() and os at the in-memory filesystem."""
+    config_module.open = _FS.open
+    config_module.os = _FS
+
+
+def teardown_module(module=None):
+    """Restore the real filesystem calls and drop the in-memory files."""
+    del config_module.open  # Falls back to the builtin
+    config_module.os = _REAL_OS
+    config_module._CONFIG_CACHE.clear()
+    _FS.files.clear()
+
+
+def _purge_test_config():
+    """Drop any config file an earlier test saved, so each starts clean."""
+    _FS.files.pop('test_config.json', None)
+
+
 class TestConfigManager:
     """Tests for ConfigManager class."""
 
     def setup_test_config(self):
-        """Create a test config manager."""
+        """Create a test config manager with no saved file."""
+        _purge_test_config()
         return ConfigManager('test_config.json')
 
-    def cleanup(self):
-        """Clean up test files."""
-        try:
-            os.remove('test_config.json')
-        except:
-            pass
+    def reopen_test_config(self):
+        """Create another manager over the file the test has saved."""
+        return ConfigManager('test_config.json')
 
     def test_init(self):
         """Test config manager initialization."""
         config = self.setup_test_config()
         assert config is not None
         assert config.filename == 'test_config.json'
-        self.cleanup()
 
     def test_load_defaults(self):
         """Test loading defaults when file doesn't exist."""
         config = self.setup_test_config()
-        config.load()
         assert config.get('brightness') == DEFAULTS['brightness']
         assert config.get('update_interval') == DEFAULTS['update_interval']
-        self.cleanup()
 
     def test_save_and_load(self):
         """Test saving and loading config."""
         config = self.setup_test_config()
-        config.load()
         config.set('brightness', 200)
         config.save()
 
         # Load in new instance
-        config2 = self.setup_test_config()
-        config2.load()
+        config2 = self.reopen_test_config()
         assert config2.get('brightness') == 200
-        self.cleanup()
+
+    def test_load_cached(self):
+        """Test reloading an unchanged file reuses the parsed config."""
+        config = self.setup_test_config()
+        config.set('brightness', 90)
+        config.save()
+
+        config2 = self.reopen_test_config()
+        config2.get('teams').append({'sport': 'nfl', 'team_id': 'DET'})
+
+        # Cached copy is not affected by mutating a loaded config
+        config3 = self.reopen_test_config()
+        assert config3.get('brightness') == 90
+        assert config3.get('teams') == []
+
+        config.set('brightness', 91)
+        config.save()
+        config3.load(force=True)
+        assert config3.get('brightness') == 91
+
+    def test_load_once(self):
+        """Test the constructor loads once and lazy managers wait for load()."""
+        config = self.setup_test_config()
+        config.set('brightness', 90)
+        config.save()
+
+        lazy = ConfigManager('test_config.json', lazy=True)
+        assert lazy.get('brightness') is None
+        assert lazy.load()
+        assert lazy.get('brightness') == 90
+
+        lazy.set('brightness', 10)
+        assert lazy.load()  # Already loaded; unsaved change kept
+        assert lazy.get('brightness') == 10
+
+    def test_save_skips_clean(self):
+        """Test save does not rewrite the file without changes."""
+        config = self.setup_test_config()
+        config.save()
+        _FS.remove('test_config.json')
+
+        assert config.save()
+        assert not _FS.exists('test_config.json')
+
+        assert config.save(force=True)
+        assert _FS.exists('test_config.json')
+
+    def test_flush_if_needed_debounces(self):
+        """Test deferred saves are written at most once per interval."""
+        config = self.setup_test_config()  # Missing file leaves config dirty
+        assert config.flush_if_needed()  # First write is not delayed
+        assert not config.is_dirty
+
+        config.set('brightness', 90)
+        config.mark_dirty()
+        assert not config.flush_if_needed()  # Saved moments ago
+        assert config.is_dirty
+
+        config._last_save = None
+        assert config.flush_if_needed()
+        assert not config.is_dirty
+        assert not config.flush_if_needed()  # Nothing pending
 
     def test_get_default(self):
         """Test getting with default value."""
         config = self.setup_test_config()
-        config.load()
         assert config.get('nonexistent', 'default') == 'default'
-        self.cleanup()
 
     def test_set(self):
         """Test setting value."""
         config = self.setup_test_config()
-        config.load()
         config.set('brightness', 150)
         assert config.get('brightness') == 150
-        self.cleanup()
 
     def test_update(self):
         """Test updating multiple values."""
         config = self.setup_test_config()
-        config.load()
         config.update({
             'brightness': 100,
             'update_interval': 60
         })
         assert config.get('brightness') == 100
         assert config.get('update_interval') == 60
-        self.cleanup()
 
     def test_reset(self):
         """Test resetting to defaults."""
         config = self.setup_test_config()
-        config.load()
         config.set('brightness', 50)
         config.reset()
         assert config.get('brightness') == DEFAULTS['brightness']
-        self.cleanup()
 
     def test_reset_single_key(self):
         """Test resetting single key."""
         config = self.setup_test_config()
-        config.load()
         config.set('brightness', 50)
         config.set('update_interval', 30)
         config.reset('brightness')
         assert config.get('brightness') == DEFAULTS['brightness']
         assert config.get('update_interval') == 30
-        self.cleanup()
 
     def test_is_dirty(self):
         """Test dirty flag."""
         config = self.setup_test_config()
-        config.load()
         assert config.is_dirty  # Dirty after loading missing file
         config.save()
         assert not config.is_dirty
         config.set('brightness', 100)
         assert config.is_dirty
-        self.cleanup()
+
+    def test_set_same_list_is_dirty(self):
+        """Test re-setting a list edited in place marks config dirty."""
+        config = self.setup_test_config()
+        config.set('teams', [{'sport': 'nba', 'team_id': 'DET'}])
+        config.save()
+        teams = config.get('teams')
+        teams.append({'sport': 'nfl', 'team_id': 'DET'})
+        config.set('teams', teams)
+        assert config.is_dirty
 
     def test_to_dict(self):
         """Test converting to dictionary."""
         config = self.setup_test_config()
-        config.load()
         data = config.to_dict()
         assert isinstance(data, dict)
         assert 'brightness' in data
-        self.cleanup()
 
 
-class TestTeamManagement:
-    """Tests for team management functions."""
+class SharedConfig:
+    """Mixin giving a test class one loaded config, reset before each test."""
+
+    _config = None
 
     def setup_test_config(self):
-        """Create a test config manager."""
-        config = ConfigManager('test_config.json')
-        config.load()
-        return config
-
-    def cleanup(self):
-        """Clean up test files."""
-        try:
-            os.remove('test_config.json')
-        except:
-            pass
+        """Get the class's shared config manager, reset to defaults."""
+        cls = type(self)
+        if cls._config is None:
+            _purge_test_config()
+            cls._config = ConfigManager('test_config.json')
+        else:
+            cls._config.reset()
+        return cls._config
+
+
+class TestTeamManagement(SharedConfig):
+    """Tests for team management functions."""
 
     def test_get_teams_empty(self):
         """Test getting teams when none configured."""
         config = self.setup_test_config()
         teams = config.get_teams()
         assert teams == []
-        self.cleanup()
 
     def test_add_team(self):
         """Test adding a team."""
@@ -160,7 +287,6 @@ class TestTeamManagement:
         assert len(teams) == 1
         assert teams[0]['sport'] == 'nfl'
         assert teams[0]['team_id'] == 'DET'
-        self.cleanup()
 
     def test_add_team_duplicate(self):
         """Test adding duplicate team fails."""
@@ -170,7 +296,6 @@ class TestTeamManagement:
         assert result is False
         teams = config.get_teams()
         assert len(teams) == 1
-        self.cleanup()
 
     def test_add_team_different_sports(self):
         """Test adding same team ID for different sports."""
@@ -180,7 +305,6 @@ class TestTeamManagement:
         assert result is True
         teams = config.get_teams()
         assert len(teams) == 2
-        self.cleanup()
 
     def test_remove_team(self):
         """Test removing a team."""
@@ -190,14 +314,12 @@ class TestTeamManagement:
         assert result is True
         teams = config.get_teams()
         assert len(teams) == 0
-        self.cleanup()
 
     def test_remove_team_not_found(self):
         """Test removing non-existent team."""
         config = self.setup_test_config()
         result = config.remove_team('nfl', 'DET')
         assert result is False
-        self.cleanup()
 
     def test_get_team_ids(self):
         """Test getting team IDs."""
@@ -213,24 +335,29 @@ class TestTeamManagement:
         assert len(nfl_ids) == 2
         assert 'DET' in nfl_ids
         assert 'GB' in nfl_ids
-        self.cleanup()
 
+    def test_team_ids_after_outside_edits(self):
+        """Test edits to returned or passed-in lists don't stale the index."""
+        config = self.setup_test_config()
+        teams = [{'sport': 'nfl', 'team_id': 'DET'}]
+        config.set('teams', teams)
+        assert config.get_team_ids('nfl') == ['DET']
 
-class TestQuietHours:
-    """Tests for quiet hours functionality."""
+        teams.append({'sport': 'nfl', 'team_id': 'GB'})
+        config.get('teams').append({'sport': 'nfl', 'team_id': 'KC'})
+        assert config.get_team_ids('nfl') == ['DET']
 
-    def setup_test_config(self):
-        """Create a test config manager."""
-        config = ConfigManager('test_config.json')
-        config.load()
-        return config
-
-    def cleanup(self):
-        """Clean up test files."""
-        try:
-            os.remove('test_config.json')
-        except:
-            pass
+        teams = config.get('teams')
+        teams.append({'sport': 'nfl', 'team_id': 'GB'})
+        config.set('teams', teams)
+        assert config.get_team_ids('nfl') == ['DET', 'GB']
+
+        config.reset('teams')
+        assert config.get_team_ids('nfl') == []
+
+
+class TestQuietHours(SharedConfig):
+    """Tests for quiet hours functionality."""
 
     def test_quiet_hours_disabled(self):
         """Test quiet hours when disabled."""
@@ -238,7 +365,6 @@ class TestQuietHours:
         config.set('quiet_hours', {'enabled': False, 'start': 23, 'end': 7})
         assert not config.is_quiet_hours(2)  # 2 AM
         assert not config.is_quiet_hours(14)  # 2 PM
-        self.cleanup()
 
     def test_quiet_hours_overnight(self):
         """Test overnight quiet hours (23:00 - 07:00)."""
@@ -255,7 +381,6 @@ class TestQuietHours:
         assert not config.is_quiet_hours(7)
         assert not config.is_quiet_hours(12)
         assert not config.is_quiet_hours(22)
-        self.cleanup()
 
     def test_quiet_hours_daytime(self):
         """Test daytime quiet hours (09:00 - 17:00)."""
@@ -271,31 +396,25 @@ class TestQuietHours:
         assert not config.is_quiet_hours(8)
         assert not config.is_quiet_hours(17)
         assert not config.is_quiet_hours(22)
-        self.cleanup()
 
+    def test_quiet_hours_edited_in_place(self):
+        """Test quiet hours follow edits made to the dict without set()."""
+        config = self.setup_test_config()
+        config.set('quiet_hours', {'enabled': True, 'start': 9, 'end': 17})
+        assert config.is_quiet_hours(12)
+
+        config.get('quiet_hours')['enabled'] = False
+        assert not config.is_quiet_hours(12)
 
-class TestValidation:
-    """Tests for configuration validation."""
 
-    def setup_test_config(self):
-        """Create a test config manager."""
-        config = ConfigManager('test_config.json')
-        config.load()
-        return config
-
-    def cleanup(self):
-        """Clean up test files."""
-        try:
-            os.remove('test_config.json')
-        except:
-            pass
+class TestValidation(SharedConfig):
+    """Tests for configuration validation."""
 
     def test_validate_defaults(self):
         """Test validation with defaults passes."""
         config = self.setup_test_config()
         errors = config.validate()
         assert len(errors) == 0
-        self.cleanup()
 
     def test_validate_brightness_range(self):
         """Test brightness validation."""
@@ -304,7 +423,6 @@ class TestValidation:
         errors = config.validate()
         assert len(errors) > 0
         assert any('brightness' in e.lower() for e in errors)
-        self.cleanup()
 
     def test_validate_update_interval(self):
         """Test update interval validation."""
@@ -313,7 +431,6 @@ class TestValidation:
         errors = config.validate()
         assert len(errors) > 0
         assert any('interval' in e.lower() for e in errors)
-        self.cleanup()
 
     def test_validate_teams_structure(self):
         """Test teams structure validation."""
@@ -321,7 +438,6 @@ class TestValidation:
         config.set('teams', 'not a list')
         errors = config.validate()
         assert len(errors) > 0
-        self.cleanup()
 
     def test_validate_team_sport(self):
         """Test team sport validation."""
@@ -330,62 +446,26 @@ class TestValidation:
         errors = config.validate()
         assert len(errors) > 0
         assert any('sport' in e.lower() for e in errors)
-        self.cleanup()
+
+    def test_validate_codes(self):
+        """Test validation error codes."""
+        config = self.setup_test_config()
+        config.set('brightness', 300)
+        config.set('teams', [{'sport': 'invalid', 'team_id': 'ABC'}])
+        codes = [code for code, _ in config.validate_codes()]
+        assert codes == ['brightness_range', 'team_sport']
 
 
 def run_tests():
     """Run all tests and print results."""
-    import traceback
+    from _runner import run_test_classes
 
-    test_classes = [
+    return run_test_classes([
         TestConfigManager,
         TestTeamManagement,
         TestQuietHours,
         TestValidation,
-    ]
-
-    passed = 0
-    failed = 0
-    errors = []
-
-    for test_class in test_classes:
-        print(f"\n{test_class.__name__}")
-        print("-" * 40)
-
-        for method_name in dir(test_class):
-            if not method_name.startswith('test_'):
-                continue
-
-            try:
-                instance = test_class()
-                method = getattr(instance, method_name)
-                method()
-                print(f"  [PASS] {method_name}")
-                passed += 1
-            except AssertionError as e:
-                print(f"  [FAIL] {method_name}: {e}")
-                failed += 1
-                errors.append((method_name, str(e)))
-            except Exception as e:
-                print(f"  [ERROR] {method_name}: {e}")
-                failed += 1
-                errors.append((method_name, traceback.format_exc()))
-
-    # Cleanup
-    try:
-        os.remove('test_config.json')
-    except:
-        pass
-
-    print("\n" + "=" * 40)
-    print(f"Results: {passed} passed, {failed} failed")
-
-    if errors:
-        print("\nFailures:")
-        for name, error in errors:
-            print(f"  - {name}: {error[:100]}")
-
-    return failed == 0
+    ], setup=setup_module, teardown=teardown_module, fresh_instance=True)
 
 
 if __name__ == '__main__':
@@ -9,17 +9,47 @@ Tests display functionality including:
 """
 
 import sys
-import os
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+if __name__ == '__main__':
+    import _runner  # Adds src to sys.path for direct runs
 
 # Use simulator for testing (no hardware required)
 from display.simulator import DisplaySimulator
-from display.fonts import get_char_bitmap, get_text_width, get_font_height, FONT_5X7, FONT_6X8
+from display.renderer import Renderer
+from display.fonts import get_char_bitmap, get_char_mask, get_text_width, get_font_height, FONT_5X7, FONT_6X8
+
+
+_SHARED_SIM = None
+
+
+class SharedDisplay:
+    """Mixin giving tests one module-wide simulator, reset before each use."""
+
+    def get_display(self):
+        """Get the shared 64x64 simulator, cleared at full brightness."""
+        global _SHARED_SIM
+        if _SHARED_SIM is None:
+            _SHARED_SIM = DisplaySimulator(64, 64)
+        else:
+            _SHARED_SIM.set_brightness(255)
+            _SHARED_SIM.clear()
+        return _SHARED_SIM
+
+
+def _row_red(display, x, y, n):
+    """Red channel of n pixels along a row, as one framebuffer slice."""
+    start = (y * display.width + x) * 3
+    return bytes(display.framebuffer[start:start + n * 3:3])
+
 
+def _column_red(display, x, y, n):
+    """Red channel of n pixels down a column, as one strided slice."""
+    stride = display.width * 3
+    start = y * stride + x * 3
+    return bytes(display.framebuffer[start:start + n * stride:stride])
 
-class TestDisplaySimulator:
+
+class TestDisplaySimulator(SharedDisplay):
     """Tests for DisplaySimulator class."""
 
     def test_init(self):
@@ -32,7 +62,7 @@ class TestDisplaySimulator:
 
     def test_set_pixel_valid(self):
         """Test setting pixels within bounds."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
         display.set_pixel(10, 10, 255, 0, 0)
         r, g, b = display.get_pixel(10, 10)
         assert r == 255
@@ -41,7 +71,7 @@ class TestDisplaySimulator:
 
     def test_set_pixel_out_of_bounds(self):
         """Test that out-of-bounds pixels are ignored."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
         # These should not raise exceptions
         display.set_pixel(-1, 10, 255, 0, 0)
         display.set_pixel(10, -1, 255, 0, 0)
@@ -51,7 +81,7 @@ class TestDisplaySimulator:
 
     def test_clear(self):
         """Test clearing display."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
         display.set_pixel(10, 10, 255, 0, 0)
         display.clear()
         r, g, b = display.get_pixel(10, 10)
@@ -59,14 +89,24 @@ class TestDisplaySimulator:
 
     def test_clear_with_color(self):
         """Test clearing with specific color."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
         display.clear(0, 255, 0)  # Green
         r, g, b = display.get_pixel(0, 0)
         assert r == 0 and g == 255 and b == 0
 
+    def test_fill_rect_clipped(self):
+        """Test fill_rect clips to the display and applies brightness."""
+        display = self.get_display()
+        display.set_brightness(128)
+        display.fill_rect(60, -2, 10, 4, 255, 0, 0)
+        assert display.get_pixel(60, 0) == display.get_pixel(63, 1)
+        assert 126 <= display.get_pixel(63, 1)[0] <= 128
+        assert display.get_pixel(63, 2) == (0, 0, 0)
+        assert display.get_pixel(0, 1) == (0, 0, 0)
+
     def test_brightness(self):
         """Test brightness affects pixel values."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
         display.set_brightness(128)  # 50% brightness
         display.set_pixel(10, 10, 255, 255, 255)
         r, g, b = display.get_pixel(10, 10)
@@ -77,21 +117,38 @@ class TestDisplaySimulator:
 
     def test_brightness_clamp(self):
         """Test brightness is clamped to valid range."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
         display.set_brightness(-50)
         assert display.brightness == 0
         display.set_brightness(500)
         assert display.brightness == 255
 
+    def test_set_pixel_bytes(self):
+        """Test setting a pixel from a packed bytes color."""
+        display = self.get_display()
+        display.set_pixel_bytes(5, 5, bytes((10, 20, 30)))
+        assert display.get_pixel(5, 5) == (10, 20, 30)
+        display.set_pixel_bytes(64, 5, bytes((10, 20, 30)))  # Ignored
+
+        display.set_brightness(128)
+        display.set_pixel_bytes(6, 5, bytes((255, 0, 0)))
+        assert 126 <= display.get_pixel(6, 5)[0] <= 128
+
+    def test_blit_mask(self):
+        """Test blitting a glyph mask with clipping."""
+        display = self.get_display()
+        display.blit_mask(62, 0, ((0, 0), (1, 1), (2, 2)), 0, 255, 0)
+        assert display.get_pixel(62, 0) == (0, 255, 0)
+        assert display.get_pixel(63, 1) == (0, 255, 0)
+        assert display.get_pixel(0, 2) == (0, 0, 0)  # Clipped, no wrap
+
     def test_multiple_pixels(self):
         """Test setting multiple pixels."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
         for x in range(10):
             display.set_pixel(x, 0, x * 25, 0, 0)
 
-        for x in range(10):
-            r, g, b = display.get_pixel(x, 0)
-            assert r == x * 25
+        assert _row_red(display, 0, 0, 10) == bytes(x * 25 for x in range(10))
 
 
 class TestFonts:
@@ -122,6 +179,15 @@ class TestFonts:
         # Should return space or question mark
         assert bitmap is not None
 
+    def test_get_char_mask(self):
+        """Test glyph mask matches the row bitmap."""
+        mask = get_char_mask('I', FONT_5X7)
+        # 'I' is a 3-wide top/bottom bar with a 5-tall center stem
+        assert len(mask) == 11
+        assert (1, 0) in mask and (2, 3) in mask
+        assert (0, 3) not in mask
+        assert get_char_mask(' ', FONT_5X7) == ()
+
     def test_get_text_width(self):
         """Test text width calculation."""
         width = get_text_width('ABC', FONT_5X7)
@@ -139,32 +205,30 @@ class TestFonts:
         assert get_font_height(FONT_6X8) == 8
 
 
-class TestRendererHelpers:
+class TestRendererHelpers(SharedDisplay):
     """Tests for renderer helper functions."""
 
     def test_draw_horizontal_line(self):
         """Test drawing horizontal line."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
         for x in range(10, 20):
             display.set_pixel(x, 10, 255, 255, 255)
 
-        for x in range(10, 20):
-            r, g, b = display.get_pixel(x, 10)
-            assert r == 255
+        assert _row_red(display, 10, 10, 10) == b'\xff' * 10
+        assert display.get_pixel(20, 10) == (0, 0, 0)
 
     def test_draw_vertical_line(self):
         """Test drawing vertical line."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
         for y in range(10, 20):
             display.set_pixel(10, y, 255, 255, 255)
 
-        for y in range(10, 20):
-            r, g, b = display.get_pixel(10, y)
-            assert r == 255
+        assert _column_red(display, 10, 10, 10) == b'\xff' * 10
+        assert display.get_pixel(10, 20) == (0, 0, 0)
 
     def test_draw_rectangle(self):
         """Test drawing rectangle outline."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
 
         # Draw rectangle from (10,10) to (20,20)
         for x in range(10, 21):
@@ -174,23 +238,40 @@ class TestRendererHelpers:
             display.set_pixel(10, y, 255, 0, 0)  # Left
             display.set_pixel(20, y, 255, 0, 0)  # Right
 
-        # Check corners
-        r, g, b = display.get_pixel(10, 10)
-        assert r == 255
-        r, g, b = display.get_pixel(20, 20)
-        assert r == 255
+        # Check every edge pixel
+        edge = b'\xff' * 11
+        assert _row_red(display, 10, 10, 11) == edge
+        assert _row_red(display, 10, 20, 11) == edge
+        assert _column_red(display, 10, 10, 11) == edge
+        assert _column_red(display, 20, 10, 11) == edge
+
+        # Check interior is empty
+        for y in range(11, 20):
+            assert _row_red(display, 11, y, 9) == bytes(9)
+
+    def test_draw_game_template_reuse(self):
+        """Test cached game layout redraws identically."""
+        game_a = {'away_team': 'DET', 'home_team': 'GB', 'away_score': 24,
+                  'home_score': 17, 'status': 'live', 'period': 'Q2'}
+        game_b = {'away_team': 'KC', 'home_team': 'BUF', 'status': 'final'}
 
-        # Check center is empty
-        r, g, b = display.get_pixel(15, 15)
-        assert r == 0
+        fresh = DisplaySimulator(64, 64)
+        Renderer(fresh).draw_game(game_a)
+
+        display = DisplaySimulator(64, 64)
+        renderer = Renderer(display)
+        renderer.draw_game(game_a)
+        renderer.draw_game(game_b)
+        renderer.draw_game(game_a)  # Served from template
+        assert display.framebuffer == fresh.framebuffer
 
 
-class TestColorUtilities:
+class TestColorUtilities(SharedDisplay):
     """Tests for color-related functions."""
 
     def test_rgb_values(self):
         """Test RGB value handling."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
 
         # Test pure colors
         display.set_pixel(0, 0, 255, 0, 0)
@@ -203,7 +284,7 @@ class TestColorUtilities:
 
     def test_color_mix(self):
         """Test mixed colors."""
-        display = DisplaySimulator(64, 64)
+        display = self.get_display()
 
         # Yellow = Red + Green
         display.set_pixel(0, 0, 255, 255, 0)
@@ -216,52 +297,14 @@ class TestColorUtilities:
 
 def run_tests():
     """Run all tests and print results."""
-    import traceback
+    from _runner import run_test_classes
 
-    test_classes = [
+    return run_test_classes([
         TestDisplaySimulator,
         TestFonts,
         TestRendererHelpers,
         TestColorUtilities,
-    ]
-
-    passed = 0
-    failed = 0
-    errors = []
-
-    for test_class in test_classes:
-        print(f"\n{test_class.__name__}")
-        print("-" * 40)
-
-        instance = test_class()
-
-        for method_name in dir(instance):
-            if not method_name.startswith('test_'):
-                continue
-
-            try:
-                method = getattr(instance, method_name)
-                method()
-                print(f"  [PASS] {method_name}")
-                passed += 1
-            except AssertionError as e:
-                print(f"  [FAIL] {method_name}: {e}")
-                failed += 1
-                errors.append((method_name, str(e)))
-            except Exception as e:
-                print(f"  [ERROR] {method_name}: {e}")
-                failed += 1
-                errors.append((method_name, traceback.format_exc()))
-
-    print("\n" + "=" * 40)
-    print(f"Results: {passed} passed, {failed} failed")
-
-    if errors:
-        print("\nFailures:")
-        for name, error in errors:
-            print(f"  - {name}: {error}")
-
-    return failed == 0
+    ], error_chars=None)
 
 
 if __name__ == '__main__':
@@ -9,56 +9,137 @@ Tests OTA functionality including:
 
 import sys
 import os
+import io
 import json
+import time
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+if __name__ == '__main__':
+    import _runner  # Adds src to sys.path for direct runs
 
+import ota.updater
 from ota.updater import OTAUpdater
 
+# Scratch file prefix carrying the process id, so parallel test processes
+# (run_all_tests.py's worker pool, pytest-xdist) never share a path
+_SCRATCH = 'test_ota_%d_' % os.getpid()
+
+
+class FakeResponse:
+    """Stand-in for a urequests response streaming body from raw."""
+
+    def __init__(self, status_code=200, body=b'', headers=None,
+                 stream_cls=io.BytesIO):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.raw = stream_cls(body)
+        self._body = body
+
+    def json(self):
+        return json.loads(self._body)
+
+    def close(self):
+        pass
+
+
+class _NoSleepTime:
+    """The time module with sleep() a no-op, so retries don't wait."""
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    @staticmethod
+    def sleep(seconds):
+        pass
+
+
+class FakeRequests:
+    """
+    Stand-in for urequests, swapped into ota.updater inside a with block.
+
+    respond(url, headers) returns the FakeResponse for each get(); the
+    headers of every request are recorded in sent.
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.sent = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.sent.append(headers)
+        return self.respond(url, headers)
+
+    def __enter__(self):
+        self._saved = (getattr(ota.updater, 'urequests', None),
+                       ota.updater.REQUESTS_AVAILABLE, ota.updater.time)
+        ota.updater.urequests = self
+        ota.updater.REQUESTS_AVAILABLE = True
+        ota.updater.time = _NoSleepTime()
+        return self
+
+    def __exit__(self, *exc_info):
+        (ota.updater.urequests, ota.updater.REQUESTS_AVAILABLE,
+         ota.updater.time) = self._saved
+
 
 class TestVersionComparison:
     """Tests for version comparison logic."""
 
+    _updater = None
+
+    def get_updater(self):
+        """Get one updater shared by the class; comparisons keep no state."""
+        cls = type(self)
+        if cls._updater is None:
+            cls._updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        return cls._updater
+
     def test_version_greater_major(self):
         """Test major version comparison."""
-        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater = self.get_updater()
         assert updater._version_greater('2.0.0', '1.0.0')
         assert not updater._version_greater('1.0.0', '2.0.0')
 
     def test_version_greater_minor(self):
         """Test minor version comparison."""
-        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater = self.get_updater()
         assert updater._version_greater('1.1.0', '1.0.0')
         assert not updater._version_greater('1.0.0', '1.1.0')
 
     def test_version_greater_patch(self):
         """Test patch version comparison."""
-        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater = self.get_updater()
         assert updater._version_greater('1.0.1', '1.0.0')
         assert not updater._version_greater('1.0.0', '1.0.1')
 
     def test_version_equal(self):
         """Test equal versions."""
-        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater = self.get_updater()
         assert not updater._version_greater('1.0.0', '1.0.0')
 
     def test_version_complex(self):
         """Test complex version comparisons."""
-        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater = self.get_updater()
         assert updater._version_greater('1.2.3', '1.2.2')
         assert updater._version_greater('1.3.0', '1.2.9')
         assert updater._version_greater('2.0.0', '1.9.9')
 
     def test_version_short(self):
         """Test versions with fewer parts."""
-        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater = self.get_updater()
         assert updater._version_greater('1.1', '1.0')
         assert updater._version_greater('2', '1')
 
+    def test_version_after_current_changes(self):
+        """Test comparisons follow reassignment of the current version."""
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater.current_version = '1.0.0'
+        assert updater._version_greater('1.1.0', updater.current_version)
+        updater.current_version = '2.0.0'
+        assert not updater._version_greater('1.1.0', updater.current_version)
+
     def test_version_invalid(self):
         """Test invalid version strings."""
-        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater = self.get_updater()
         # Should return False for invalid versions
         assert not updater._version_greater('invalid', '1.0.0')
         assert not updater._version_greater('1.0.0', 'invalid')
@@ -126,6 +207,238 @@ class TestOTAUpdater:
         # Should not raise exception
         updater.mark_boot_successful()
 
+    def test_copy_file(self):
+        """Test file copy through a shared buffer larger than the file."""
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        data = bytes(range(256)) * 50
+        with open(_SCRATCH + 'copy_src.bin', 'wb') as f:
+            f.write(data)
+        try:
+            updater._copy_file(_SCRATCH + 'copy_src.bin', _SCRATCH + 'copy_dst.bin', bytearray(1000))
+            with open(_SCRATCH + 'copy_dst.bin', 'rb') as f:
+                assert f.read() == data
+        finally:
+            for path in (_SCRATCH + 'copy_src.bin', _SCRATCH + 'copy_dst.bin'):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def test_backup_directory(self):
+        """Test recursive backup copies files and subdirectories."""
+        import shutil
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        os.makedirs(_SCRATCH + 'backup_src/sub', exist_ok=True)
+        os.makedirs(_SCRATCH + 'backup_dst', exist_ok=True)
+        with open(_SCRATCH + 'backup_src/a.txt', 'w') as f:
+            f.write('a')
+        with open(_SCRATCH + 'backup_src/sub/b.txt', 'w') as f:
+            f.write('b')
+        try:
+            updater._backup_directory(_SCRATCH + 'backup_src', _SCRATCH + 'backup_dst')
+            with open(_SCRATCH + 'backup_dst/a.txt') as f:
+                assert f.read() == 'a'
+            with open(_SCRATCH + 'backup_dst/sub/b.txt') as f:
+                assert f.read() == 'b'
+        finally:
+            shutil.rmtree(_SCRATCH + 'backup_src', ignore_errors=True)
+            shutil.rmtree(_SCRATCH + 'backup_dst', ignore_errors=True)
+
+    def test_check_uses_conditional_get(self):
+        """Test a 304 reply reuses the cached version info."""
+        info = json.dumps({'version': '99.0.0'}).encode()
+
+        def respond(url, headers):
+            if headers and headers.get('If-None-Match') == '"v2"':
+                return FakeResponse(304)
+            return FakeResponse(200, info, {'ETag': '"v2"'})
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater.VERSION_CACHE_FILE = _SCRATCH + 'version_cache.json'
+        updater._etag = updater._last_modified = updater._cached_info = None
+        try:
+            with FakeRequests(respond) as requests:
+                assert updater.check_for_update(force=True)
+                assert updater.check_for_update(force=True)
+                assert requests.sent == [
+                    {'Accept-Encoding': 'gzip'},
+                    {'Accept-Encoding': 'gzip', 'If-None-Match': '"v2"'},
+                ]
+                assert updater.latest_version == '99.0.0'
+
+                # Recent check is answered without a request
+                assert updater.check_for_update()
+                assert len(requests.sent) == 2
+        finally:
+            try:
+                os.remove(_SCRATCH + 'version_cache.json')
+            except OSError:
+                pass
+
+    def test_check_decodes_gzip(self):
+        """Test a gzip-encoded version.json is decoded while streaming."""
+        import gzip
+
+        body = gzip.compress(json.dumps({'version': '99.1.0'}).encode())
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater.VERSION_CACHE_FILE = _SCRATCH + 'version_cache.json'
+        try:
+            with FakeRequests(lambda url, headers: FakeResponse(
+                    200, body, {'Content-Encoding': 'gzip'})):
+                assert updater.check_for_update(force=True)
+                assert updater.latest_version == '99.1.0'
+        finally:
+            try:
+                os.remove(_SCRATCH + 'version_cache.json')
+            except OSError:
+                pass
+
+    def test_download_streams_and_verifies(self):
+        """Test download streams to disk and checks the hash inline."""
+        import hashlib
+
+        payload = b'x' * 2500
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater.UPDATE_DIR = _SCRATCH + 'update'
+        updater.DOWNLOAD_PATH = _SCRATCH + 'update/update.tar.gz'
+        progress = []
+        try:
+            with FakeRequests(lambda url, headers: FakeResponse(
+                    200, payload, {'Content-Length': str(len(payload))})):
+                updater.update_info = {
+                    'download_url': 'http://example.com/update.tar.gz',
+                    'checksum': 'sha256:' + hashlib.sha256(payload).hexdigest()
+                }
+                path = updater.download_update(lambda done, total: progress.append((done, total)))
+                assert path is not None
+                with open(path, 'rb') as f:
+                    assert f.read() == payload
+                assert progress[-1] == (2500, 2500)
+                assert len(progress) == 3  # One call per 1 KiB chunk
+                os.remove(path)
+
+                updater.MAX_DOWNLOAD_RETRIES = 1
+                updater.update_info['checksum'] = 'sha256:' + '0' * 64
+                assert updater.download_update() is None
+                assert not os.path.exists(path)  # Bad download removed
+        finally:
+            try:
+                os.rmdir(_SCRATCH + 'update')
+            except OSError:
+                pass
+
+    def test_chunk_writer(self):
+        """Test chunks are written and hashed in order, then flushed on close."""
+        import hashlib
+        from ota.updater import _ChunkWriter
+
+        chunks = [bytes([i]) * 100 for i in range(50)]
+        f = io.BytesIO()
+        sha = hashlib.sha256()
+        writer = _ChunkWriter(f, sha)
+        for chunk in chunks:
+            writer.write(chunk)
+        writer.close()
+
+        assert f.getvalue() == b''.join(chunks)
+        assert sha.hexdigest() == hashlib.sha256(b''.join(chunks)).hexdigest()
+
+    def test_download_verifies_blocks(self):
+        """Test per-block hashes catch a bad block before the rest arrives."""
+        import hashlib
+
+        payload = bytes(range(256)) * 10
+        streams = []
+
+        def respond(url, headers):
+            response = FakeResponse(200, payload)
+            streams.append(response.raw)
+            return response
+
+        block_hashes = [hashlib.sha256(payload[i:i + 1000]).hexdigest()
+                        for i in range(0, len(payload), 1000)]
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater.UPDATE_DIR = _SCRATCH + 'update'
+        updater.DOWNLOAD_PATH = _SCRATCH + 'update/update.tar.gz'
+        updater.MAX_DOWNLOAD_RETRIES = 1
+        try:
+            with FakeRequests(respond):
+                updater.update_info = {
+                    'download_url': 'http://example.com/update.tar.gz',
+                    'block_size': 1000,
+                    'block_hashes': block_hashes
+                }
+                path = updater.download_update()
+                with open(path, 'rb') as f:
+                    assert f.read() == payload
+
+                block_hashes[0] = '0' * 64
+                assert updater.download_update() is None
+                assert streams[-1].tell() == 1000  # Stopped after the bad block
+                assert not os.path.exists(path)
+        finally:
+            try:
+                os.rmdir(_SCRATCH + 'update')
+            except OSError:
+                pass
+
+    def test_download_resumes_with_range(self):
+        """Test a dropped download resumes from the bytes already saved."""
+        import hashlib
+
+        payload = bytes(range(256)) * 10
+
+        class DroppedStream(io.BytesIO):
+            def read(self, size=-1):
+                if self.tell() >= 1024:
+                    raise OSError('connection reset')
+                return super().read(size)
+
+        class TruncatedStream(io.BytesIO):
+            def read(self, size=-1):
+                if self.tell() >= 1024:
+                    return b''  # Ends early without raising
+                return super().read(size)
+
+        def respond(url, headers):
+            if not headers:
+                return FakeResponse(200, payload,
+                                    {'Content-Length': str(len(payload))},
+                                    first_stream)
+            start = int(headers['Range'][6:-1])
+            body = payload[start:]
+            return FakeResponse(206, body, {'Content-Length': str(len(body))})
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater.UPDATE_DIR = _SCRATCH + 'update'
+        updater.DOWNLOAD_PATH = _SCRATCH + 'update/update.tar.gz'
+        try:
+            # Dropped with an error, then cut short silently; without a
+            # checksum a short file must still never be returned
+            for first_stream, checksum in (
+                    (DroppedStream, hashlib.sha256(payload).hexdigest()),
+                    (TruncatedStream, '')):
+                with FakeRequests(respond) as requests:
+                    updater.update_info = {
+                        'download_url': 'http://example.com/update.tar.gz',
+                        'checksum': checksum
+                    }
+                    path = updater.download_update()
+                    assert path is not None
+                    assert requests.sent == [None, {'Range': 'bytes=1024-'}]
+                    with open(path, 'rb') as f:
+                        assert f.read() == payload
+                    os.remove(path)
+        finally:
+            try:
+                os.rmdir(_SCRATCH + 'update')
+            except OSError:
+                pass
+
 
 class TestUpdateRoutes:
     """Tests for OTA web routes."""
@@ -140,6 +453,181 @@ class TestUpdateRoutes:
         assert routes.updater is updater
         assert routes.update_in_progress is False
 
+    def test_install_rejects_concurrent(self):
+        """Test a second install is refused while one is running."""
+        from ota.routes import UpdateRoutes, _ERR_IN_PROGRESS, _ERR_NO_UPDATE
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        routes = UpdateRoutes(updater)
+        replies = []
+        updater.update_info = {'version': '9.9.9'}
+        routes._full_update_flow = lambda: replies.append(
+            routes.handle_install_update({})) or False
+
+        routes.handle_install_update({})
+        assert replies == [_ERR_IN_PROGRESS]
+
+        # Lock is released after a failed install
+        updater.update_info = None
+        assert routes.handle_install_update({}) is _ERR_NO_UPDATE
+
+    def test_update_status_cached(self):
+        """Test status response is reused until the status changes."""
+        from ota.routes import UpdateRoutes
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        routes = UpdateRoutes(updater)
+
+        first = routes.handle_update_status({})
+        assert routes.handle_update_status({}) is first
+
+        updater.latest_version = '9.9.9'
+        second = routes.handle_update_status({})
+        assert second is not first
+        assert json.loads(second[2])['latest_version'] == '9.9.9'
+
+    def test_update_page_gzip(self):
+        """Test update page is served compressed only when accepted."""
+        import gzip
+        from ota.routes import UpdateRoutes, UPDATE_PAGE_HTML
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        routes = UpdateRoutes(updater)
+        status, headers, body = routes.handle_update_page(
+            {'headers': {'accept-encoding': 'gzip, deflate'}})
+        assert status == '200 OK'
+        assert b'Content-Encoding: gzip\r\n' in headers
+        assert gzip.decompress(body).decode('utf-8') == UPDATE_PAGE_HTML
+
+        status, headers, body = routes.handle_update_page({'headers': {}})
+        assert b'Content-Encoding' not in headers
+        assert body == UPDATE_PAGE_HTML.encode('utf-8')
+
+    def test_update_page_sent_by_server(self):
+        """Test the update page response goes out as a valid HTTP reply."""
+        from ota.routes import UpdateRoutes, UPDATE_PAGE_HTML
+        from web.server import WebServer
+
+        class FakeClient:
+            def __init__(self):
+                self.data = b''
+
+            def sendall(self, data):
+                self.data += bytes(data)
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        client = FakeClient()
+        WebServer()._send_response(
+            client, UpdateRoutes(updater).handle_update_page({'headers': {}}))
+
+        head, body = client.data.split(b'\r\n\r\n', 1)
+        lines = head.split(b'\r\n')
+        assert lines[0] == b'HTTP/1.1 200 OK'
+        assert b'Content-Type: text/html; charset=utf-8' in lines
+        assert b'Content-Length: %d' % len(body) in lines
+        assert body == UPDATE_PAGE_HTML.encode('utf-8')
+
+    def test_update_history_passthrough(self):
+        """Test history splices raw log lines newest first."""
+        import ota.routes
+        from ota.routes import UpdateRoutes
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        lines = [b'{"timestamp": 1}', b'{"timestamp": 2}', b'{"timest']
+        original = ota.routes._tail_lines
+        ota.routes._tail_lines = lambda path, n=20: lines
+        try:
+            status, headers, body = UpdateRoutes(updater).handle_update_history({})
+        finally:
+            ota.routes._tail_lines = original
+
+        history = json.loads(body)['history']
+        assert [e['timestamp'] for e in history] == [2, 1]  # Torn line dropped
+
+    def test_history_records(self):
+        """Test binary history records round-trip newest first."""
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater.HISTORY_FILE = _SCRATCH + 'history.bin'
+        updater.HISTORY_ERROR_FILE = _SCRATCH + 'history.err'
+        try:
+            updater.current_version = '1.0.0'
+            updater.latest_version = '1.1.0'
+            updater._log_update('failed', 'Checksum mismatch')
+            updater._log_update('success')
+
+            history = updater.read_history(20)
+            assert [e['status'] for e in history] == ['success', 'failed']
+            assert history[0]['error'] is None
+            assert history[1]['error'] == 'Checksum mismatch'
+            assert history[1]['from_version'] == '1.0.0'
+            assert history[1]['to_version'] == '1.1.0'
+            assert len(updater.read_history(1)) == 1
+        finally:
+            for path in (updater.HISTORY_FILE, updater.HISTORY_ERROR_FILE):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def test_overview(self):
+        """Test overview combines status and check results."""
+        from ota.routes import UpdateRoutes
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        routes = UpdateRoutes(updater)
+        routes._check_for_update = lambda force=False: False
+
+        status, headers, body = routes.handle_overview({})
+        data = json.loads(body)
+        assert data['status']['update_in_progress'] is False
+        assert data['check']['update_available'] is False
+        assert data['check']['current_version'] == updater.current_version
+
+    def test_check_update_etag(self):
+        """Test check endpoint answers 304 for a matching ETag."""
+        from ota.routes import UpdateRoutes
+
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        routes = UpdateRoutes(updater)
+
+        forced = []
+        routes._check_for_update = lambda force=False: forced.append(force) or False
+
+        status, headers, body = routes.handle_check_update({'headers': {}})
+        assert status == '200 OK'
+        assert json.loads(body)['update_available'] is False
+
+        etag = headers['ETag']
+        status, headers, body = routes.handle_check_update(
+            {'headers': {'if-none-match': etag}})
+        assert status == '304 Not Modified' and body == b''
+        assert forced == [True, False]  # Revalidation uses the recent check
+
+        # Tag depends only on versions and manifest, not the process
+        updater.update_info = {'checksum': 'sha256:ab'}
+        assert routes.handle_check_update({'headers': {}})[1]['ETag'] == \
+            'W/"%s-None-sha256:ab"' % updater.current_version
+
+    def test_tail_lines(self):
+        """Test reading the newest log lines from the end of a file."""
+        from ota.routes import _tail_lines
+
+        test_file = _SCRATCH + 'tail.log'
+        try:
+            with open(test_file, 'w') as f:
+                for i in range(100):
+                    f.write(json.dumps({'timestamp': i}) + '\n')
+
+            lines = _tail_lines(test_file, 5, block=16)
+            assert [json.loads(line)['timestamp'] for line in lines] == [95, 96, 97, 98, 99]
+            assert len(_tail_lines(test_file, 500)) == 100
+
+        finally:
+            try:
+                os.remove(test_file)
+            except OSError:
+                pass
+
     def test_update_page_html(self):
         """Test update page HTML template exists."""
         from ota.routes import UPDATE_PAGE_HTML
@@ -167,80 +655,55 @@ class TestVersionFile:
         assert 'installed' in version_data
 
     def test_save_version(self):
-        """Test saving version file."""
-        test_file = 'test_version.json'
+        """Test the updater writes and reads back its version file."""
+        updater = OTAUpdater("http://example.com/version.json", auto_check=False)
+        updater.VERSION_FILE = _SCRATCH + 'version.json'
 
         try:
-            version_data = {
-                'version': '1.2.3',
-                'installed': 1234567890,
-                'build': 'test',
-            }
-
-            with open(test_file, 'w') as f:
-                json.dump(version_data, f)
+            updater._save_version('1.2.3')
 
-            # Verify file was created
-            with open(test_file, 'r') as f:
+            with open(updater.VERSION_FILE, 'r') as f:
                 loaded = json.load(f)
-
             assert loaded['version'] == '1.2.3'
+            assert loaded['build'] == 'prod'
+            assert isinstance(loaded['installed'], int)
+            assert not os.path.exists(updater.VERSION_FILE + '.tmp')
+
+            assert updater._load_current_version() == '1.2.3'
 
         finally:
             try:
-                os.remove(test_file)
-            except:
+                os.remove(updater.VERSION_FILE)
+            except OSError:
                 pass
 
+    def test_json_written_in_one_call(self):
+        """Test JSON files are serialized first and written once."""
+        from ota.updater import _dump
+
+        class CountingFile(io.StringIO):
+            writes = 0
+
+            def write(self, data):
+                CountingFile.writes += 1
+                return super().write(data)
+
+        f = CountingFile()
+        _dump({'version': '1.2.3', 'installed': 1234567890, 'build': 'test'}, f)
+        assert CountingFile.writes == 1
+        assert json.loads(f.getvalue())['version'] == '1.2.3'
+
 
 def run_tests():
     """Run all tests and print results."""
-    import traceback
+    from _runner import run_test_classes
 
-    test_classes = [
+    return run_test_classes([
         TestVersionComparison,
         TestOTAUpdater,
         TestUpdateRoutes,
         TestVersionFile,
-    ]
-
-    passed = 0
-    failed = 0
-    errors = []
-
-    for test_class in test_classes:
-        print(f"\n{test_class.__name__}")
-        print("-" * 40)
-
-        instance = test_class()
-
-        for method_name in dir(instance):
-            if not method_name.startswith('test_'):
-                continue
-
-            try:
-                method = getattr(instance, method_name)
-                method()
-                print(f"  [PASS] {method_name}")
-                passed += 1
-            except AssertionError as e:
-                print(f"  [FAIL] {method_name}: {e}")
-                failed += 1
-                errors.append((method_name, str(e)))
-            except Exception as e:
-                print(f"  [ERROR] {method_name}: {e}")
-                failed += 1
-                errors.append((method_name, traceback.format_exc()))
-
-    print("\n" + "=" * 40)
-    print(f"Results: {passed} passed, {failed} failed")
-
-    if errors:
-        print("\nFailures:")
-        for name, error in errors:
-            print(f"  - {name}: {error[:100]}")
-
-    return failed == 0
+    ])
 
 
 if __name__ == '__main__':